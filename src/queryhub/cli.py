@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Coroutine, Optional, TypeVar
 
 import typer
 import yaml
@@ -18,6 +18,22 @@ _LOGGER = logging.getLogger(__name__)
 
 app = typer.Typer(add_completion=False, help="QueryHub automation CLI")
 
+T = TypeVar("T")
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on uvloop when it is installed, else on the default asyncio loop.
+
+    Providers create their sessions and engines lazily inside the running
+    loop, so they bind to whichever loop is used here.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
 
 def find_metadata_file(folder: Path) -> Path:
     """Find metadata file with .yaml or .yml extension.
@@ -51,6 +67,12 @@ def run_report(
         None, help="Optional path to write the rendered HTML"
     ),
     email: bool = typer.Option(True, help="Send the rendered report via SMTP"),
+    template_cache_dir: Optional[Path] = typer.Option(
+        None,
+        envvar="QUERYHUB_TEMPLATE_CACHE_DIR",
+        help="Directory for compiled template bytecode, reused by later runs",
+        file_okay=False,
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
 ) -> None:
     """Execute a report from a folder and optionally send it via email.
@@ -65,7 +87,9 @@ def run_report(
     _LOGGER.info("Starting QueryHub report execution from folder: %s", report_folder)
 
     try:
-        result = asyncio.run(_run_report_folder(report_folder, output_html, email))
+        result = run_async(
+            _run_report_folder(report_folder, output_html, email, template_cache_dir)
+        )
         if result.has_failures:
             _LOGGER.warning("Report execution completed with failures")
             raise typer.Exit(code=1)
@@ -80,6 +104,7 @@ async def _run_report_folder(
     report_folder: Path,
     output_html: Optional[Path],
     email: bool,
+    template_cache_dir: Optional[Path] = None,
 ) -> ReportExecutionResult:
     """Execute report from folder with proper resource management."""
     from .config.loader import ConfigLoader
@@ -139,6 +164,7 @@ async def _run_report_folder(
         config_dir=config_root,
         templates_dir=templates_dir,
         auto_reload_templates=False,
+        template_cache_dir=template_cache_dir,
     )
     _LOGGER.debug("Creating report executor")
     executor = await builder.create_executor()
@@ -189,7 +215,7 @@ def list_reports(
     config_dir: Path = typer.Argument(Path("config"), exists=True, file_okay=False, help="Configuration directory containing reports/"),
 ) -> None:
     """List available report definitions."""
-    asyncio.run(_list_reports(config_dir))
+    run_async(_list_reports(config_dir))
 
 
 async def _list_reports(config_dir: Path) -> None:
@@ -13,7 +13,7 @@ providers:
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -27,6 +27,9 @@ class ADXResourceConfig(BaseModel):
     client_request_id_prefix: Optional[str] = None
     default_timeout_seconds: Optional[float] = Field(default=30.0, gt=0)
     retry_attempts: Optional[int] = Field(default=3, ge=0)
+    batch_queries: bool = False
+    batch_max_size: int = Field(default=16, ge=1)
+    batch_window_ms: float = Field(default=5.0, ge=0)
     model_config = ConfigDict(extra="allow")
 
 
@@ -39,6 +42,8 @@ class SQLResourceConfig(BaseModel):
     port: Optional[int] = None
     database: Optional[str] = None
     options: Dict[str, Any] = Field(default_factory=dict)
+    share_connection: bool = False
+    raw_driver: Optional[Literal["asyncpg"]] = None
     default_timeout_seconds: Optional[float] = Field(default=30.0, gt=0)
     retry_attempts: Optional[int] = Field(default=3, ge=0)
     model_config = ConfigDict(extra="allow")
@@ -50,6 +55,9 @@ class RESTResourceConfig(BaseModel):
     base_url: str
     default_headers: Dict[str, str] = Field(default_factory=dict)
     request_options: Dict[str, Any] = Field(default_factory=dict)
+    metadata_headers: Optional[list[str]] = None
+    pool_limit: int = Field(default=100, ge=0)
+    pool_limit_per_host: int = Field(default=32, ge=0)
     default_timeout_seconds: Optional[float] = Field(default=30.0, gt=0)
     retry_attempts: Optional[int] = Field(default=3, ge=0)
     model_config = ConfigDict(extra="allow")
@@ -110,6 +118,8 @@ class ProviderConfig(BaseModel):
     resource: ResourceConfig
     credentials: Optional[str] = None  # Credential ID reference
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    # Report components querying this provider at the same time
+    max_concurrency: int = Field(default=8, ge=1)
     model_config = ConfigDict(extra="allow")
 
     @property
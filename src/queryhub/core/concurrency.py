@@ -0,0 +1,54 @@
+"""Async concurrency helpers shared by providers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class OnceAsync(Generic[T]):
+    """Run an async factory at most once and share its result with every caller.
+
+    Once a value exists, ``call`` is a single flag check. Concurrent callers
+    during creation await the same shielded future, so a caller timing out
+    does not cancel creation for the others. A failed attempt is forgotten so
+    the next call retries; ``reset`` forgets a successful one.
+    """
+
+    __slots__ = ("_done", "_value", "_future")
+
+    def __init__(self) -> None:
+        self._done = False
+        self._value: Optional[T] = None
+        self._future: Optional[asyncio.Future[T]] = None
+
+    @property
+    def done(self) -> bool:
+        """Check if a value has been created."""
+        return self._done
+
+    async def call(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Return the shared value, creating it with ``factory`` on first use."""
+        if self._done:
+            return self._value  # type: ignore[return-value]
+        future = self._future
+        if future is None:
+            future = self._future = asyncio.ensure_future(factory())
+        try:
+            value = await asyncio.shield(future)
+        except Exception:
+            if self._future is future and future.done():
+                self._future = None
+            raise
+        if self._future is future:
+            self._value = value
+            self._done = True
+        return value
+
+    def reset(self) -> None:
+        """Forget the current value so the next call creates a new one."""
+        self._done = False
+        self._value = None
+        self._future = None
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Mapping
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping
 
 from ..core.errors import ProviderNotFoundError
 from ..providers.base_query_provider import BaseQueryProvider
-from ..providers.provider_factory import create_provider
+from ..providers.provider_factory import get_provider_class
 from .contracts import ProviderFactoryProtocol
 from .credentials import CredentialRegistry
 
@@ -18,6 +19,10 @@ class DefaultProviderFactory(ProviderFactoryProtocol):
 
     provider_configs: Mapping[str, Any]  # Type-specific provider configs
     credential_registry: CredentialRegistry
+    # provider_id -> constructor bound to its config, resolved on first create
+    _constructors: dict[str, Callable[[], BaseQueryProvider]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def create(self, provider_id: str) -> BaseQueryProvider:
         """Create a provider instance by ID.
@@ -31,9 +36,12 @@ class DefaultProviderFactory(ProviderFactoryProtocol):
         Raises:
             ProviderNotFoundError: If provider ID not found
         """
-        config = self.provider_configs.get(provider_id)
-        if config is None:
-            raise ProviderNotFoundError(f"Provider '{provider_id}' is not defined")
-
-        # Use the new factory function that handles dependency injection
-        return create_provider(config, self.credential_registry)
+        constructor = self._constructors.get(provider_id)
+        if constructor is None:
+            config = self.provider_configs.get(provider_id)
+            if config is None:
+                raise ProviderNotFoundError(f"Provider '{provider_id}' is not defined")
+            constructor = self._constructors[provider_id] = functools.partial(
+                get_provider_class(config.type), config, self.credential_registry
+            )
+        return constructor()
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
 import logging
+import re
 from email.message import EmailMessage
 from email.utils import getaddresses
 from typing import Sequence
@@ -16,6 +20,9 @@ from ..services import ReportExecutionResult
 
 _LOGGER = logging.getLogger(__name__)
 
+# Inline images produced by ChartRenderer in email mode
+_DATA_URI_IMAGE = re.compile(r'src="data:image/(png|jpeg|gif);base64,([A-Za-z0-9+/=]+)"')
+
 
 class RecipientResolver:
     """Resolve email recipients from configuration (SRP)."""
@@ -152,11 +159,44 @@ class MessageBuilder:
 
         plain_text = self._build_plain_text(result)
         message.set_content(plain_text)
-        message.add_alternative(result.html, subtype="html")
+        html, images = self._extract_inline_images(result.html)
+        message.add_alternative(html, subtype="html")
+        if images:
+            html_part = message.get_body(preferencelist=("html",))
+            assert html_part is not None
+            for cid, (subtype, data) in images.items():
+                html_part.add_related(data, maintype="image", subtype=subtype, cid=f"<{cid}>")
+            _LOGGER.debug("Attached %d inline image(s) to email", len(images))
         
         _LOGGER.debug("Email message built successfully (HTML size: %d bytes)", len(result.html))
         return message
 
+    @staticmethod
+    def _extract_inline_images(html: str) -> tuple[str, dict[str, tuple[str, bytes]]]:
+        """Replace base64 data-URI images with ``cid:`` references.
+
+        Many mail clients block data URIs, so each image becomes a related MIME
+        part instead. Parts are content-addressed, so identical charts in one
+        report are attached once.
+
+        Returns:
+            The rewritten HTML and a mapping of content ID -> (subtype, bytes)
+        """
+        images: dict[str, tuple[str, bytes]] = {}
+
+        def _replace(match: re.Match[str]) -> str:
+            try:
+                data = base64.b64decode(match.group(2), validate=True)
+            except binascii.Error:
+                return match.group(0)
+            cid = f"{hashlib.blake2b(data, digest_size=16).hexdigest()}@queryhub"
+            images.setdefault(cid, (match.group(1), data))
+            return f'src="cid:{cid}"'
+
+        if "data:image/" not in html:
+            return html, images
+        return _DATA_URI_IMAGE.sub(_replace, html), images
+
     def _resolve_from_address(self, overrides: ReportEmailConfig | None) -> str:
         """Resolve from address."""
         from_address = (
@@ -17,7 +17,7 @@ Structure:
 from .base_credentials import BaseCredential
 from .base_query_provider import BaseQueryProvider, QueryResult
 from .credential_factory import create_credential
-from .provider_factory import create_provider
+from .provider_factory import create_provider, get_provider_class
 
 __all__ = [
     "BaseCredential",
@@ -25,4 +25,5 @@ __all__ = [
     "QueryResult",
     "create_credential",
     "create_provider",
+    "get_provider_class",
 ]
@@ -5,6 +5,8 @@ This module contains all credential strategies for AWS services.
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from ...config.credential_models import AWSCredentialConfig
@@ -42,9 +44,10 @@ class AWSDefaultCredential(BaseCredential[AWSCredentialConfig | None, Any]):
         service_name = context.get("service_name", "s3")
         region_name = context.get("region_name", "us-east-1")
 
-        self._session = boto3.Session()
+        # Session construction walks the credential chain (files, env, IMDS)
+        self._session = await asyncio.to_thread(boto3.Session)
         assert self._session is not None
-        return self._session.client(service_name, region_name=region_name)
+        return await asyncio.to_thread(self._session.client, service_name, region_name=region_name)
 
     async def close(self) -> None:
         # boto3 clients don't need explicit cleanup
@@ -63,6 +66,9 @@ class AWSAccessKeyCredential(BaseCredential[AWSCredentialConfig, Any]):
     def __init__(self, config: AWSCredentialConfig) -> None:
         super().__init__(config)
         self._session: Any = None
+        self._region = config.region or "us-east-1"
+        token = config.session_token
+        self._session_token = token.get_secret_value() if token is not None else None
 
     async def get_connection(self, **context: Any) -> Any:
         """Get AWS connection using access key."""
@@ -74,25 +80,22 @@ class AWSAccessKeyCredential(BaseCredential[AWSCredentialConfig, Any]):
             ) from exc
 
         service_name = context.get("service_name", "s3")
-        region_name = context.get("region_name") or getattr(self.config, "region", "us-east-1")
+        region_name = context.get("region_name") or self._region
 
         assert self.config is not None, "Config is required"
         assert self.config.access_key_id is not None, "access_key_id is required"
         assert self.config.secret_access_key is not None, "secret_access_key is required"
 
-        session_token = None
-        if hasattr(self.config, "session_token") and self.config.session_token:
-            session_token = self.config.session_token.get_secret_value()
-
-        self._session = boto3.Session(
+        self._session = await asyncio.to_thread(
+            boto3.Session,
             aws_access_key_id=self.config.access_key_id,
             aws_secret_access_key=self.config.secret_access_key.get_secret_value(),
-            aws_session_token=session_token,
+            aws_session_token=self._session_token,
             region_name=region_name,
         )
 
         assert self._session is not None
-        return self._session.client(service_name, region_name=region_name)
+        return await asyncio.to_thread(self._session.client, service_name, region_name=region_name)
 
     async def close(self) -> None:
         # boto3 clients don't need explicit cleanup
@@ -108,9 +111,16 @@ class AWSIAMRoleCredential(BaseCredential[AWSCredentialConfig, Any]):
     Works with: S3, Athena, Redshift, DynamoDB, all AWS services
     """
 
+    # Refresh temporary credentials this long before they expire
+    _REFRESH_MARGIN = timedelta(minutes=1)
+
     def __init__(self, config: AWSCredentialConfig) -> None:
         super().__init__(config)
         self._session: Any = None
+        self._region = config.region or "us-east-1"
+        self._role_session_name = config.role_session_name or "queryhub-session"
+        self._creds_expiry: datetime | None = None
+        self._creds_lock = asyncio.Lock()
 
     async def get_connection(self, **context: Any) -> Any:
         """Get AWS connection by assuming IAM role."""
@@ -122,16 +132,38 @@ class AWSIAMRoleCredential(BaseCredential[AWSCredentialConfig, Any]):
             ) from exc
 
         service_name = context.get("service_name", "s3")
-        region_name = context.get("region_name") or getattr(self.config, "region", "us-east-1")
+        region_name = context.get("region_name") or self._region
 
         assert self.config is not None, "Config is required"
         assert self.config.role_arn is not None, "role_arn is required"
 
-        # Assume role to get temporary credentials
+        # Reuse temporary credentials until shortly before they expire. The
+        # shared session is not thread-safe, so client creation stays under the lock.
+        async with self._creds_lock:
+            if not self._credentials_valid():
+                await asyncio.to_thread(self._assume_role, boto3, region_name)
+            assert self._session is not None
+            return await asyncio.to_thread(
+                self._session.client, service_name, region_name=region_name
+            )
+
+    async def close(self) -> None:
+        # boto3 clients don't need explicit cleanup
+        pass
+
+    def _credentials_valid(self) -> bool:
+        """Check whether the assumed-role session can still be used."""
+        if self._session is None or self._creds_expiry is None:
+            return False
+        return datetime.now(tz=timezone.utc) + self._REFRESH_MARGIN < self._creds_expiry
+
+    def _assume_role(self, boto3: Any, region_name: str) -> None:
+        """Assume the IAM role and store a session with the temporary credentials."""
+        assert self.config is not None, "Config is required"
         sts_client = boto3.client("sts", region_name=region_name)
         assumed_role = sts_client.assume_role(
             RoleArn=self.config.role_arn,
-            RoleSessionName=getattr(self.config, "role_session_name", "queryhub-session"),
+            RoleSessionName=self._role_session_name,
         )
 
         credentials = assumed_role["Credentials"]
@@ -142,10 +174,4 @@ class AWSIAMRoleCredential(BaseCredential[AWSCredentialConfig, Any]):
             aws_secret_access_key=credentials["SecretAccessKey"],
             aws_session_token=credentials["SessionToken"],
         )
-
-        assert self._session is not None
-        return self._session.client(service_name, region_name=region_name)
-
-    async def close(self) -> None:
-        # boto3 clients don't need explicit cleanup
-        pass
+        self._creds_expiry = credentials["Expiration"]
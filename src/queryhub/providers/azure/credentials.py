@@ -7,14 +7,50 @@ works across all Azure services.
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import time
+from abc import abstractmethod
+from typing import Any, Final
 
 from ...config.credential_models import AzureCredentialConfig
 from ...core.errors import ProviderInitializationError
 from ..base_credentials import BaseCredential
 
+_KUSTO_SCOPE: Final[str] = "https://kusto.kusto.windows.net/.default"
+# Tokens closer than this to expiry are refreshed in the background
+_TOKEN_REFRESH_WINDOW_SECONDS: Final[int] = 300
 
-class AzureDefaultCredential(BaseCredential[AzureCredentialConfig, Any]):
+
+class _AzureKustoCredential(BaseCredential[AzureCredentialConfig, Any]):
+    """Base for Azure credentials that memoize Kusto connection builders.
+
+    Credential configuration is immutable once loaded, so the
+    KustoConnectionStringBuilder for a given cluster is built once and
+    reused by every subsequent ``get_connection`` call.
+    """
+
+    def __init__(self, config: AzureCredentialConfig | None = None) -> None:
+        super().__init__(config)
+        self._kcsb_cache: dict[str, Any] = {}
+
+    async def _get_kusto_connection(self, **context: Any) -> Any:
+        """Get cached Kusto connection, building it on first use per cluster."""
+        cluster_uri = context.get("cluster_uri")
+        if not cluster_uri:
+            raise ProviderInitializationError("cluster_uri is required for Kusto")
+
+        # Building is synchronous, so concurrent callers cannot interleave here
+        kcsb = self._kcsb_cache.get(cluster_uri)
+        if kcsb is None:
+            kcsb = self._kcsb_cache[cluster_uri] = self._build_kusto_connection(cluster_uri)
+        return kcsb
+
+    @abstractmethod
+    def _build_kusto_connection(self, cluster_uri: str) -> Any:
+        """Build a KustoConnectionStringBuilder for the cluster."""
+
+
+class AzureDefaultCredential(_AzureKustoCredential):
     """Azure DefaultAzureCredential - automatic credential discovery.
 
     Tries multiple authentication methods in order:
@@ -30,6 +66,9 @@ class AzureDefaultCredential(BaseCredential[AzureCredentialConfig, Any]):
     def __init__(self, config: AzureCredentialConfig | None = None) -> None:
         super().__init__(config)
         self._azure_credential: Any = None
+        self._token: Any = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._token_fetch: asyncio.Future[Any] | None = None
 
     async def get_connection(self, **context: Any) -> Any:
         """Get connection using DefaultAzureCredential."""
@@ -42,8 +81,8 @@ class AzureDefaultCredential(BaseCredential[AzureCredentialConfig, Any]):
                 f"Azure DefaultCredential does not support service_type='{service_type}'"
             )
 
-    async def _get_kusto_connection(self, **context: Any) -> Any:
-        """Get Kusto connection with DefaultAzureCredential."""
+    def _build_kusto_connection(self, cluster_uri: str) -> Any:
+        """Build Kusto connection with DefaultAzureCredential."""
         try:
             from azure.identity.aio import DefaultAzureCredential as AzureDefaultCred
             from azure.kusto.data import KustoConnectionStringBuilder
@@ -53,23 +92,74 @@ class AzureDefaultCredential(BaseCredential[AzureCredentialConfig, Any]):
                 "Install with: pip install azure-identity azure-kusto-data"
             ) from exc
 
-        cluster_uri = context.get("cluster_uri")
-        if not cluster_uri:
-            raise ProviderInitializationError("cluster_uri is required for Kusto")
+        if self._azure_credential is None:
+            self._azure_credential = AzureDefaultCred()
 
-        self._azure_credential = AzureDefaultCred()
-
-        return KustoConnectionStringBuilder.with_aad_token_provider(  # type: ignore[attr-defined]
-            cluster_uri,
-            lambda: self._azure_credential.get_token("https://kusto.kusto.windows.net/.default"),
+        return KustoConnectionStringBuilder.with_async_token_provider(  # type: ignore[attr-defined]
+            cluster_uri, self._get_token
         )
 
+    async def _get_token(self) -> str:
+        """Return a cached access token, refreshing ahead of expiry.
+
+        Only an expired (or missing) token is fetched inline; a token inside
+        the refresh window is returned as-is while a background task renews it.
+        """
+        token = self._token
+        now = time.time()
+        if token is None or token.expires_on <= now:
+            token = await self._fetch_token()
+        elif (
+            token.expires_on - now < _TOKEN_REFRESH_WINDOW_SECONDS
+            and self._refresh_task is None
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh_token())
+        return token.token
+
+    async def _fetch_token(self) -> Any:
+        """Fetch a new token; concurrent callers share one in-flight request.
+
+        The request is shielded so a caller timing out does not cancel it
+        for the others.
+        """
+        fetch = self._token_fetch
+        if fetch is None:
+            fetch = self._token_fetch = asyncio.ensure_future(
+                self._azure_credential.get_token(_KUSTO_SCOPE)
+            )
+            fetch.add_done_callback(self._token_fetched)
+        return await asyncio.shield(fetch)
+
+    def _token_fetched(self, fetch: asyncio.Future[Any]) -> None:
+        if self._token_fetch is fetch:
+            self._token_fetch = None
+        if not fetch.cancelled() and fetch.exception() is None:
+            self._token = fetch.result()
+
+    async def _refresh_token(self) -> None:
+        try:
+            await self._fetch_token()
+        except Exception:  # noqa: BLE001
+            # Keep serving the current token until it actually expires
+            pass
+        finally:
+            self._refresh_task = None
+
     async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._token_fetch is not None:
+            self._token_fetch.cancel()
+            self._token_fetch = None
+        self._token = None
         if self._azure_credential:
             await self._azure_credential.close()
+            self._azure_credential = None
+        self._kcsb_cache.clear()
 
 
-class AzureManagedIdentityCredential(BaseCredential[AzureCredentialConfig, Any]):
+class AzureManagedIdentityCredential(_AzureKustoCredential):
     """Azure Managed Identity authentication.
 
     Uses the managed identity assigned to Azure resources (VMs, App Service, etc.)
@@ -91,8 +181,8 @@ class AzureManagedIdentityCredential(BaseCredential[AzureCredentialConfig, Any])
                 f"Azure ManagedIdentity does not support service_type='{service_type}'"
             )
 
-    async def _get_kusto_connection(self, **context: Any) -> Any:
-        """Get Kusto connection with Managed Identity."""
+    def _build_kusto_connection(self, cluster_uri: str) -> Any:
+        """Build Kusto connection with Managed Identity."""
         try:
             from azure.kusto.data import KustoConnectionStringBuilder
         except ImportError as exc:
@@ -100,10 +190,6 @@ class AzureManagedIdentityCredential(BaseCredential[AzureCredentialConfig, Any])
                 "azure-kusto-data is required. Install with: pip install azure-kusto-data"
             ) from exc
 
-        cluster_uri = context.get("cluster_uri")
-        if not cluster_uri:
-            raise ProviderInitializationError("cluster_uri is required for Kusto")
-
         client_id = getattr(self.config, "client_id", None)
 
         return KustoConnectionStringBuilder.with_aad_managed_service_identity(  # type: ignore[attr-defined]
@@ -111,7 +197,7 @@ class AzureManagedIdentityCredential(BaseCredential[AzureCredentialConfig, Any])
         )
 
 
-class AzureServicePrincipalCredential(BaseCredential[AzureCredentialConfig, Any]):
+class AzureServicePrincipalCredential(_AzureKustoCredential):
     """Azure Service Principal authentication.
 
     Uses client_id, client_secret, and tenant_id for authentication.
@@ -134,8 +220,8 @@ class AzureServicePrincipalCredential(BaseCredential[AzureCredentialConfig, Any]
                 f"Azure ServicePrincipal does not support service_type='{service_type}'"
             )
 
-    async def _get_kusto_connection(self, **context: Any) -> Any:
-        """Get Kusto connection with Service Principal."""
+    def _build_kusto_connection(self, cluster_uri: str) -> Any:
+        """Build Kusto connection with Service Principal."""
         try:
             from azure.kusto.data import KustoConnectionStringBuilder
         except ImportError as exc:
@@ -143,10 +229,6 @@ class AzureServicePrincipalCredential(BaseCredential[AzureCredentialConfig, Any]
                 "azure-kusto-data is required. Install with: pip install azure-kusto-data"
             ) from exc
 
-        cluster_uri = context.get("cluster_uri")
-        if not cluster_uri:
-            raise ProviderInitializationError("cluster_uri is required for Kusto")
-
         assert self.config is not None, "Config is required"
         assert self.config.client_id is not None, "client_id is required"
         assert self.config.client_secret is not None, "client_secret is required"
@@ -160,7 +242,7 @@ class AzureServicePrincipalCredential(BaseCredential[AzureCredentialConfig, Any]
         )
 
 
-class AzureTokenCredential(BaseCredential[AzureCredentialConfig, Any]):
+class AzureTokenCredential(_AzureKustoCredential):
     """Azure pre-acquired token authentication.
 
     Uses a pre-acquired access token for authentication.
@@ -183,8 +265,8 @@ class AzureTokenCredential(BaseCredential[AzureCredentialConfig, Any]):
                 f"Azure Token does not support service_type='{service_type}'"
             )
 
-    async def _get_kusto_connection(self, **context: Any) -> Any:
-        """Get Kusto connection with token."""
+    def _build_kusto_connection(self, cluster_uri: str) -> Any:
+        """Build Kusto connection with token."""
         try:
             from azure.kusto.data import KustoConnectionStringBuilder
         except ImportError as exc:
@@ -192,10 +274,6 @@ class AzureTokenCredential(BaseCredential[AzureCredentialConfig, Any]):
                 "azure-kusto-data is required. Install with: pip install azure-kusto-data"
             ) from exc
 
-        cluster_uri = context.get("cluster_uri")
-        if not cluster_uri:
-            raise ProviderInitializationError("cluster_uri is required for Kusto")
-
         assert self.config is not None, "Config is required"
         assert self.config.token is not None, "token is required"
 
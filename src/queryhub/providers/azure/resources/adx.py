@@ -7,10 +7,15 @@ Azure Data Explorer clusters.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Any, Mapping, Optional
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Final, Mapping, Optional, Sequence
 
 from ....config.provider_models import ProviderConfig
+from ....core.concurrency import OnceAsync
 from ....core.credentials import CredentialRegistry
 from ....core.errors import ProviderExecutionError, ProviderInitializationError
 from ...base_credentials import BaseCredential
@@ -18,6 +23,72 @@ from ...base_query_provider import BaseQueryProvider, QueryResult
 
 _LOGGER = logging.getLogger(__name__)
 
+_OPT_SERVER_TIMEOUT: Final[str] = "servertimeout"
+# Client-side deadline on top of the server timeout, so a hung connection
+# does not hold the caller indefinitely
+_CLIENT_TIMEOUT_GRACE_SECONDS: Final[float] = 5.0
+_FALLBACK_TIMEOUT_SECONDS: Final[float] = 300.0
+
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Statements that apply to every statement of a multi-statement request, so a
+# query containing them must not share a request with other queries
+_REQUEST_SCOPED_STATEMENT = re.compile(r"(?:^|;)\s*(?:set|declare)\s", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class _ParsedADXQuery:
+    """The request-shaping fields of a query spec, read once per call."""
+
+    text: str
+    client_request_id: Optional[str]
+    parameters: Mapping[str, Any]
+    options: Mapping[str, Any]
+    timeout_seconds: Optional[float]
+
+    @classmethod
+    def parse(cls, query: Mapping[str, Any]) -> _ParsedADXQuery:
+        text = query.get("text")
+        if not text:
+            raise ProviderExecutionError("ADX queries require a 'text' entry")
+        return cls(
+            text,
+            query.get("client_request_id"),
+            query.get("parameters") or _EMPTY,
+            query.get("options") or _EMPTY,
+            query.get("timeout_seconds"),
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _format_server_timeout(seconds: float) -> str:
+    """Format a timeout in seconds as a Kusto servertimeout value."""
+    return f"{seconds}s"
+
+
+@functools.cache
+def _client_request_properties_cls() -> type:
+    """Import ClientRequestProperties once instead of on every query."""
+    from azure.kusto.data import ClientRequestProperties
+
+    return ClientRequestProperties
+
+
+# KustoClient instances shared by every provider that targets the same cluster
+# with the same credential instance (the registry keeps one per credential id),
+# so they reuse one connection pool and token cache. The client's token
+# provider is bound to that credential, which stays open while the key is
+# referenced. Each key has its own one-shot creation, so no lock is held
+# across credential I/O and a slow credential only delays its own key.
+_KUSTO_CLIENT_POOL: dict[tuple[str, BaseCredential], OnceAsync[Any]] = {}
+_KUSTO_CLIENT_REFS: dict[tuple[str, BaseCredential], int] = {}
+
+
+def _credential_in_use(credential: BaseCredential) -> bool:
+    """Check whether a pooled client still depends on a credential."""
+    return any(key[1] is credential for key in _KUSTO_CLIENT_REFS)
+
 
 class ADXQueryProvider(BaseQueryProvider):
     """Execute Kusto queries against Azure Data Explorer.
@@ -30,23 +101,46 @@ class ADXQueryProvider(BaseQueryProvider):
         self,
         config: ProviderConfig,
         credential_registry: Optional[CredentialRegistry] = None,
+        *,
+        eager: bool = True,
     ) -> None:
         super().__init__(config, credential_registry)
         if config.type != "adx" or not config.resource.adx:
             raise ProviderInitializationError("ADXQueryProvider requires adx resource configuration")
+        # Resolve the credential up front so the first query does not pay for the
+        # registry lookup; ``eager=False`` defers it until the client is created.
         self._credential: Optional[BaseCredential] = None
+        if eager and credential_registry and config.credentials:
+            self._credential = credential_registry.get_credential(
+                config.credentials, cloud_provider="azure"
+            )
         self._client = None
-        self._client_lock = asyncio.Lock()
+        self._client_once: OnceAsync[Any] = OnceAsync()
+        self._pool_key: Optional[tuple[str, BaseCredential]] = None
+        # Resolved once; the config is immutable and read on every query
+        self._adx = config.resource.adx
+        self._request_id_prefix = self._adx.client_request_id_prefix or "queryhub"
+        default_timeout = self.config.default_timeout_seconds
+        self._default_server_timeout = (
+            _format_server_timeout(default_timeout) if default_timeout else None
+        )
+        # Coalescing in submit() is opt-in; queued queries are grouped by server timeout
+        self.supports_batch = self._adx.batch_queries
+        self._pending: dict[
+            float, list[tuple[Mapping[str, Any], asyncio.Future[QueryResult]]]
+        ] = {}
+        self._flush_handles: dict[float, asyncio.TimerHandle] = {}
+        self._batch_tasks: set[asyncio.Task[None]] = set()
         _LOGGER.info(
             "ADX provider initialized: cluster=%s, database=%s",
-            self.adx_config.cluster_uri,
-            self.adx_config.database,
+            self._adx.cluster_uri,
+            self._adx.database,
         )
 
     @property
     def adx_config(self):
         """Get ADX-specific configuration from resource."""
-        return self.config.resource.adx
+        return self._adx
 
     async def execute(self, query: Mapping[str, Any]) -> QueryResult:
         """Execute a KQL query.
@@ -58,112 +152,387 @@ class ADXQueryProvider(BaseQueryProvider):
                   - parameters: Optional query parameters
                   - options: Optional Kusto client options
                   - timeout_seconds: Optional query timeout
+                  - columnar: Return a dict of column -> values instead of row dicts
+                  - format: "arrow" to return a pyarrow.Table (requires pyarrow)
+                  - stream: Return rows as an async iterator instead of a list
         """
-        client = await self._get_client()
-        query_text = query.get("text")
-        if not query_text:
-            raise ProviderExecutionError("ADX queries require a 'text' entry")
+        parsed = _ParsedADXQuery.parse(query)
+        client = self._client or await self._get_client()
 
-        _LOGGER.debug("Executing ADX query on database: %s", self.adx_config.database)
-        _LOGGER.debug("Query text (first 100 chars): %s", query_text[:100])
-        properties = self._build_client_properties(query)
+        _LOGGER.debug("Executing ADX query on database: %s", self._adx.database)
+        _LOGGER.debug("Query text (first 100 chars): %s", parsed.text[:100])
+        properties = self._build_client_properties(parsed)
+        deadline = self._client_deadline(parsed.timeout_seconds)
 
         try:
-            response = await client.execute(
-                self.adx_config.database,
-                query_text,
-                properties=properties,
+            response = await asyncio.wait_for(
+                client.execute(self._adx.database, parsed.text, properties=properties),
+                timeout=deadline,
             )
+        except TimeoutError as exc:
+            raise ProviderExecutionError(f"ADX query exceeded timeout of {deadline}s") from exc
         except Exception as exc:  # noqa: BLE001
             _LOGGER.error("ADX query failed: %s", exc, exc_info=True)
             raise ProviderExecutionError(f"ADX query failed: {exc}") from exc
 
         primary = response.primary_results[0] if response.primary_results else None
-        rows = []
-        if primary:
-            for row in primary:
-                rows.append(dict(row))
+        return self._build_result(query, primary, response)
+
+    async def execute_many(
+        self, queries: Sequence[Mapping[str, Any]], max_concurrency: int = 10
+    ) -> list[QueryResult]:
+        """Execute several KQL queries in a single ADX round-trip.
+
+        The query texts are joined into one multi-statement request and each
+        primary result table is mapped back to the query at the same position.
+        Queries with their own parameters or options cannot share request
+        properties, so such batches fall back to one request per query.
+
+        Args:
+            queries: Query specifications in the same format as ``execute``
+            max_concurrency: Maximum number of requests running at the same
+                             time when the batch falls back to one per query
+
+        Returns:
+            One QueryResult per query, in input order
+        """
+        if not queries:
+            return []
+        if len(queries) == 1 or any(q.get("parameters") or q.get("options") for q in queries):
+            return await super().execute_many(queries, max_concurrency)
+
+        parsed = [_ParsedADXQuery.parse(query) for query in queries]
+        batch = _ParsedADXQuery(
+            ";\n".join(p.text.strip().rstrip(";") for p in parsed),
+            ",".join(str(p.client_request_id) for p in parsed if p.client_request_id),
+            _EMPTY,
+            _EMPTY,
+            max((p.timeout_seconds for p in parsed if p.timeout_seconds), default=None),
+        )
+
+        client = self._client or await self._get_client()
+        properties = self._build_client_properties(batch)
+        deadline = self._client_deadline(batch.timeout_seconds)
 
         _LOGGER.debug(
-            "ADX query completed: %d row(s), execution_time=%s",
-            len(rows),
-            response.execution_time,
+            "Executing batch of %d ADX queries on database: %s",
+            len(parsed),
+            self._adx.database,
         )
+        try:
+            response = await asyncio.wait_for(
+                client.execute(self._adx.database, batch.text, properties=properties),
+                timeout=deadline,
+            )
+        except TimeoutError as exc:
+            raise ProviderExecutionError(f"ADX batch exceeded timeout of {deadline}s") from exc
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.error("ADX batch query failed: %s", exc, exc_info=True)
+            raise ProviderExecutionError(f"ADX batch query failed: {exc}") from exc
+
+        tables = response.primary_results or []
+        if len(tables) != len(queries):
+            raise ProviderExecutionError(
+                f"ADX batch returned {len(tables)} result table(s) for {len(queries)} queries"
+            )
+        return [
+            self._build_result(query, table, response) for query, table in zip(queries, tables)
+        ]
+
+    async def submit(
+        self, query: Mapping[str, Any], *, timeout: Optional[float] = None
+    ) -> QueryResult:
+        """Queue a query for coalesced execution with concurrent submissions.
+
+        Only with ``batch_queries`` enabled; otherwise, and for queries that
+        cannot share a request (see ``_batch_timeout``), this is ``execute``.
+        Pending queries with the same server timeout are flushed through
+        ``execute_many`` once ``batch_max_size`` are queued or
+        ``batch_window_ms`` has elapsed since the first one.
+        """
+        server_timeout = self._batch_timeout(query, timeout)
+        if server_timeout is None:
+            return await self.execute(query)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[QueryResult] = loop.create_future()
+        pending = self._pending.setdefault(server_timeout, [])
+        pending.append((query, future))
+        if len(pending) >= self._adx.batch_max_size:
+            self._flush_pending(server_timeout)
+        elif server_timeout not in self._flush_handles:
+            self._flush_handles[server_timeout] = loop.call_later(
+                self._adx.batch_window_ms / 1000, self._flush_pending, server_timeout
+            )
+        return await future
+
+    def _batch_timeout(
+        self, query: Mapping[str, Any], timeout: Optional[float]
+    ) -> Optional[float]:
+        """Get the server timeout to batch a query under, or None to run it alone.
+
+        A multi-statement response only arrives once every statement finishes,
+        ``set``/``declare`` statements apply to the whole request and control
+        commands cannot be combined with queries. Batches only hold queries
+        with the same server timeout, and only when the caller waits that long.
+        """
+        text = query.get("text")
+        if (
+            not self._adx.batch_queries
+            or not text
+            or text.lstrip().startswith(".")
+            or _REQUEST_SCOPED_STATEMENT.search(text)
+            or query.get("parameters")
+            or query.get("options")
+        ):
+            return None
+        server_timeout = (
+            query.get("timeout_seconds")
+            or self.config.default_timeout_seconds
+            or _FALLBACK_TIMEOUT_SECONDS
+        )
+        if timeout is not None and server_timeout > timeout:
+            return None
+        return server_timeout
+
+    def _flush_pending(self, server_timeout: Optional[float] = None) -> None:
+        """Start executing queued queries as one batch per server timeout.
+
+        Flushes the group for ``server_timeout``, or every group when omitted.
+        """
+        keys = list(self._pending) if server_timeout is None else [server_timeout]
+        for key in keys:
+            handle = self._flush_handles.pop(key, None)
+            if handle is not None:
+                handle.cancel()
+            batch = self._pending.pop(key, None)
+            if batch:
+                task = asyncio.ensure_future(self._run_batch(batch))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self, batch: list[tuple[Mapping[str, Any], asyncio.Future[QueryResult]]]
+    ) -> None:
+        """Execute a coalesced batch and resolve the waiting futures.
+
+        If the combined request fails, each query is retried on its own so a
+        single bad statement only fails its own caller.
+        """
+        queries = [query for query, _ in batch]
+        try:
+            results: list[Any] = await self.execute_many(queries)
+        except Exception as exc:  # noqa: BLE001
+            if len(batch) == 1:
+                results = [exc]
+            else:
+                _LOGGER.debug("ADX batch failed, retrying %d queries individually", len(batch))
+                results = await asyncio.gather(
+                    *(self.execute(query) for query in queries), return_exceptions=True
+                )
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _client_deadline(self, timeout_seconds: Optional[float]) -> float:
+        """Client-side wait for a response: the server timeout plus a grace period."""
+        timeout = (
+            timeout_seconds or self.config.default_timeout_seconds or _FALLBACK_TIMEOUT_SECONDS
+        )
+        return timeout + _CLIENT_TIMEOUT_GRACE_SECONDS
+
+    def _build_result(self, query: Mapping[str, Any], primary, response) -> QueryResult:
+        """Convert a primary result table into a QueryResult."""
         metadata = {
             "execution_time": response.execution_time,
             "request_id": response.request_id,
         }
+
+        if query.get("format") == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError:
+                self._raise_missing_dependency("pyarrow")
+            table = pa.table(self._to_columns(primary))
+            _LOGGER.debug(
+                "ADX query completed: %d row(s) as arrow, execution_time=%s",
+                table.num_rows,
+                response.execution_time,
+            )
+            return QueryResult(data=table, metadata=metadata, columnar=True)
+
+        if query.get("columnar"):
+            data = self._to_columns(primary)
+            _LOGGER.debug(
+                "ADX query completed: %d column(s), execution_time=%s",
+                len(data),
+                response.execution_time,
+            )
+            return QueryResult(data=data, metadata=metadata, columnar=True)
+
+        if query.get("stream"):
+            return QueryResult(data=self._iter_rows(primary), metadata=metadata)
+
+        rows = self._to_rows(primary)
+        _LOGGER.debug(
+            "ADX query completed: %d row(s), execution_time=%s",
+            len(rows),
+            response.execution_time,
+        )
         return QueryResult(data=rows, metadata=metadata)
 
+    @staticmethod
+    def _to_rows(primary) -> list[dict[str, Any]]:
+        """Convert a Kusto result table into a list of column name -> value dicts."""
+        if not primary:
+            return []
+        columns = tuple(column.column_name for column in primary.columns)
+        if len(primary) == 1:
+            # Management and lookup queries mostly return a single row
+            return [dict(zip(columns, next(iter(primary))))]
+        return [dict(zip(columns, row)) for row in primary]
+
+    @staticmethod
+    async def _iter_rows(primary) -> AsyncIterator[dict[str, Any]]:
+        """Yield row dicts lazily instead of building the full list up front."""
+        if not primary:
+            return
+        columns = tuple(column.column_name for column in primary.columns)
+        for row in primary:
+            yield dict(zip(columns, row))
+
+    @staticmethod
+    def _to_columns(primary) -> dict[str, list[Any]]:
+        """Transpose a Kusto result table into column name -> values lists."""
+        if primary is None:
+            return {}
+        columns = [column.column_name for column in primary.columns]
+        values = list(zip(*primary)) or [()] * len(columns)
+        return {name: list(column) for name, column in zip(columns, values)}
+
     async def close(self) -> None:
         """Close ADX client and credential resources."""
         _LOGGER.debug("Closing ADX provider connections")
-        if self._client is not None:
+        self._flush_pending()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._pool_key is not None:
+            await self._release_client(self._pool_key, self._client)
+            self._pool_key = None
+        elif self._client is not None:
             await self._client.close()
             _LOGGER.debug("ADX client closed")
-        if self._credential is not None:
+        self._client = None
+        self._client_once.reset()
+        # A pooled client still in use by another provider keeps its credential;
+        # the last provider to release it closes the credential
+        if self._credential is not None and not _credential_in_use(self._credential):
             await self._credential.close()
             _LOGGER.debug("ADX credentials closed")
 
     async def _get_client(self):
-        """Get or create ADX client (lazy initialization with thread safety)."""
-        if self._client is not None:
-            return self._client
-        async with self._client_lock:
-            if self._client is not None:
-                return self._client
-            self._client = await self._create_client()
-        return self._client
+        """Get or create ADX client (lazy one-shot initialization).
+
+        Hot paths check ``self._client`` first so no coroutine is created once
+        the client exists.
+        """
+        client = self._client
+        if client is None:
+            client = self._client = await self._client_once.call(self._create_client)
+        return client
 
     async def _create_client(self):
         """Create ADX client using credential from registry."""
-        _LOGGER.debug("Creating ADX client for cluster: %s", self.adx_config.cluster_uri)
+        _LOGGER.debug("Creating ADX client for cluster: %s", self._adx.cluster_uri)
         try:
             from azure.kusto.data.aio import KustoClient
         except ImportError as exc:
             self._raise_missing_dependency("azure-kusto-data", extras="adx")
             raise ProviderInitializationError("Azure Kusto dependency missing") from exc
 
-        if not self.credential_registry:
-            raise ProviderInitializationError("Credential registry is required")
+        if self._credential is None:
+            if not self.credential_registry:
+                raise ProviderInitializationError("Credential registry is required")
 
-        # Get credential from registry
-        _LOGGER.debug("Retrieving Azure credentials: %s", self.config.credentials)
-        self._credential = self.credential_registry.get_credential(
-            self.config.credentials, cloud_provider="azure"
-        )
+            # Get credential from registry
+            _LOGGER.debug("Retrieving Azure credentials: %s", self.config.credentials)
+            self._credential = self.credential_registry.get_credential(
+                self.config.credentials, cloud_provider="azure"
+            )
 
-        # Get authenticated connection (KustoConnectionStringBuilder)
-        _LOGGER.debug("Establishing authenticated connection to ADX")
-        kcsb = await self._credential.get_connection(
-            service_type="kusto", cluster_uri=self.adx_config.cluster_uri, database=self.adx_config.database
-        )
+        cluster_uri = self._adx.cluster_uri
+        credential = self._credential
+        key = (cluster_uri, credential)
 
-        client = KustoClient(kcsb)
-        _LOGGER.info("ADX client created successfully")
+        async def connect() -> Any:
+            # Get authenticated connection (KustoConnectionStringBuilder)
+            _LOGGER.debug("Establishing authenticated connection to ADX")
+            kcsb = await credential.get_connection(
+                service_type="kusto", cluster_uri=cluster_uri, database=self._adx.database
+            )
+            _LOGGER.info("ADX client created successfully")
+            return KustoClient(kcsb)
+
+        once = _KUSTO_CLIENT_POOL.get(key)
+        if once is None:
+            once = _KUSTO_CLIENT_POOL[key] = OnceAsync()
+        elif once.done:
+            _LOGGER.debug("Reusing pooled ADX client for cluster: %s", cluster_uri)
+        # Count the reference before awaiting so a concurrent release of the
+        # last other user does not drop the entry mid-creation
+        _KUSTO_CLIENT_REFS[key] = _KUSTO_CLIENT_REFS.get(key, 0) + 1
+        try:
+            client = await once.call(connect)
+        except BaseException:
+            await self._release_client(key, None)
+            raise
+        self._pool_key = key
         return client
 
-    def _build_client_properties(self, query: Mapping[str, Any]):
-        """Build Kusto client request properties from query."""
+    @staticmethod
+    async def _release_client(key: tuple[str, BaseCredential], client: Any) -> None:
+        """Drop one reference to a pooled client, closing it on the last release."""
+        remaining = _KUSTO_CLIENT_REFS.get(key, 0) - 1
+        if remaining > 0:
+            _KUSTO_CLIENT_REFS[key] = remaining
+            return
+        _KUSTO_CLIENT_REFS.pop(key, None)
+        _KUSTO_CLIENT_POOL.pop(key, None)
+        if client is not None:
+            await client.close()
+            _LOGGER.debug("ADX client closed")
+
+    def _build_client_properties(self, query: _ParsedADXQuery):
+        """Build Kusto client request properties from a parsed query."""
         try:
-            from azure.kusto.data import ClientRequestProperties
+            properties_cls = _client_request_properties_cls()
         except ImportError:
             self._raise_missing_dependency("azure-kusto-data", extras="adx")
 
-        properties = ClientRequestProperties()
+        properties = properties_cls()
 
-        if client_request_id := query.get("client_request_id"):
-            prefix = self.adx_config.client_request_id_prefix or "queryhub"
-            properties.client_request_id = f"{prefix};{client_request_id}"
+        if client_request_id := query.client_request_id:
+            properties.client_request_id = f"{self._request_id_prefix};{client_request_id}"
 
-        for name, value in query.get("parameters", {}).items():
-            properties.set_parameter(name, value)
+        if parameters := query.parameters:
+            set_parameter = properties.set_parameter
+            for name, value in parameters.items():
+                set_parameter(name, value)
 
-        timeout = query.get("timeout_seconds") or self.config.default_timeout_seconds
+        timeout = query.timeout_seconds
         if timeout:
-            properties.set_option("servertimeout", f"{timeout}s")
+            server_timeout = _format_server_timeout(timeout)
+        else:
+            server_timeout = self._default_server_timeout
+        set_option = properties.set_option
+        if server_timeout:
+            set_option(_OPT_SERVER_TIMEOUT, server_timeout)
 
-        for option_name, option_value in query.get("options", {}).items():
-            properties.set_option(option_name, option_value)
+        if options := query.options:
+            for option_name, option_value in options.items():
+                set_option(option_name, option_value)
 
         return properties
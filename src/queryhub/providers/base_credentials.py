@@ -14,7 +14,7 @@ The design follows SOLID principles:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 
 # Generic type for the configuration object
 TConfig = TypeVar("TConfig")
@@ -77,6 +77,15 @@ class BaseCredential(ABC, Generic[TConfig, TConnection]):
         """
         ...
 
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Get the epoch time at which the last connection data stops being valid.
+
+        Callers may cache what ``get_connection`` returned until then. None
+        (the default) means the data is static and can be cached indefinitely.
+        """
+        return None
+
     async def close(self) -> None:
         """Clean up any resources held by this credential.
 
@@ -13,10 +13,13 @@ The design follows SOLID principles:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Mapping, Optional
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence
 
 if TYPE_CHECKING:
     from ..config.provider_models import ProviderConfig
@@ -26,6 +29,13 @@ from ..core.errors import ProviderInitializationError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only default so results without metadata allocate nothing
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_metadata() -> Mapping[str, Any]:
+    return _EMPTY_METADATA
+
 
 @dataclass(slots=True, frozen=True)
 class QueryResult:
@@ -35,14 +45,31 @@ class QueryResult:
     across different resource types.
 
     Attributes:
-        data: The query result data (list of dicts, JSON, text, etc.)
-        metadata: Provider-specific metadata (execution time, row count, etc.)
+        data: The query result data (list of dicts, JSON, text, etc.), or an
+              async iterator of row dicts for streamed results
+        metadata: Provider-specific metadata (execution time, row count, etc.);
+                  a shared read-only empty mapping when not provided
         mime_type: Optional MIME type for the data (useful for REST providers)
+        columnar: True when data is a dict of column name -> list of values
+                  (or a pyarrow.Table) instead of a list of row dicts
     """
 
     data: Any
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
     mime_type: Optional[str] = None
+    columnar: bool = False
+
+    @property
+    def is_streaming(self) -> bool:
+        """Check if data is an async iterator that has not been consumed yet."""
+        return isinstance(self.data, AsyncIterator)
+
+    async def collect(self) -> QueryResult:
+        """Return a result whose streamed rows are materialized into a list."""
+        if not self.is_streaming:
+            return self
+        rows = [row async for row in self.data]
+        return replace(self, data=rows)
 
 
 class BaseQueryProvider(ABC):
@@ -65,6 +92,10 @@ class BaseQueryProvider(ABC):
     4. Proper resource cleanup
     """
 
+    # True when ``submit`` coalesces concurrent queries into fewer round trips;
+    # providers whose batching is configurable may override it per instance
+    supports_batch: bool = False
+
     def __init__(
         self,
         config: ProviderConfig,
@@ -113,6 +144,47 @@ class BaseQueryProvider(ABC):
         """
         ...
 
+    async def submit(
+        self, query: Mapping[str, Any], *, timeout: Optional[float] = None
+    ) -> QueryResult:
+        """Execute a query that may share a round trip with concurrent submissions.
+
+        Independent callers (such as report components) use this instead of
+        ``execute`` so providers with ``supports_batch`` can combine queries
+        that arrive together. ``timeout`` is how long the caller will wait, so
+        a query is never batched with work expected to outlast it. The default
+        simply calls ``execute``.
+        """
+        return await self.execute(query)
+
+    async def execute_many(
+        self, queries: Sequence[Mapping[str, Any]], max_concurrency: int = 10
+    ) -> list[QueryResult]:
+        """Execute independent queries concurrently.
+
+        At most ``max_concurrency`` queries are in flight at once so a large
+        batch does not exhaust the resource's connections. Providers that can
+        send several queries in one request override this.
+
+        Args:
+            queries: Query specifications in the same format as ``execute``
+            max_concurrency: Maximum number of queries running at the same time
+
+        Returns:
+            One QueryResult per query, in input order
+        """
+        if not queries:
+            return []
+        if len(queries) == 1:
+            return [await self.execute(queries[0])]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _execute(query: Mapping[str, Any]) -> QueryResult:
+            async with semaphore:
+                return await self.execute(query)
+
+        return list(await asyncio.gather(*(_execute(query) for query in queries)))
+
     async def close(self) -> None:
         """Close connections and clean up resources.
 
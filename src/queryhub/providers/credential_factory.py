@@ -6,7 +6,9 @@ cloud provider and credential type.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Mapping
 
 from ..core.errors import ProviderInitializationError
 from .base_credentials import BaseCredential
@@ -36,22 +38,29 @@ def create_credential(
     Raises:
         ProviderInitializationError: If credential type is unsupported
     """
-    if cloud_provider == "azure":
-        return _create_azure_credential(config, credential_type)
-    elif cloud_provider == "aws":
-        return _create_aws_credential(config, credential_type)
-    elif cloud_provider == "gcp":
-        return _create_gcp_credential(config, credential_type)
-    elif cloud_provider == "generic" or cloud_provider == "postgresql":
-        return _create_generic_credential(config, credential_type)
-    else:
+    entry = _CLOUD_CREDENTIALS.get(cloud_provider)
+    if entry is None:
         raise ProviderInitializationError(
             f"Unsupported cloud provider: {cloud_provider}. Supported: azure, aws, gcp, generic"
         )
 
+    label, load_classes = entry
+    credential_class = load_classes().get(credential_type)
+    if credential_class is None:
+        raise ProviderInitializationError(
+            f"Unsupported {label} credential type: {credential_type}. "
+            f"Supported: {_supported_types(load_classes)}"
+        )
+
+    return credential_class(config)
+
 
-def _create_azure_credential(config: CredentialConfig, credential_type: str) -> BaseCredential:
-    """Create Azure credential."""
+_CredentialClasses = Mapping[str, type[BaseCredential]]
+
+
+@functools.lru_cache(maxsize=1)
+def _azure_credential_classes() -> _CredentialClasses:
+    """Azure credential classes by type (imported on first use)."""
     from .azure.credentials import (
         AzureDefaultCredential,
         AzureManagedIdentityCredential,
@@ -59,72 +68,54 @@ def _create_azure_credential(config: CredentialConfig, credential_type: str) ->
         AzureTokenCredential,
     )
 
-    credential_map = {
-        "default_credentials": AzureDefaultCredential,
-        "managed_identity": AzureManagedIdentityCredential,
-        "service_principal": AzureServicePrincipalCredential,
-        "token": AzureTokenCredential,
-    }
-
-    credential_class = credential_map.get(credential_type)
-    if not credential_class:
-        raise ProviderInitializationError(
-            f"Unsupported Azure credential type: {credential_type}. "
-            f"Supported: {', '.join(credential_map.keys())}"
-        )
-
-    return credential_class(config)  # type: ignore[no-any-return]
+    return MappingProxyType(
+        {
+            "default_credentials": AzureDefaultCredential,
+            "managed_identity": AzureManagedIdentityCredential,
+            "service_principal": AzureServicePrincipalCredential,
+            "token": AzureTokenCredential,
+        }
+    )
 
 
-def _create_aws_credential(config: CredentialConfig, credential_type: str) -> BaseCredential:
-    """Create AWS credential."""
+@functools.lru_cache(maxsize=1)
+def _aws_credential_classes() -> _CredentialClasses:
+    """AWS credential classes by type (imported on first use)."""
     from .aws.credentials import (
         AWSAccessKeyCredential,
         AWSDefaultCredential,
         AWSIAMRoleCredential,
     )
 
-    credential_map = {
-        "default_credentials": AWSDefaultCredential,
-        "access_key": AWSAccessKeyCredential,
-        "iam_role": AWSIAMRoleCredential,
-    }
-
-    credential_class = credential_map.get(credential_type)
-    if not credential_class:
-        raise ProviderInitializationError(
-            f"Unsupported AWS credential type: {credential_type}. "
-            f"Supported: {', '.join(credential_map.keys())}"
-        )
-
-    return credential_class(config)  # type: ignore[no-any-return]
+    return MappingProxyType(
+        {
+            "default_credentials": AWSDefaultCredential,
+            "access_key": AWSAccessKeyCredential,
+            "iam_role": AWSIAMRoleCredential,
+        }
+    )
 
 
-def _create_gcp_credential(config: CredentialConfig, credential_type: str) -> BaseCredential:
-    """Create GCP credential."""
+@functools.lru_cache(maxsize=1)
+def _gcp_credential_classes() -> _CredentialClasses:
+    """GCP credential classes by type (imported on first use)."""
     from .gcp.credentials import (
         GCPDefaultCredential,
         GCPServiceAccountJSONCredential,
     )
 
-    credential_map = {
-        "default_credentials": GCPDefaultCredential,
-        "service_account": GCPServiceAccountJSONCredential,
-        "service_account_json": GCPServiceAccountJSONCredential,
-    }
-
-    credential_class = credential_map.get(credential_type)
-    if not credential_class:
-        raise ProviderInitializationError(
-            f"Unsupported GCP credential type: {credential_type}. "
-            f"Supported: {', '.join(credential_map.keys())}"
-        )
-
-    return credential_class(config)  # type: ignore[no-any-return]
+    return MappingProxyType(
+        {
+            "default_credentials": GCPDefaultCredential,
+            "service_account": GCPServiceAccountJSONCredential,
+            "service_account_json": GCPServiceAccountJSONCredential,
+        }
+    )
 
 
-def _create_generic_credential(config: CredentialConfig, credential_type: str) -> BaseCredential:
-    """Create generic credential."""
+@functools.lru_cache(maxsize=1)
+def _generic_credential_classes() -> _CredentialClasses:
+    """Generic credential classes by type (imported on first use)."""
     from .generic.credentials import (
         ConnectionStringCredential,
         NoCredential,
@@ -132,18 +123,29 @@ def _create_generic_credential(config: CredentialConfig, credential_type: str) -
         UsernamePasswordCredential,
     )
 
-    credential_map = {
-        "username_password": UsernamePasswordCredential,
-        "token": TokenCredential,
-        "connection_string": ConnectionStringCredential,
-        "none": NoCredential,
-    }
+    return MappingProxyType(
+        {
+            "username_password": UsernamePasswordCredential,
+            "token": TokenCredential,
+            "connection_string": ConnectionStringCredential,
+            "none": NoCredential,
+        }
+    )
 
-    credential_class = credential_map.get(credential_type)
-    if not credential_class:
-        raise ProviderInitializationError(
-            f"Unsupported generic credential type: {credential_type}. "
-            f"Supported: {', '.join(credential_map.keys())}"
-        )
 
-    return credential_class(config)  # type: ignore[no-any-return]
+@functools.cache
+def _supported_types(load_classes: Callable[[], _CredentialClasses]) -> str:
+    """Comma-separated credential types for error messages."""
+    return ", ".join(load_classes())
+
+
+# Cloud provider -> (label, credential class loader); postgresql is an alias for generic
+_CLOUD_CREDENTIALS: Mapping[str, tuple[str, Callable[[], _CredentialClasses]]] = MappingProxyType(
+    {
+        "azure": ("Azure", _azure_credential_classes),
+        "aws": ("AWS", _aws_credential_classes),
+        "gcp": ("GCP", _gcp_credential_classes),
+        "generic": ("generic", _generic_credential_classes),
+        "postgresql": ("generic", _generic_credential_classes),
+    }
+)
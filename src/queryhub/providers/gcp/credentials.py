@@ -5,15 +5,85 @@ This module contains all credential strategies for GCP services.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
-from typing import Any
+from abc import abstractmethod
+from typing import Any, Callable
 
 from ...config.credential_models import GCPCredentialConfig
 from ...core.errors import ProviderInitializationError
 from ..base_credentials import BaseCredential
 
+# Google client symbols, imported on first use so importing this module stays cheap
+_bigquery: Any = None
+_service_account: Any = None
+_google_auth_default: Any = None
 
-class GCPDefaultCredential(BaseCredential[GCPCredentialConfig | None, Any]):
+
+def _ensure_bigquery() -> tuple[Any, Any, Any]:
+    """Return ``(bigquery, service_account, google.auth.default)``, importing them once."""
+    global _bigquery, _service_account, _google_auth_default
+    if _bigquery is None:
+        try:
+            from google.auth import default
+            from google.cloud import bigquery
+            from google.oauth2 import service_account
+        except ImportError as exc:
+            raise ProviderInitializationError(
+                "google-cloud-bigquery is required. Install with: pip install google-cloud-bigquery"
+            ) from exc
+        _service_account, _google_auth_default = service_account, default
+        _bigquery = bigquery
+    return _bigquery, _service_account, _google_auth_default
+
+
+@functools.cache
+def _json_loads() -> Callable[[bytes | str], Any]:
+    """Return orjson.loads when installed, otherwise json.loads."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads  # type: ignore[no-any-return]
+
+
+class _GCPBigQueryCredential(BaseCredential[GCPCredentialConfig | None, Any]):
+    """Base for GCP credentials that memoize BigQuery clients.
+
+    A client is built once per (project_id, location) and reused by every
+    subsequent ``get_connection`` call.
+    """
+
+    def __init__(self, config: GCPCredentialConfig | None = None) -> None:
+        super().__init__(config)
+        self._client_cache: dict[tuple[str, str], Any] = {}
+        self._client_lock = asyncio.Lock()
+
+    async def _get_bigquery_client(self, **context: Any) -> Any:
+        """Get cached BigQuery client, building it on first use per project/location."""
+        key = (context.get("project_id") or "", context.get("location", "US"))
+        client = self._client_cache.get(key)
+        if client is not None:
+            return client
+        async with self._client_lock:
+            client = self._client_cache.get(key)
+            if client is None:
+                client = await self._build_bigquery_client(*key)
+                self._client_cache[key] = client
+        return client
+
+    @abstractmethod
+    async def _build_bigquery_client(self, project_id: str, location: str) -> Any:
+        """Build a BigQuery client; an empty project_id means resolve it from the credential."""
+
+    async def close(self) -> None:
+        for client in self._client_cache.values():
+            client.close()
+        self._client_cache.clear()
+
+
+class GCPDefaultCredential(_GCPBigQueryCredential):
     """GCP Application Default Credentials - automatic credential discovery.
 
     Tries multiple authentication methods in order:
@@ -29,6 +99,7 @@ class GCPDefaultCredential(BaseCredential[GCPCredentialConfig | None, Any]):
     def __init__(self, config: GCPCredentialConfig | None = None) -> None:
         super().__init__(config)
         self._credentials = None
+        self._default_project: str | None = None
 
     async def get_connection(self, **context: Any) -> Any:
         """Get GCP connection using Application Default Credentials."""
@@ -41,39 +112,27 @@ class GCPDefaultCredential(BaseCredential[GCPCredentialConfig | None, Any]):
                 f"GCP DefaultCredential does not support service_type='{service_type}'"
             )
 
-    async def _get_bigquery_client(self, **context: Any) -> Any:
-        """Get BigQuery client with Application Default Credentials."""
-        try:
-            from google.auth import default
-            from google.cloud import bigquery
-        except ImportError as exc:
-            raise ProviderInitializationError(
-                "google-cloud-bigquery is required. Install with: pip install google-cloud-bigquery"
-            ) from exc
-
-        project_id = context.get("project_id")
-        location = context.get("location", "US")
+    async def _build_bigquery_client(self, project_id: str, location: str) -> Any:
+        """Build BigQuery client with Application Default Credentials."""
+        bigquery, _, default = _ensure_bigquery()
 
-        # Get default credentials
-        credentials, project = default()
+        # Credential discovery reads files and may query the metadata server,
+        # so it runs once, off the event loop
+        if self._credentials is None:
+            self._credentials, self._default_project = await asyncio.to_thread(default)
 
         if not project_id:
-            project_id = project
+            project_id = self._default_project
 
         if not project_id:
             raise ProviderInitializationError(
                 "project_id is required for BigQuery and could not be determined"
             )
 
-        self._credentials = credentials
-        return bigquery.Client(project=project_id, credentials=credentials, location=location)
-
-    async def close(self) -> None:
-        # GCP clients don't need explicit cleanup
-        pass
+        return bigquery.Client(project=project_id, credentials=self._credentials, location=location)
 
 
-class GCPServiceAccountJSONCredential(BaseCredential[GCPCredentialConfig, Any]):
+class GCPServiceAccountJSONCredential(_GCPBigQueryCredential):
     """GCP service account JSON authentication.
 
     Uses a service account JSON key file or inline JSON for authentication.
@@ -85,6 +144,7 @@ class GCPServiceAccountJSONCredential(BaseCredential[GCPCredentialConfig, Any]):
     def __init__(self, config: GCPCredentialConfig) -> None:
         super().__init__(config)
         self._credentials = None
+        self._info_project: str | None = None
 
     async def get_connection(self, **context: Any) -> Any:
         """Get GCP connection using service account JSON."""
@@ -103,47 +163,34 @@ class GCPServiceAccountJSONCredential(BaseCredential[GCPCredentialConfig, Any]):
         if hasattr(self.config, "service_account_json") and self.config.service_account_json:
             # Inline JSON
             json_str = self.config.service_account_json.get_secret_value()
-            return json.loads(json_str)  # type: ignore[no-any-return]
+            return _json_loads()(json_str)  # type: ignore[no-any-return]
         elif (
             hasattr(self.config, "service_account_json_path")
             and self.config.service_account_json_path
         ):
-            # JSON file path
-            with open(self.config.service_account_json_path, "r") as f:
-                return json.load(f)  # type: ignore[no-any-return]
+            # JSON file path, read as bytes so the parser skips text decoding
+            with open(self.config.service_account_json_path, "rb") as f:
+                return _json_loads()(f.read())  # type: ignore[no-any-return]
         else:
             raise ProviderInitializationError(
                 "Either service_account_json or service_account_json_path must be provided"
             )
 
-    async def _get_bigquery_client(self, **context: Any) -> Any:
-        """Get BigQuery client with service account JSON."""
-        try:
-            from google.cloud import bigquery
-            from google.oauth2 import service_account
-        except ImportError as exc:
-            raise ProviderInitializationError(
-                "google-cloud-bigquery is required. Install with: pip install google-cloud-bigquery"
-            ) from exc
+    async def _build_bigquery_client(self, project_id: str, location: str) -> Any:
+        """Build BigQuery client with service account JSON."""
+        bigquery, service_account, _ = _ensure_bigquery()
 
-        service_account_info = self._load_service_account_info()
+        # Load and parse the key (including its RSA private key) only once
+        if self._credentials is None:
+            service_account_info = self._load_service_account_info()
+            self._info_project = service_account_info.get("project_id")
+            self._credentials = service_account.Credentials.from_service_account_info(
+                service_account_info
+            )
 
-        project_id = (
-            context.get("project_id")
-            or getattr(self.config, "project_id", None)
-            or service_account_info.get("project_id")
-        )
-        location = context.get("location", "US")
+        project_id = project_id or getattr(self.config, "project_id", None) or self._info_project
 
         if not project_id:
             raise ProviderInitializationError("project_id is required for BigQuery")
 
-        self._credentials = service_account.Credentials.from_service_account_info(
-            service_account_info
-        )
-
         return bigquery.Client(project=project_id, credentials=self._credentials, location=location)
-
-    async def close(self) -> None:
-        # GCP clients don't need explicit cleanup
-        pass
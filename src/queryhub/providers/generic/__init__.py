@@ -1,11 +1,28 @@
-"""Generic providers package."""
+"""Generic providers package.
 
-from .credentials import (
-    ConnectionStringCredential,
-    NoCredential,
-    TokenCredential,
-    UsernamePasswordCredential,
-)
+Credentials are imported on first attribute access, so importing a resource
+provider does not load the credential module.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .credentials import (
+        ConnectionStringCredential,
+        NoCredential,
+        TokenCredential,
+        UsernamePasswordCredential,
+    )
+
+_LAZY_EXPORTS = {
+    "UsernamePasswordCredential": ".credentials",
+    "TokenCredential": ".credentials",
+    "ConnectionStringCredential": ".credentials",
+    "NoCredential": ".credentials",
+}
 
 __all__ = [
     "UsernamePasswordCredential",
@@ -13,3 +30,12 @@ __all__ = [
     "ConnectionStringCredential",
     "NoCredential",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -6,7 +6,7 @@ cloud providers and resource types (SQL databases, REST APIs, etc.).
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
 from ...config.credential_models import GenericCredentialConfig
 from ..base_credentials import BaseCredential
@@ -21,20 +21,26 @@ class UsernamePasswordCredential(BaseCredential[GenericCredentialConfig, dict[st
 
     def __init__(self, config: GenericCredentialConfig) -> None:
         super().__init__(config)
+        self._connection: Optional[dict[str, str]] = None
 
     async def get_connection(self, **context: Any) -> dict[str, str]:
         """Get username/password as a dict.
 
+        The secret is unwrapped once; every call returns the same dict,
+        which callers must not mutate.
+
         Returns:
             Dict with 'username' and 'password' keys
         """
-        assert self.config is not None, "Config is required"
-        assert self.config.username is not None, "Username is required"
-        assert self.config.password is not None, "Password is required"
-        return {
-            "username": self.config.username,
-            "password": self.config.password.get_secret_value(),
-        }
+        if self._connection is None:
+            assert self.config is not None, "Config is required"
+            assert self.config.username is not None, "Username is required"
+            assert self.config.password is not None, "Password is required"
+            self._connection = {
+                "username": self.config.username,
+                "password": self.config.password.get_secret_value(),
+            }
+        return self._connection
 
 
 class TokenCredential(BaseCredential[GenericCredentialConfig, dict[str, str]]):
@@ -45,20 +51,26 @@ class TokenCredential(BaseCredential[GenericCredentialConfig, dict[str, str]]):
 
     def __init__(self, config: GenericCredentialConfig) -> None:
         super().__init__(config)
+        self._connection: Optional[dict[str, str]] = None
 
     async def get_connection(self, **context: Any) -> dict[str, str]:
         """Get token with header information.
 
+        The token is unwrapped once; every call returns the same dict,
+        which callers must not mutate.
+
         Returns:
             Dict with 'token', 'header_name', and 'template' keys
         """
-        assert self.config is not None, "Config is required"
-        assert self.config.token is not None, "Token is required"
-        return {
-            "token": self.config.token.get_secret_value(),
-            "header_name": getattr(self.config, "header_name", "Authorization"),
-            "template": getattr(self.config, "template", "Bearer {token}"),
-        }
+        if self._connection is None:
+            assert self.config is not None, "Config is required"
+            assert self.config.token is not None, "Token is required"
+            self._connection = {
+                "token": self.config.token.get_secret_value(),
+                "header_name": getattr(self.config, "header_name", "Authorization"),
+                "template": getattr(self.config, "template", "Bearer {token}"),
+            }
+        return self._connection
 
 
 class ConnectionStringCredential(BaseCredential[GenericCredentialConfig, str]):
@@ -70,16 +82,19 @@ class ConnectionStringCredential(BaseCredential[GenericCredentialConfig, str]):
 
     def __init__(self, config: GenericCredentialConfig) -> None:
         super().__init__(config)
+        self._connection_string: Optional[str] = None
 
     async def get_connection(self, **context: Any) -> str:
-        """Get connection string.
+        """Get connection string (unwrapped from the secret once).
 
         Returns:
             Connection string
         """
-        assert self.config is not None, "Config is required"
-        assert self.config.connection_string is not None, "Connection string is required"
-        return self.config.connection_string.get_secret_value()
+        if self._connection_string is None:
+            assert self.config is not None, "Config is required"
+            assert self.config.connection_string is not None, "Connection string is required"
+            self._connection_string = self.config.connection_string.get_secret_value()
+        return self._connection_string
 
 
 class NoCredential(BaseCredential[None, None]):
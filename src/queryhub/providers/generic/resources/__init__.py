@@ -1,7 +1,32 @@
-"""Generic resources package."""
+"""Generic resources package.
 
-from .csv import CSVQueryProvider
-from .rest import RESTQueryProvider
-from .sql import SQLQueryProvider
+Providers are imported on first attribute access, so using one of them does
+not import the dependencies (SQLAlchemy, aiohttp) of the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .csv import CSVQueryProvider
+    from .rest import RESTQueryProvider
+    from .sql import SQLQueryProvider
+
+_LAZY_EXPORTS = {
+    "SQLQueryProvider": ".sql",
+    "RESTQueryProvider": ".rest",
+    "CSVQueryProvider": ".csv",
+}
 
 __all__ = ["SQLQueryProvider", "RESTQueryProvider", "CSVQueryProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -7,9 +7,12 @@ from __future__ import annotations
 
 import asyncio
 import csv
+import functools
 import logging
+import operator
+import os
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Final, Mapping, Optional
 
 from ....config.provider_models import ProviderConfig
 from ....core.credentials import CredentialRegistry
@@ -18,6 +21,14 @@ from ...base_query_provider import BaseQueryProvider, QueryResult
 
 _LOGGER = logging.getLogger(__name__)
 
+# Files smaller than this are parsed on the event loop; a worker-thread hop
+# costs more than reading them.
+_INLINE_READ_MAX_BYTES: Final[int] = 64 * 1024
+
+# Files at least this large are memory-mapped and filtered batch by batch with
+# pyarrow instead of being parsed whole into the shared parse cache.
+_STREAM_READ_MIN_BYTES: Final[int] = 64 * 1024 * 1024
+
 
 class CSVQueryProvider(BaseQueryProvider):
     """Read tabular data from CSV files.
@@ -50,6 +61,7 @@ class CSVQueryProvider(BaseQueryProvider):
                   - delimiter: Optional delimiter (overrides config)
                   - encoding: Optional encoding (overrides config)
                   - filters: Optional list of filters to apply
+                  - format: "arrow" to return a pyarrow.Table (requires pyarrow)
         """
         relative_path = query.get("path") or query.get("file")
         if not relative_path:
@@ -57,59 +69,273 @@ class CSVQueryProvider(BaseQueryProvider):
 
         full_path = self._root_path / relative_path
         _LOGGER.debug("Reading CSV file: %s", full_path)
-        if not full_path.exists():
+        try:
+            stat = full_path.stat()
+        except FileNotFoundError as exc:
             _LOGGER.error("CSV file not found: %s", full_path)
-            raise ProviderExecutionError(f"CSV file not found: {full_path}")
+            raise ProviderExecutionError(f"CSV file not found: {full_path}") from exc
 
         delimiter = query.get("delimiter") or self.csv_config.delimiter
         encoding = query.get("encoding") or self.csv_config.encoding
 
-        rows = await asyncio.to_thread(self._read_csv, full_path, delimiter, encoding)
-        _LOGGER.debug("CSV file loaded: %d row(s)", len(rows))
-
         filters = query.get("filters") or []
         if filters:
             _LOGGER.debug("Applying %d filter(s) to CSV data", len(filters))
-        filtered = self._apply_filters(rows, filters)
-        
-        if filters:
-            _LOGGER.debug("Filters applied: %d row(s) remaining", len(filtered))
 
-        return QueryResult(data=filtered, metadata={"rowcount": len(filtered)})
+        as_arrow = query.get("format") == "arrow"
+        load_args = (full_path, stat, delimiter, encoding, filters, as_arrow)
+        if stat.st_size < _INLINE_READ_MAX_BYTES:
+            data = self._load(*load_args)
+        else:
+            data = await asyncio.to_thread(self._load, *load_args)
+        rowcount = data.num_rows if as_arrow else len(data)
+        _LOGGER.debug("CSV file loaded: %d row(s)", rowcount)
+
+        return QueryResult(data=data, metadata={"rowcount": rowcount}, columnar=as_arrow)
+
+    def _load(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        delimiter: str,
+        encoding: str,
+        filters: list[Mapping[str, Any]],
+        as_arrow: bool,
+    ) -> Any:
+        """Read and filter a CSV file synchronously.
+
+        With pyarrow installed, filters run on the Arrow table before any
+        Python row objects are built; otherwise the standard library ``csv``
+        module is used.
+        """
+        if stat.st_size >= _STREAM_READ_MIN_BYTES:
+            table = self._scan_table(path, delimiter, encoding, filters)
+            if table is not None:
+                return table if as_arrow else table.to_pylist()
+        parsed = _read_csv_cached(str(path), stat.st_mtime_ns, stat.st_size, delimiter, encoding)
+        if not isinstance(parsed, tuple):
+            table = self._filter_table(parsed, filters)
+            return table if as_arrow else table.to_pylist()
+        if as_arrow:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                self._raise_missing_dependency("pyarrow")
+            raise ProviderExecutionError(
+                f"CSV file {path} has rows whose field count differs from the header "
+                "and cannot be returned in arrow format"
+            )
+        header, rows = parsed
+        return self._apply_filters(header, rows, filters)
+
+    @staticmethod
+    def _read_csv(path: Path, delimiter: str, encoding: str) -> tuple[tuple[str, ...], tuple]:
+        """Read CSV file synchronously into its header and raw cell tuples.
 
-    def _read_csv(self, path: Path, delimiter: str, encoding: str) -> list[dict[str, Any]]:
-        """Read CSV file synchronously."""
+        Like ``csv.DictReader``, blank lines are skipped and short rows are
+        padded with None. Row dicts are built later, only for matching rows.
+        """
         with path.open("r", encoding=encoding, newline="") as handle:
-            reader = csv.DictReader(handle, delimiter=delimiter)
-            return [dict(row) for row in reader]
+            reader = csv.reader(handle, delimiter=delimiter)
+            header = tuple(next(reader, ()))
+            width = len(header)
+            padding = (None,) * width
+            rows = tuple(
+                tuple(row) if len(row) >= width else (*row, *padding[len(row) :])
+                for row in reader
+                if row
+            )
+        return header, rows
+
+    @staticmethod
+    def _read_table(path: Path, delimiter: str, encoding: str) -> Any:
+        """Read CSV file into a pyarrow Table.
+
+        Returns None without pyarrow, or when rows are ragged: pyarrow rejects
+        them, while the stdlib reader pads or keeps them like ``csv.DictReader``.
+        """
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            return None
+
+        options = CSVQueryProvider._arrow_csv_options(path, delimiter, encoding)
+        if options is None:
+            return pa.table({})
+        try:
+            return pa_csv.read_csv(path, **options)
+        except pa.ArrowInvalid:
+            return None
+
+    @staticmethod
+    def _scan_table(
+        path: Path, delimiter: str, encoding: str, filters: list[Mapping[str, Any]]
+    ) -> Any:
+        """Stream a memory-mapped CSV file through pyarrow, filtering each batch.
+
+        Only rows that pass the filters are kept, so peak memory follows the
+        result size rather than the file size. Returns None without pyarrow
+        or when pyarrow rejects ragged rows.
+        """
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            return None
+
+        options = CSVQueryProvider._arrow_csv_options(path, delimiter, encoding)
+        if options is None:
+            return pa.table({})
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                reader = pa_csv.open_csv(source, **options)
+                tables = [
+                    CSVQueryProvider._filter_table(pa.Table.from_batches([batch]), filters)
+                    for batch in reader
+                ]
+        except pa.ArrowInvalid:
+            return None
+        if not tables:
+            return reader.schema.empty_table()
+        return pa.concat_tables(tables)
+
+    @staticmethod
+    def _arrow_csv_options(path: Path, delimiter: str, encoding: str) -> Optional[dict[str, Any]]:
+        """Build pyarrow.csv reader options, or return None for a file without a header.
+
+        Every column is read as a string so values match ``csv.DictReader``.
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        with path.open("r", encoding=encoding, newline="") as handle:
+            header = next(csv.reader(handle, delimiter=delimiter), None)
+        if not header:
+            return None
+
+        return {
+            "read_options": pa_csv.ReadOptions(encoding=encoding),
+            "parse_options": pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            "convert_options": pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header}
+            ),
+        }
+
+    @staticmethod
+    def _filter_table(table: Any, filters: list[Mapping[str, Any]]) -> Any:
+        """Apply filters to a pyarrow Table as one vectorized expression.
+
+        Mirrors ``_apply_filters``: every column holds strings, so ``eq``
+        never matches and ``ne`` always matches a non-string value.
+        """
+        if not filters:
+            return table
+
+        import pyarrow.compute as pc
+
+        expression = None
+        for flt in filters:
+            column = flt.get("column")
+            value = flt.get("value")
+            op = flt.get("operator", "eq")
+
+            if column is None or column not in table.column_names:
+                return table.slice(0, 0)
+
+            field = pc.field(column)
+            if op == "eq":
+                if not isinstance(value, str):
+                    return table.slice(0, 0)
+                condition = field == value
+            elif op == "ne" and isinstance(value, str):
+                condition = field != value
+            elif op == "contains" and value is not None:
+                condition = pc.match_substring(field, str(value))
+            else:
+                continue
+            expression = condition if expression is None else expression & condition
+
+        return table if expression is None else table.filter(expression)
 
     def _apply_filters(
         self,
-        rows: list[dict[str, Any]],
+        header: tuple[str, ...],
+        rows: tuple[tuple[Optional[str], ...], ...],
         filters: list[Mapping[str, Any]],
     ) -> list[dict[str, Any]]:
-        """Apply filters to CSV data."""
+        """Filter raw CSV rows and build dicts for the rows that match.
+
+        Filters compare cells by column index, so rejected rows never become
+        dicts. Filter specs are compiled once into predicates; all ``eq``
+        filters share one ``itemgetter`` and a single tuple comparison.
+        """
+        if not rows:
+            return []
+
+        width = len(header)
+
+        def to_dict(row: tuple[Optional[str], ...]) -> dict[str, Any]:
+            record: dict[Any, Any] = dict(zip(header, row))
+            if len(row) > width:
+                # Same key csv.DictReader uses for surplus cells
+                record[None] = list(row[width:])
+            return record
+
         if not filters:
-            return rows
+            return [to_dict(row) for row in rows]
 
-        def match(row: Mapping[str, Any]) -> bool:
-            for flt in filters:
-                column = flt.get("column")
-                value = flt.get("value")
-                op = flt.get("operator", "eq")
+        index = {name: position for position, name in enumerate(header)}
+        eq_positions: list[int] = []
+        eq_values: list[Any] = []
+        predicates: list[Callable[[tuple[Optional[str], ...]], bool]] = []
+        for flt in filters:
+            column = flt.get("column")
+            value = flt.get("value")
+            op = flt.get("operator", "eq")
 
-                if column is None or column not in row:
-                    return False
+            if column is None or column not in index:
+                return []
 
-                lhs = row[column]
+            position = index[column]
+            if op == "eq":
+                eq_positions.append(position)
+                eq_values.append(value)
+            elif op == "ne":
+                predicates.append(lambda row, p=position, v=value: row[p] != v)
+            elif op == "contains" and value is not None:
+                predicates.append(lambda row, p=position, v=str(value): v in str(row[p]))
 
-                if op == "eq" and lhs != value:
-                    return False
-                if op == "ne" and lhs == value:
-                    return False
-                if op == "contains" and value is not None and value not in str(lhs):
-                    return False
+        if eq_positions:
+            # itemgetter returns a bare value for one index and a tuple for several
+            getter = operator.itemgetter(*eq_positions)
+            expected = eq_values[0] if len(eq_values) == 1 else tuple(eq_values)
+            predicates.insert(0, lambda row: getter(row) == expected)
 
-            return True
+        if not predicates:
+            return [to_dict(row) for row in rows]
+        if len(predicates) == 1:
+            match = predicates[0]
+        else:
 
-        return [row for row in rows if match(row)]
+            def match(row: tuple[Optional[str], ...]) -> bool:
+                for predicate in predicates:
+                    if not predicate(row):
+                        return False
+                return True
+
+        return [to_dict(row) for row in rows if match(row)]
+
+
+@functools.lru_cache(maxsize=32)
+def _read_csv_cached(path: str, mtime_ns: int, size: int, delimiter: str, encoding: str) -> Any:
+    """Parse a CSV file once per version of the file.
+
+    ``mtime_ns`` and ``size`` only key the cache so a modified file is
+    re-read. Returns an immutable pyarrow Table, or a ``(header, rows)``
+    tuple of raw cells when pyarrow is not installed.
+    """
+    table = CSVQueryProvider._read_table(Path(path), delimiter, encoding)
+    if table is not None:
+        return table
+    return CSVQueryProvider._read_csv(Path(path), delimiter, encoding)
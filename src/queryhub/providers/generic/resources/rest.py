@@ -7,15 +7,29 @@ from __future__ import annotations
 
 import asyncio
 import base64
-from typing import Any, Mapping, Optional
+import functools
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Final, Mapping, Optional, Sequence
 from urllib.parse import urljoin
 
 from ....config.provider_models import ProviderConfig
+from ....core.concurrency import OnceAsync
 from ....core.credentials import CredentialRegistry
 from ....core.errors import ProviderExecutionError, ProviderInitializationError
 from ...base_credentials import BaseCredential
 from ...base_query_provider import BaseQueryProvider, QueryResult
 
+# Rebuild an expiring auth header this long before the credential expires
+_AUTH_HEADER_EXPIRY_MARGIN_SECONDS: Final[float] = 60.0
+
+# Keep resolved addresses and idle connections around between report runs
+_DNS_CACHE_TTL_SECONDS: Final[int] = 300
+_KEEPALIVE_TIMEOUT_SECONDS: Final[float] = 75.0
+
+# aiohttp is imported once, on first use, by RESTQueryProvider._import_aiohttp
+_aiohttp: Any = None
+
 
 class RESTQueryProvider(BaseQueryProvider):
     """Execute HTTP requests against REST endpoints.
@@ -33,7 +47,10 @@ class RESTQueryProvider(BaseQueryProvider):
             raise ProviderInitializationError("RESTQueryProvider requires rest resource configuration")
         self._credential: Optional[BaseCredential] = None
         self._session = None
-        self._session_lock = asyncio.Lock()
+        self._session_once: OnceAsync[Any] = OnceAsync()
+        self._base_url = config.resource.rest.base_url.rstrip("/") + "/"
+        self._auth_header_cache: Optional[dict[str, str]] = None
+        self._auth_header_expiry: Optional[float] = None
 
     @property
     def rest_config(self):
@@ -53,8 +70,10 @@ class RESTQueryProvider(BaseQueryProvider):
                   - json: Optional JSON body
                   - data: Optional form data
                   - timeout_seconds: Optional request timeout
+                  - stream: Return the items of a top-level JSON array as an
+                    async iterator parsed while the body downloads (requires ijson)
         """
-        session = await self._get_session()
+        session = self._session or await self._get_session()
         method = str(query.get("method", "GET")).upper()
         endpoint = query.get("endpoint") or query.get("path")
         url = query.get("url")
@@ -62,30 +81,39 @@ class RESTQueryProvider(BaseQueryProvider):
         if not url:
             if not endpoint:
                 raise ProviderExecutionError("REST queries require an 'endpoint' or 'url'")
-            url = urljoin(self.rest_config.base_url.rstrip("/") + "/", str(endpoint).lstrip("/"))
+            url = _endpoint_url(self._base_url, str(endpoint))
 
-        headers = {**self.rest_config.default_headers, **query.get("headers", {})}
+        # default_headers are already set on the session, which merges them
+        # under these per-request headers
+        headers = query.get("headers")
 
         # Add authentication headers from credential
         auth_header = await self._build_auth_header()
-        headers.update(auth_header)
+        if auth_header:
+            headers = {**headers, **auth_header} if headers else auth_header
 
         timeout_seconds = query.get("timeout_seconds") or self.config.default_timeout_seconds
         params = query.get("params")
         json_payload = query.get("json")
         data_payload = query.get("data")
 
-        try:
-            import aiohttp
-        except ImportError as exc:
-            self._raise_missing_dependency("aiohttp")
-            raise ProviderExecutionError("aiohttp dependency missing") from exc
+        if _aiohttp is None:
+            self._import_aiohttp()
+
+        ijson = None
+        if query.get("stream"):
+            try:
+                import ijson
+            except ImportError:
+                self._raise_missing_dependency("ijson")
 
-        timeout = aiohttp.ClientTimeout(total=timeout_seconds) if timeout_seconds else None
-        request_options = dict(self.rest_config.request_options)
-        request_options.update(query.get("request_options", {}))
+        timeout = _client_timeout(timeout_seconds) if timeout_seconds else None
+        # Only copy the configured options when the query overrides some of them
+        request_options = self.rest_config.request_options
+        if overrides := query.get("request_options"):
+            request_options = {**request_options, **overrides}
 
-        async with session.request(
+        response = await session.request(
             method,
             url,
             headers=headers,
@@ -94,8 +122,9 @@ class RESTQueryProvider(BaseQueryProvider):
             data=data_payload,
             timeout=timeout,
             **request_options,
-        ) as response:
-            content_type = response.headers.get("Content-Type", "").split(";")[0]
+        )
+        try:
+            content_type = response.headers.get("Content-Type", "").partition(";")[0]
 
             if response.status >= 400:
                 body = await response.text()
@@ -103,47 +132,154 @@ class RESTQueryProvider(BaseQueryProvider):
                     f"REST request failed with status {response.status}: {body[:200]}"
                 )
 
+            metadata = self._response_metadata(response)
             if content_type == "application/json":
-                payload = await response.json()
+                if ijson is not None:
+                    items = self._iter_json_items(response, ijson)
+                    # The iterator now owns the response and releases it when done
+                    response = None
+                    return QueryResult(data=items, metadata=metadata, mime_type=content_type)
+                payload = self._decode_json(await response.read())
             else:
                 payload = await response.text()
+            return QueryResult(data=payload, metadata=metadata, mime_type=content_type)
+        finally:
+            if response is not None:
+                response.release()
 
-            metadata = {
-                "status": response.status,
-                "url": str(response.url),
-                "headers": dict(response.headers),
+    def _response_metadata(self, response: Any) -> dict[str, Any]:
+        """Build result metadata from a response."""
+        metadata_headers = self.rest_config.metadata_headers
+        if metadata_headers is None:
+            # Read-only, case-insensitive view; no per-request copy of every header
+            headers_metadata: Mapping[str, str] = response.headers
+        else:
+            response_headers = response.headers
+            headers_metadata = {
+                name: response_headers[name]
+                for name in metadata_headers
+                if name in response_headers
             }
-            return QueryResult(data=payload, metadata=metadata, mime_type=content_type)
+        return {
+            "status": response.status,
+            "url": str(response.url),
+            "headers": headers_metadata,
+        }
+
+    @staticmethod
+    def _decode_json(body: bytes) -> Any:
+        """Decode a JSON body; an empty body decodes to None as ``response.json()`` did."""
+        if not body.strip():
+            return None
+        try:
+            return _json_codec()[0](body)
+        except ValueError as exc:
+            raise ProviderExecutionError(f"REST response is not valid JSON: {exc}") from exc
+
+    @staticmethod
+    async def _iter_json_items(response: Any, ijson: Any) -> AsyncIterator[Any]:
+        """Yield the items of a top-level JSON array as the body downloads."""
+        try:
+            async for item in ijson.items(response.content, "item", use_float=True):
+                yield item
+        finally:
+            response.release()
+
+    async def execute_many(
+        self, queries: Sequence[Mapping[str, Any]], max_concurrency: int = 10
+    ) -> list[QueryResult]:
+        """Execute several HTTP requests concurrently over the shared session.
+
+        Requests to the same host share the keep-alive connection pool, whose
+        size (``pool_limit``/``pool_limit_per_host``) also caps how many are
+        in flight at once.
+
+        Args:
+            queries: Query specifications in the same format as ``execute``
+            max_concurrency: Maximum number of requests running at the same time
+
+        Returns:
+            One QueryResult per query, in input order
+        """
+        if not queries:
+            return []
+        # Create the session and auth header once, before fanning out
+        await self._get_session()
+        await self._build_auth_header()
+        return await super().execute_many(queries, max_concurrency)
 
     async def close(self) -> None:
         """Close HTTP session and credential resources."""
         if self._session is not None:
             await self._session.close()
+        self._session = None
+        self._session_once.reset()
+        self._auth_header_cache = None
+        self._auth_header_expiry = None
         if self._credential is not None:
             await self._credential.close()
 
     async def _get_session(self):
-        """Get or create HTTP session (lazy initialization with thread safety)."""
-        if self._session is not None:
-            return self._session
-        async with self._session_lock:
-            if self._session is None:
-                self._session = await self._create_session()
-        return self._session
+        """Get or create HTTP session (lazy one-shot initialization).
+
+        Hot paths check ``self._session`` first so no coroutine is created once
+        the session exists.
+        """
+        session = self._session
+        if session is None:
+            session = self._session = await self._session_once.call(self._create_session)
+        return session
 
     async def _create_session(self):
         """Create aiohttp session."""
-        try:
-            import aiohttp
-        except ImportError as exc:
-            self._raise_missing_dependency("aiohttp")
-            raise ProviderExecutionError("aiohttp dependency missing") from exc
-
+        aiohttp = self._import_aiohttp()
         timeout = aiohttp.ClientTimeout(total=self.config.default_timeout_seconds)
-        session = aiohttp.ClientSession(timeout=timeout, headers=self.rest_config.default_headers)
+        connector = aiohttp.TCPConnector(
+            limit=self.rest_config.pool_limit,
+            limit_per_host=self.rest_config.pool_limit_per_host,
+            ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+        )
+        session = aiohttp.ClientSession(
+            timeout=timeout,
+            headers=self.rest_config.default_headers,
+            connector=connector,
+            json_serialize=_json_codec()[1],
+        )
         return session
 
+    def _import_aiohttp(self) -> Any:
+        """Import aiohttp into the module global, raising a helpful error if missing."""
+        global _aiohttp
+        if _aiohttp is None:
+            try:
+                import aiohttp
+            except ImportError:
+                self._raise_missing_dependency("aiohttp")
+            _aiohttp = aiohttp
+        return _aiohttp
+
     async def _build_auth_header(self) -> dict[str, str]:
+        """Get authentication header, rebuilding it only when the credential expires.
+
+        Static credentials are resolved and formatted once; credentials that
+        report ``expires_at`` are refreshed shortly before that time.
+        """
+        cached = self._auth_header_cache
+        if cached is not None and (
+            self._auth_header_expiry is None or time.time() < self._auth_header_expiry
+        ):
+            return cached
+
+        header = await self._resolve_auth_header()
+        expires_at = self._credential.expires_at if self._credential is not None else None
+        self._auth_header_cache = header
+        self._auth_header_expiry = (
+            None if expires_at is None else expires_at - _AUTH_HEADER_EXPIRY_MARGIN_SECONDS
+        )
+        return header
+
+    async def _resolve_auth_header(self) -> dict[str, str]:
         """Build authentication header from credential."""
         if not self.credential_registry or not self.config.credentials:
             return {}
@@ -179,3 +315,34 @@ class RESTQueryProvider(BaseQueryProvider):
             return {"Authorization": f"Basic {encoded}"}
 
         return {}
+
+
+@functools.lru_cache(maxsize=256)
+def _endpoint_url(base_url: str, endpoint: str) -> Any:
+    """Resolve an endpoint against base_url with urljoin, parsing the URL once.
+
+    Absolute endpoints replace the base and ``../`` segments walk up from it.
+    """
+    from yarl import URL
+
+    return URL(urljoin(base_url, endpoint.lstrip("/")))
+
+
+@functools.lru_cache(maxsize=32)
+def _client_timeout(total: float) -> Any:
+    """Get a shared ``ClientTimeout`` for a total timeout (instances are immutable)."""
+    return _aiohttp.ClientTimeout(total=total)
+
+
+@functools.cache
+def _json_codec() -> tuple[Callable[[bytes], Any], Callable[[Any], str]]:
+    """Return ``(loads, dumps)``, using orjson when installed and stdlib json otherwise."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads, json.dumps
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    return orjson.loads, dumps
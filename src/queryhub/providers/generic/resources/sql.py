@@ -7,19 +7,101 @@ using SQLAlchemy's async support.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Mapping, Optional
-
-from sqlalchemy import text
-from sqlalchemy.engine import URL
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+import contextlib
+import functools
+import logging
+import re
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, AsyncIterator, Final, Mapping, Optional, Sequence
 
 from ....config.provider_models import ProviderConfig
+from ....core.concurrency import OnceAsync
 from ....core.credentials import CredentialRegistry
 from ....core.errors import ProviderExecutionError, ProviderInitializationError
 from ...base_credentials import BaseCredential
 from ...base_query_provider import BaseQueryProvider, QueryResult
 
+_LOGGER = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, async_sessionmaker
+
+# SQLAlchemy (with its asyncio extension) is imported on first use so that
+# importing the provider package does not pay for it
+_sa: Any = None
+
+
+def _ensure_sqlalchemy() -> Any:
+    """Return the ``sqlalchemy`` module with its submodules loaded, importing once."""
+    global _sa
+    if _sa is None:
+        import sqlalchemy
+        import sqlalchemy.engine
+        import sqlalchemy.exc
+        import sqlalchemy.ext.asyncio
+        import sqlalchemy.pool
+
+        _sa = sqlalchemy
+    return _sa
+
+# Engines shared by every provider with the same URL and engine/connect options,
+# so they reuse one connection pool. Entries are reference-counted by provider;
+# creating an engine does no I/O, so the updates below never interleave.
+_ENGINE_POOL: dict[str, AsyncEngine] = {}
+_ENGINE_REFS: dict[str, int] = {}
+
+# Options passed to create_async_engine (min_pool_size is handled by the
+# provider); everything else goes to connect_args
+_ENGINE_OPTIONS: Final[frozenset[str]] = frozenset(
+    {
+        "echo",
+        "pool_size",
+        "pool_recycle",
+        "max_overflow",
+        "pool_timeout",
+        "pool_pre_ping",
+        "pool_reset_on_return",
+        "pool_use_lifo",
+        "min_pool_size",
+    }
+)
+
+# Defaults for dialects that use a queue pool, sized for concurrent report
+# execution rather than SQLAlchemy's 5 connections. LIFO reuse keeps a small
+# set of connections warm.
+_QUEUE_POOL_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType(
+    {
+        "pool_size": 20,
+        "max_overflow": 30,
+        "pool_recycle": 1800,
+        "pool_timeout": 30,
+        "pool_use_lifo": True,
+    }
+)
+
+# Statements longer than this are not worth keeping in the compiled-text cache
+_TEXT_CACHE_MAX_STATEMENT_CHARS: Final[int] = 100_000
+
+# Rows fetched per round trip when a query is streamed without a chunk_size
+_STREAM_BATCH_SIZE: Final[int] = 1000
+
+# Named bind parameters as SQLAlchemy's text() recognises them (``:name`` but
+# not ``::type`` casts), rewritten to ``$n`` for raw asyncpg queries
+_NAMED_PARAM = re.compile(r"(?<![:\w\\]):(\w+)(?!:)")
+
+# asyncpg pool settings for raw_driver mode; pool_size and min_pool_size
+# options override the sizes. fetch() and cursors reuse a connection's cached
+# statement for up to statement_cache_size query texts (asyncpg defaults to 100).
+_RAW_POOL_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType(
+    {
+        "min_size": 5,
+        "max_size": 20,
+        "max_queries": 50_000,
+        "max_inactive_connection_lifetime": 300.0,
+        "statement_cache_size": 1024,
+    }
+)
+
 
 class SQLQueryProvider(BaseQueryProvider):
     """Execute SQL queries using SQLAlchemy.
@@ -38,8 +120,13 @@ class SQLQueryProvider(BaseQueryProvider):
             raise ProviderInitializationError("SQLQueryProvider requires sql resource configuration")
         self._credential: Optional[BaseCredential] = None
         self._engine: Optional[AsyncEngine] = None
-        self._engine_lock = asyncio.Lock()
+        self._engine_once: OnceAsync[AsyncEngine] = OnceAsync()
+        self._pool_key: Optional[str] = None
         self._sessionmaker: Optional[async_sessionmaker] = None
+        self._shared_connection: Optional[AsyncConnection] = None
+        self._shared_lock = asyncio.Lock()
+        self._raw_pool: Any = None
+        self._raw_pool_once: OnceAsync[Any] = OnceAsync()
 
     @property
     def sql_config(self):
@@ -52,8 +139,19 @@ class SQLQueryProvider(BaseQueryProvider):
         Args:
             query: Query specification with keys:
                   - text: SQL query string (required)
-                  - parameters: Optional query parameters
+                  - parameters: Optional query parameters; a list of mappings
+                    runs the statement once per entry in a single executemany
                   - timeout_seconds: Optional query timeout
+                  - stream: Return rows as an async iterator fetched in batches
+                    over a server-side cursor instead of a list
+                  - chunk_size: Rows fetched per batch when streaming (default 1000)
+                  - columnar: Return a dict of column name -> list of values
+                  - format: "arrow" to return a pyarrow.Table (requires pyarrow)
+
+        With ``raw_driver: asyncpg`` the statement runs on an asyncpg pool
+        without SQLAlchemy; ``:name`` parameters are rewritten to ``$n``.
+        ``rowcount`` is then the number of rows returned, and an empty result
+        has no column names.
         """
         statement_text = query.get("text")
         if not statement_text:
@@ -61,65 +159,328 @@ class SQLQueryProvider(BaseQueryProvider):
 
         timeout = query.get("timeout_seconds") or self.config.default_timeout_seconds
         params = query.get("parameters", {})
+        if self.sql_config.raw_driver == "asyncpg":
+            return await self._execute_raw(query, statement_text, params, timeout)
+        sa = _ensure_sqlalchemy()
+        statement = _compile_text(statement_text)
 
         try:
-            engine = await self._get_engine()
-            async with engine.connect() as connection:
-                if timeout:
-                    connection = await connection.execution_options(timeout=timeout)
-                statement = text(statement_text)
-                result = await connection.execute(statement, params)
-                records = [dict(row) for row in result.mappings().all()]
-        except SQLAlchemyError as exc:
+            engine = self._engine or await self._get_engine()
+            if query.get("stream"):
+                chunk_size = int(query.get("chunk_size") or _STREAM_BATCH_SIZE)
+                rows = self._iter_rows(engine, statement, params, timeout, chunk_size)
+                return QueryResult(data=rows)
+            options = {"timeout": timeout} if timeout else None
+            if isinstance(params, (list, tuple)):
+                # executemany writes nothing unless committed, as in execute_batch
+                async with engine.begin() as connection:
+                    result = await connection.execute(
+                        statement, list(params), execution_options=options
+                    )
+                return QueryResult(data=[], metadata={"rowcount": result.rowcount})
+            async with self._connect(engine) as connection:
+                result = await connection.execute(statement, params, execution_options=options)
+                if not result.returns_rows:
+                    # DML/DDL; leaving the connection would roll the change back
+                    await connection.commit()
+                    return QueryResult(data=[], metadata={"rowcount": result.rowcount})
+                columns = tuple(result.keys())
+                rows = result.all()
+        except sa.exc.SQLAlchemyError as exc:
             raise ProviderExecutionError(f"SQL execution failed: {exc}") from exc
+        return self._build_result(query, columns, rows)
 
-        metadata = {"rowcount": len(records)}
+    def _build_result(
+        self, query: Mapping[str, Any], columns: tuple[str, ...], rows: Any
+    ) -> QueryResult:
+        """Shape fetched row tuples as records, columns or an Arrow table."""
+        metadata = {"rowcount": len(rows)}
+        if query.get("format") == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError:
+                self._raise_missing_dependency("pyarrow")
+            table = pa.table(self._to_columns(columns, rows))
+            return QueryResult(data=table, metadata=metadata, columnar=True)
+        if query.get("columnar"):
+            return QueryResult(
+                data=self._to_columns(columns, rows), metadata=metadata, columnar=True
+            )
+
+        # Zip plain row tuples with the keys instead of copying RowMappings
+        records = [dict(zip(columns, row)) for row in rows]
         return QueryResult(data=records, metadata=metadata)
 
+    async def execute_batch(
+        self, statement_text: str, param_list: Sequence[Mapping[str, Any]]
+    ) -> QueryResult:
+        """Run one statement for every parameter set in a single executemany and commit.
+
+        Returns an empty result whose ``rowcount`` metadata is the total number
+        of rows affected across all parameter sets (-1 with ``raw_driver``,
+        as asyncpg does not report it for executemany).
+        """
+        if not statement_text:
+            raise ProviderExecutionError("SQL batches require statement text")
+        if not param_list:
+            return QueryResult(data=[], metadata={"rowcount": 0})
+        timeout = self.config.default_timeout_seconds
+        if self.sql_config.raw_driver == "asyncpg":
+            return await self._execute_raw({}, statement_text, list(param_list), timeout)
+
+        sa = _ensure_sqlalchemy()
+        statement = _compile_text(statement_text)
+        options = {"timeout": timeout} if timeout else None
+        try:
+            engine = self._engine or await self._get_engine()
+            async with engine.begin() as connection:
+                result = await connection.execute(
+                    statement, list(param_list), execution_options=options
+                )
+        except sa.exc.SQLAlchemyError as exc:
+            raise ProviderExecutionError(f"SQL batch execution failed: {exc}") from exc
+        return QueryResult(data=[], metadata={"rowcount": result.rowcount})
+
+    async def _execute_raw(
+        self,
+        query: Mapping[str, Any],
+        statement_text: str,
+        params: Any,
+        timeout: Optional[float],
+    ) -> QueryResult:
+        """Execute a query directly on the asyncpg pool, bypassing SQLAlchemy."""
+        asyncpg = self._import_asyncpg()
+        statement, names = _to_asyncpg(statement_text)
+        try:
+            pool = self._raw_pool or await self._get_raw_pool()
+            if query.get("stream"):
+                chunk_size = int(query.get("chunk_size") or _STREAM_BATCH_SIZE)
+                args = _positional_args(names, params)
+                rows = self._iter_raw_rows(pool, statement, args, timeout, chunk_size, asyncpg)
+                return QueryResult(data=rows)
+            async with pool.acquire() as connection:
+                if isinstance(params, (list, tuple)):
+                    # asyncpg runs executemany in one transaction without a rowcount
+                    await connection.executemany(
+                        statement, [_positional_args(names, p) for p in params], timeout=timeout
+                    )
+                    return QueryResult(data=[], metadata={"rowcount": -1})
+                # fetch() goes through the connection's statement cache, so a
+                # repeated query is parsed and planned once per connection
+                records = await connection.fetch(
+                    statement, *_positional_args(names, params), timeout=timeout
+                )
+        except (asyncpg.PostgresError, asyncpg.InterfaceError, OSError) as exc:
+            raise ProviderExecutionError(f"SQL execution failed: {exc}") from exc
+        # asyncpg Records iterate over their values like row tuples
+        columns = tuple(records[0].keys()) if records else ()
+        return self._build_result(query, columns, records)
+
+    @staticmethod
+    async def _iter_raw_rows(
+        pool: Any,
+        statement: str,
+        args: tuple[Any, ...],
+        timeout: Optional[float],
+        chunk_size: int,
+        asyncpg: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield row dicts from an asyncpg cursor, holding the connection until exhausted."""
+        try:
+            async with pool.acquire() as connection:
+                # asyncpg cursors only exist inside a transaction
+                async with connection.transaction():
+                    cursor = connection.cursor(
+                        statement, *args, prefetch=chunk_size, timeout=timeout
+                    )
+                    async for record in cursor:
+                        yield dict(record.items())
+        except (asyncpg.PostgresError, asyncpg.InterfaceError, OSError) as exc:
+            raise ProviderExecutionError(f"SQL execution failed: {exc}") from exc
+
+    @staticmethod
+    def _to_columns(columns: tuple[str, ...], rows: Any) -> dict[str, list[Any]]:
+        """Transpose row tuples into column name -> values lists."""
+        if not rows:
+            return {name: [] for name in columns}
+        return {name: list(values) for name, values in zip(columns, zip(*rows))}
+
+    @contextlib.asynccontextmanager
+    async def _connect(self, engine: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+        """Check out a pooled connection, or the shared one when share_connection is set.
+
+        The shared connection serves one query at a time. Its implicit
+        transaction is rolled back after each query, as leaving
+        ``engine.connect()`` does, and it is dropped after any error.
+        """
+        if not self.sql_config.share_connection:
+            async with engine.connect() as connection:
+                yield connection
+            return
+
+        async with self._shared_lock:
+            connection = self._shared_connection
+            if connection is None:
+                connection = self._shared_connection = await engine.connect()
+            try:
+                yield connection
+            except BaseException:
+                self._shared_connection = None
+                await connection.close()
+                raise
+            await connection.rollback()
+
+    @staticmethod
+    async def _iter_rows(
+        engine: AsyncEngine,
+        statement: Any,
+        params: Mapping[str, Any],
+        timeout: Optional[int],
+        chunk_size: int,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield row dicts from a server-side cursor, holding the connection until exhausted.
+
+        Only ``chunk_size`` rows are buffered in Python at a time.
+        """
+        options: dict[str, Any] = {"yield_per": chunk_size}
+        if timeout:
+            options["timeout"] = timeout
+        try:
+            async with engine.connect() as connection:
+                result = await connection.stream(statement, params, execution_options=options)
+                columns = tuple(result.keys())
+                async for partition in result.partitions():
+                    for row in partition:
+                        yield dict(zip(columns, row))
+        except _sa.exc.SQLAlchemyError as exc:
+            raise ProviderExecutionError(f"SQL execution failed: {exc}") from exc
+
     async def close(self) -> None:
         """Close SQL engine and credential resources."""
-        if self._engine is not None:
+        if self._raw_pool is not None:
+            await self._raw_pool.close()
+            self._raw_pool = None
+        self._raw_pool_once.reset()
+        if self._shared_connection is not None:
+            await self._shared_connection.close()
+            self._shared_connection = None
+        if self._pool_key is not None:
+            await self._release_engine(self._pool_key)
+            self._pool_key = None
+        elif self._engine is not None:
             await self._engine.dispose()
+        self._engine = None
+        self._engine_once.reset()
         if self._credential is not None:
             await self._credential.close()
 
     async def _get_engine(self) -> AsyncEngine:
-        """Get or create SQL engine (lazy initialization with thread safety)."""
-        if self._engine is not None:
-            return self._engine
-        async with self._engine_lock:
-            if self._engine is None:
-                self._engine = await self._create_engine()
-        return self._engine
+        """Get or create SQL engine (lazy one-shot initialization).
+
+        Hot paths check ``self._engine`` first so no coroutine is created once
+        the engine exists.
+        """
+        engine = self._engine
+        if engine is None:
+            engine = self._engine = await self._engine_once.call(self._create_engine)
+        return engine
+
+    async def _get_raw_pool(self) -> Any:
+        """Get or create the asyncpg pool used by ``raw_driver: asyncpg``."""
+        pool = self._raw_pool
+        if pool is None:
+            pool = self._raw_pool = await self._raw_pool_once.call(self._create_raw_pool)
+        return pool
+
+    async def _create_raw_pool(self) -> Any:
+        """Create an asyncpg pool from the DSN or host settings.
+
+        A username/password credential supplies the login, as with the
+        SQLAlchemy URL built from host settings. Options that are not
+        SQLAlchemy engine options (``ssl``, ``command_timeout``,
+        ``server_settings``, ...) go to asyncpg as they would to
+        ``connect_args``; a libpq-style ``sslmode`` is passed as ``ssl``.
+        """
+        asyncpg = self._import_asyncpg()
+        target = self.sql_config
+        options = target.options or {}
+        cred_data = await self._resolve_credential_data()
+        pool_kwargs = dict(_RAW_POOL_DEFAULTS)
+        if "pool_size" in options:
+            pool_kwargs["max_size"] = int(options["pool_size"])
+        if "min_pool_size" in options:
+            pool_kwargs["min_size"] = int(options["min_pool_size"])
+        pool_kwargs["min_size"] = min(pool_kwargs["min_size"], pool_kwargs["max_size"])
+        server_settings = dict(options.get("server_settings") or {})
+        for option, value in options.items():
+            if option in _ENGINE_OPTIONS or option == "server_settings":
+                continue
+            if option == "application_name":
+                server_settings.setdefault(option, value)
+            elif option == "sslmode":
+                pool_kwargs.setdefault("ssl", value)
+            else:
+                pool_kwargs[option] = value
+        if server_settings:
+            pool_kwargs["server_settings"] = server_settings
+
+        cred_data = cred_data if isinstance(cred_data, dict) else {}
+        if cred_data.get("username"):
+            pool_kwargs["user"] = cred_data["username"]
+        if cred_data.get("password"):
+            pool_kwargs["password"] = cred_data["password"]
+        if target.dsn:
+            # asyncpg expects a plain postgresql:// URL without a +driver suffix
+            scheme, separator, rest = target.dsn.partition("://")
+            return await asyncpg.create_pool(
+                scheme.partition("+")[0] + separator + rest, **pool_kwargs
+            )
+        return await asyncpg.create_pool(
+            host=target.host or cred_data.get("host", "localhost"),
+            port=target.port or cred_data.get("port", 5432),
+            database=target.database or cred_data.get("database") or None,
+            **pool_kwargs,
+        )
+
+    def _import_asyncpg(self) -> Any:
+        """Import asyncpg for raw_driver mode."""
+        try:
+            import asyncpg
+        except ImportError:
+            self._raise_missing_dependency("asyncpg")
+        return asyncpg
+
+    async def _resolve_credential_data(self) -> Any:
+        """Resolve connection data from the configured credential, if any."""
+        if not (self.credential_registry and self.config.credentials):
+            return None
+        # credentials can be a string ID or a credential config (legacy)
+        if isinstance(self.config.credentials, str):
+            cred_id = self.config.credentials
+        else:
+            # Legacy: credentials is a config object, not supported with registry
+            raise ValueError("Credential configs not supported with registry")
+        self._credential = self.credential_registry.get_credential(
+            cred_id,
+            cloud_provider="generic",
+        )
+        return await self._credential.get_connection()
 
     async def _create_engine(self) -> AsyncEngine:
         """Create SQL engine using credential from registry."""
+        sa = _ensure_sqlalchemy()
         target = self.sql_config
 
-        # Separate SQLAlchemy engine options from connection options
-        engine_options = {"echo", "pool_size", "pool_recycle", "max_overflow", "pool_timeout"}
-        connect_args: dict[str, Any] = {
-            k: v for k, v in (target.options or {}).items() if k not in engine_options
-        }
-        engine_kwargs: dict[str, Any] = {
-            k: v for k, v in (target.options or {}).items() if k in engine_options
-        }
+        # Separate SQLAlchemy engine options from connection options in one pass
+        connect_args: dict[str, Any] = {}
+        engine_kwargs: dict[str, Any] = {}
+        for option, value in (target.options or {}).items():
+            (engine_kwargs if option in _ENGINE_OPTIONS else connect_args)[option] = value
+        engine_kwargs.setdefault("pool_pre_ping", True)
+        min_pool_size = int(engine_kwargs.pop("min_pool_size", 0))
 
         # Get credential from registry
-        if self.credential_registry and self.config.credentials:
-            # credentials can be a string ID or a credential config (legacy)
-            if isinstance(self.config.credentials, str):
-                cred_id = self.config.credentials
-            else:
-                # Legacy: credentials is a config object, not supported with registry
-                raise ValueError("Credential configs not supported with registry")
-            self._credential = self.credential_registry.get_credential(
-                cred_id,
-                cloud_provider="generic",
-            )
-            cred_data = await self._credential.get_connection()
-        else:
-            cred_data = None
+        cred_data = await self._resolve_credential_data()
 
         # Build connection URL
         url = self._build_url(target, cred_data)
@@ -128,17 +489,60 @@ class SQLQueryProvider(BaseQueryProvider):
         if isinstance(cred_data, dict) and "token" in cred_data:
             connect_args.setdefault("access_token", cred_data["token"])
 
-        engine = create_async_engine(
-            url, connect_args=connect_args, pool_pre_ping=True, **engine_kwargs
-        )
-        self._sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+        parsed_url = sa.engine.make_url(url)
+        if issubclass(parsed_url.get_dialect().get_pool_class(parsed_url), sa.pool.QueuePool):
+            for option, value in _QUEUE_POOL_DEFAULTS.items():
+                engine_kwargs.setdefault(option, value)
+
+        key = repr((url, sorted(connect_args.items()), sorted(engine_kwargs.items())))
+        engine = _ENGINE_POOL.get(key)
+        created = engine is None
+        if engine is None:
+            engine = _ENGINE_POOL[key] = sa.ext.asyncio.create_async_engine(
+                url, connect_args=connect_args, **engine_kwargs
+            )
+        _ENGINE_REFS[key] = _ENGINE_REFS.get(key, 0) + 1
+        self._pool_key = key
+        self._sessionmaker = sa.ext.asyncio.async_sessionmaker(bind=engine, expire_on_commit=False)
+        if created and min_pool_size > 0:
+            await self._prefill_pool(engine, min_pool_size)
         return engine
 
+    @staticmethod
+    async def _prefill_pool(engine: AsyncEngine, size: int) -> None:
+        """Open ``size`` connections and return them to the pool (best effort).
+
+        Avoids every query of the first burst paying for a new connection.
+        """
+        results = await asyncio.gather(
+            *(engine.connect() for _ in range(size)), return_exceptions=True
+        )
+        failures = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                failures += 1
+            else:
+                await result.close()
+        if failures:
+            _LOGGER.warning("Could not prefill %d of %d SQL pool connection(s)", failures, size)
+
+    @staticmethod
+    async def _release_engine(key: str) -> None:
+        """Drop one reference to a pooled engine, disposing it on the last release."""
+        remaining = _ENGINE_REFS.get(key, 0) - 1
+        if remaining > 0:
+            _ENGINE_REFS[key] = remaining
+            return
+        _ENGINE_REFS.pop(key, None)
+        engine = _ENGINE_POOL.pop(key, None)
+        if engine is not None:
+            await engine.dispose()
+
     def _build_url(self, target, cred_data) -> str:
         """Build SQLAlchemy connection URL."""
-        # If DSN is provided, use it directly
+        # If DSN is provided, use it directly (the config model already holds a str)
         if target.dsn:
-            return str(target.dsn)
+            return target.dsn
 
         # Otherwise construct from individual components
         driver = target.driver or "postgresql+asyncpg"
@@ -149,13 +553,54 @@ class SQLQueryProvider(BaseQueryProvider):
         password = cred_data.get("password", "")
 
         return str(
-            URL.create(
+            _ensure_sqlalchemy().engine.URL.create(
                 drivername=driver,
                 username=username,
                 password=password,
                 host=host,
                 port=port,
                 database=database,
-                query=target.options or {},
+                query={
+                    option: value
+                    for option, value in (target.options or {}).items()
+                    if option not in _ENGINE_OPTIONS
+                },
             )
         )
+
+
+def _compile_text(statement_text: str) -> Any:
+    """Get the ``TextClause`` for a statement, reusing it for repeated statements."""
+    if len(statement_text) > _TEXT_CACHE_MAX_STATEMENT_CHARS:
+        return _ensure_sqlalchemy().text(statement_text)
+    return _compile_text_cached(statement_text)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_text_cached(statement_text: str) -> Any:
+    """Parse bind parameters once per distinct statement (TextClause is immutable)."""
+    return _ensure_sqlalchemy().text(statement_text)
+
+
+@functools.lru_cache(maxsize=256)
+def _to_asyncpg(statement_text: str) -> tuple[str, tuple[str, ...]]:
+    """Rewrite ``:name`` parameters to asyncpg's ``$n`` and return the names in order."""
+    names: dict[str, int] = {}
+
+    def _number(match: re.Match[str]) -> str:
+        return f"${names.setdefault(match.group(1), len(names) + 1)}"
+
+    statement = _NAMED_PARAM.sub(_number, statement_text).replace("\\:", ":")
+    return statement, tuple(names)
+
+
+def _positional_args(names: tuple[str, ...], params: Any) -> tuple[Any, ...]:
+    """Order named parameter values for ``$n`` placeholders; sequences pass through."""
+    if not params:
+        return ()
+    if not isinstance(params, Mapping):
+        return tuple(params)
+    try:
+        return tuple(params[name] for name in names)
+    except KeyError as exc:
+        raise ProviderExecutionError(f"Missing SQL parameter: {exc.args[0]}") from exc
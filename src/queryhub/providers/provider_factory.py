@@ -5,7 +5,10 @@ This factory creates providers and injects the credential registry.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
 
 from ..core.errors import ProviderNotFoundError
 from .base_query_provider import BaseQueryProvider
@@ -34,41 +37,40 @@ def create_provider(
     Raises:
         ProviderNotFoundError: If provider type is unsupported
     """
-    provider_type = config.type
+    return get_provider_class(config.type)(config, credential_registry)
 
-    # Map provider types to their implementations
-    provider_map = {
-        "adx": ("azure.resources.adx", "ADXQueryProvider"),
-        "sql": ("generic.resources.sql", "SQLQueryProvider"),
-        "rest": ("generic.resources.rest", "RESTQueryProvider"),
-        "csv": ("generic.resources.csv", "CSVQueryProvider"),
-        # Future: s3, athena, bigquery, etc.
-    }
 
-    if provider_type not in provider_map:
+def get_provider_class(provider_type: str) -> type[BaseQueryProvider]:
+    """Get the provider class implementing a provider type.
+
+    Raises:
+        ProviderNotFoundError: If provider type is unsupported
+    """
+    if provider_type not in _PROVIDER_CLASSES:
         raise ProviderNotFoundError(
             f"Unsupported provider type: {provider_type}. "
-            f"Supported types: {', '.join(provider_map.keys())}"
+            f"Supported types: {_SUPPORTED_TYPES}"
         )
+    return _provider_class(provider_type)
 
-    module_path, class_name = provider_map[provider_type]
 
+@functools.cache
+def _provider_class(provider_type: str) -> type[BaseQueryProvider]:
+    """Resolve a provider class, importing its module on first use only."""
+    module_path, class_name = _PROVIDER_CLASSES[provider_type]
     # Dynamic import to avoid circular dependencies
-    if provider_type == "adx":
-        from .azure.resources.adx import ADXQueryProvider
-
-        return ADXQueryProvider(config, credential_registry)
-    elif provider_type == "sql":
-        from .generic.resources.sql import SQLQueryProvider
-
-        return SQLQueryProvider(config, credential_registry)
-    elif provider_type == "rest":
-        from .generic.resources.rest import RESTQueryProvider
+    module = importlib.import_module(f".{module_path}", __package__)
+    return getattr(module, class_name)  # type: ignore[no-any-return]
 
-        return RESTQueryProvider(config, credential_registry)
-    elif provider_type == "csv":
-        from .generic.resources.csv import CSVQueryProvider
 
-        return CSVQueryProvider(config, credential_registry)
-    else:
-        raise ProviderNotFoundError(f"Provider type '{provider_type}' not implemented yet")
+# Map provider types to their implementations (module relative to this package, class name)
+_PROVIDER_CLASSES: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "adx": ("azure.resources.adx", "ADXQueryProvider"),
+        "sql": ("generic.resources.sql", "SQLQueryProvider"),
+        "rest": ("generic.resources.rest", "RESTQueryProvider"),
+        "csv": ("generic.resources.csv", "CSVQueryProvider"),
+        # Future: s3, athena, bigquery, etc.
+    }
+)
+_SUPPORTED_TYPES = ", ".join(_PROVIDER_CLASSES)
@@ -4,18 +4,40 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
+# Compiled templates kept in memory; Jinja's default of 50 evicts report
+# templates in larger deployments.
+_TEMPLATE_CACHE_SIZE = 400
 
-def build_environment(templates_dir: Path, *, auto_reload: bool = False) -> Environment:
-    """Create a configured Jinja2 environment."""
+
+def build_environment(
+    templates_dir: Path,
+    *,
+    auto_reload: bool = False,
+    cache_dir: Path | None = None,
+) -> Environment:
+    """Create a configured Jinja2 environment.
+
+    Args:
+        templates_dir: Directory templates are loaded from
+        auto_reload: Check templates for changes on every load
+        cache_dir: Optional directory for compiled template bytecode, so new
+                   processes skip lexing and parsing unchanged templates
+    """
 
     loader = FileSystemLoader(str(templates_dir))
+    bytecode_cache = None
+    if cache_dir is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(cache_dir), "__jinja2_%s.cache")
     env = Environment(
         loader=loader,
         autoescape=select_autoescape(enabled_extensions=("html", "xml")),
         enable_async=True,
         auto_reload=auto_reload,
+        cache_size=_TEMPLATE_CACHE_SIZE,
+        bytecode_cache=bytecode_cache,
     )
     env.trim_blocks = True
     env.lstrip_blocks = True
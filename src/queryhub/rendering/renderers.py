@@ -2,14 +2,95 @@
 
 from __future__ import annotations
 
+import base64
+import functools
 import html
+import json
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Any, Iterable, Mapping
 
+from jinja2 import Environment, Template, TemplateSyntaxError, UndefinedError
+
 from ..config.models import ComponentRenderConfig, ComponentRendererType, QueryComponentConfig
 from ..core.errors import RenderingError
 from ..providers.base_query_provider import QueryResult
 
+# Cell and row separators used to escape a whole table in one html.escape
+# call; control characters that never need to survive in rendered HTML
+_CELL_SEP = "\x00"
+_ROW_SEP = "\x01"
+
+
+def _render_rows(cells: list[str], width: int, tag: str) -> str:
+    """Render row-major cell text, ``width`` cells per row, as escaped ``<tr>`` elements.
+
+    The cells and separator characters are interleaved and joined once, escaped
+    together, and the separators then replaced with markup. If any cell
+    contains a separator character, each cell is escaped on its own instead.
+    """
+    if not cells:
+        return ""
+    row_count = len(cells) // width
+    parts = [""] * (2 * len(cells))
+    parts[0::2] = cells
+    parts[1::2] = ([_CELL_SEP] * (width - 1) + [_ROW_SEP]) * row_count
+    parts.pop()
+    joined = "".join(parts)
+    if (
+        joined.count(_CELL_SEP) != row_count * (width - 1)
+        or joined.count(_ROW_SEP) != row_count - 1
+    ):
+        parts = []
+        append = parts.append
+        for index, cell in enumerate(cells):
+            if not index % width:
+                append("</tr><tr>" if index else "<tr>")
+            append(f"<{tag}>{html.escape(cell)}</{tag}>")
+        append("</tr>")
+        return "".join(parts)
+    body = (
+        html.escape(joined)
+        .replace(_CELL_SEP, f"</{tag}><{tag}>")
+        .replace(_ROW_SEP, f"</{tag}></tr><tr><{tag}>")
+    )
+    return f"<tr><{tag}>{body}</{tag}></tr>"
+
+
+# Same defaults as jinja2.Template(source), shared so compiled templates can be cached
+_HTML_TEMPLATE_ENV = Environment()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_html_template(source: str) -> Template:
+    """Compile an HtmlRenderer template once per distinct source."""
+    return _HTML_TEMPLATE_ENV.from_string(source)
+
+
+@functools.cache
+def _plotly() -> tuple[Any, Any]:
+    """Return ``(plotly.express, plotly.io)``, imported on first chart render.
+
+    Plotly stays lazy because importing it costs tens of milliseconds.
+    """
+    try:
+        import plotly.express as px  # type: ignore[import-untyped]
+        import plotly.io as pio  # type: ignore[import-untyped]
+    except ImportError as exc:
+        raise RenderingError("Plotly dependency missing. Install the 'charts' extra.") from exc
+    return px, pio
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(path: str) -> tuple[tuple[str, int | None], ...]:
+    """Split a dotted path once into (mapping key, list index or None) segments.
+
+    Only plain decimal segments are list indices; negative ones never matched.
+    """
+    return tuple(
+        (segment, int(segment) if segment.isdecimal() else None) for segment in path.split(".")
+    )
+
 
 class ComponentRenderer(ABC):
     """Transform a query result into HTML (Strategy Pattern)."""
@@ -32,11 +113,17 @@ class DataExtractor:
 
     @staticmethod
     def ensure_rows(data: Any) -> list[Mapping[str, Any]]:
-        """Ensure data is in list-of-dict format."""
+        """Ensure data is in list-of-dict format.
+
+        A list that already holds plain dicts is returned as-is, without
+        copying; renderers treat rows as read-only and must not mutate them.
+        """
         if data is None:
             return []
         if isinstance(data, list):
-            if not data or isinstance(data[0], Mapping):
+            if not data or type(data[0]) is dict:
+                return data
+            if isinstance(data[0], Mapping):
                 return [dict(item) for item in data]
         if isinstance(data, Iterable) and not isinstance(data, (str, bytes)):
             rows: list[Mapping[str, Any]] = []
@@ -46,6 +133,17 @@ class DataExtractor:
             return rows
         return []
 
+    @classmethod
+    def result_rows(cls, result: QueryResult) -> list[Mapping[str, Any]]:
+        """Get list-of-dict rows from a result, expanding columnar data."""
+        if result.columnar:
+            if not isinstance(result.data, Mapping):
+                # Arrow tables and similar columnar containers
+                return result.data.to_pylist()
+            columns = list(result.data)
+            return [dict(zip(columns, values)) for values in zip(*result.data.values())]
+        return cls.ensure_rows(result.data)
+
     @staticmethod
     def extract_columns(
         data: list[Mapping[str, Any]], specified_columns: list[str] | None = None
@@ -61,18 +159,13 @@ class DataExtractor:
     def traverse_path(data: Any, path: str) -> Any:
         """Traverse nested data structure by path."""
         current = data
-        for segment in path.split("."):
+        for key, index in _compile_path(path):
             if isinstance(current, Mapping):
-                current = current.get(segment)
+                current = current.get(key)
             elif isinstance(current, list):
-                try:
-                    index = int(segment)
-                    if 0 <= index < len(current):
-                        current = current[index]
-                    else:
-                        return None
-                except ValueError:
+                if index is None or not 0 <= index < len(current):
                     return None
+                current = current[index]
             else:
                 return None
         return current
@@ -86,7 +179,7 @@ class TableRenderer(ComponentRenderer):
 
     def render(self, component: QueryComponentConfig, result: QueryResult) -> str:
         """Render tabular data as HTML table."""
-        records = self._extractor.ensure_rows(result.data)
+        records = self._extractor.result_rows(result)
         if not records:
             return self._render_empty_state("No data available", "component-table")
 
@@ -113,16 +206,16 @@ class TableRenderer(ComponentRenderer):
 
     def _build_header(self, columns: list[str]) -> str:
         """Build table header row."""
-        cells = "".join(f"<th>{self._escape(col)}</th>" for col in columns)
-        return f"<tr>{cells}</tr>"
+        if not columns:
+            return "<tr></tr>"
+        return _render_rows([str(col) for col in columns], len(columns), "th")
 
     def _build_body(self, records: list[Mapping[str, Any]], columns: list[str]) -> str:
         """Build table body rows."""
-        rows = []
-        for row in records:
-            cells = "".join(f"<td>{self._escape(row.get(col, ''))}</td>" for col in columns)
-            rows.append(f"<tr>{cells}</tr>")
-        return "".join(rows)
+        if not columns:
+            return "<tr></tr>" * len(records)
+        cells = [str(row.get(col, "")) for row in records for col in columns]
+        return _render_rows(cells, len(columns), "td")
 
 
 class ChartRenderer(ComponentRenderer):
@@ -134,7 +227,7 @@ class ChartRenderer(ComponentRenderer):
 
     def render(self, component: QueryComponentConfig, result: QueryResult) -> str:
         """Render data as interactive chart or static image for email."""
-        records = self._extractor.ensure_rows(result.data)
+        records = self._extractor.result_rows(result)
         if not records:
             return self._render_empty_state("No chart data available", "component-chart")
 
@@ -167,11 +260,7 @@ class ChartRenderer(ComponentRenderer):
         title: str | None,
     ) -> Any:
         """Create Plotly chart figure."""
-        try:
-            import plotly.express as px  # type: ignore[import-untyped]
-        except ImportError as exc:
-            raise RenderingError("Plotly dependency missing. Install the 'charts' extra.") from exc
-
+        px = _plotly()[0]
         chart_func = getattr(px, chart_type, None)
         if chart_func is None:
             raise RenderingError(f"Unsupported chart type: {chart_type}")
@@ -182,8 +271,7 @@ class ChartRenderer(ComponentRenderer):
     def _figure_to_static_html(self, figure: Any, title: str | None) -> str:
         """Convert Plotly figure to static image embedded in HTML."""
         try:
-            import plotly.io as pio  # type: ignore[import-untyped]
-            import base64
+            pio = _plotly()[1]
 
             # Export figure as PNG image
             img_bytes = pio.to_image(figure, format="png", width=800, height=500)
@@ -192,8 +280,9 @@ class ChartRenderer(ComponentRenderer):
             img_base64 = base64.b64encode(img_bytes).decode("utf-8")
 
             # Create HTML with embedded image
-            title_html = f"<h3>{self._escape(title or 'Chart')}</h3>" if title else ""
-            return f'{title_html}<img src="data:image/png;base64,{img_base64}" alt="{self._escape(title or "Chart")}" style="max-width: 100%; height: auto;" />'
+            escaped_title = self._escape(title or "Chart")
+            title_html = f"<h3>{escaped_title}</h3>" if title else ""
+            return f'{title_html}<img src="data:image/png;base64,{img_base64}" alt="{escaped_title}" style="max-width: 100%; height: auto;" />'
         except Exception as exc:
             raise RenderingError(f"Failed to generate static chart image: {exc}") from exc
 
@@ -207,11 +296,10 @@ class TextRenderer(ComponentRenderer):
     def render(self, component: QueryComponentConfig, result: QueryResult) -> str:
         """Render text content with optional templating."""
         options = component.render.options
-        value = self._extract_value(result.data, options)
+        data = self._extractor.result_rows(result) if result.columnar else result.data
+        value = self._extract_value(data, options)
 
         if isinstance(value, (dict, list)):
-            import json
-
             value = json.dumps(value, indent=2)
 
         body = self._format_text(value, options)
@@ -243,7 +331,10 @@ class TextRenderer(ComponentRenderer):
 
     def _format_text(self, value: Any, options: Mapping[str, Any]) -> str:
         """Format text using template."""
-        template = options.get("template", "{value}")
+        template = options.get("template")
+        if template is None or template == "{value}":
+            # The default template is the value itself; skip the format parser
+            return str(value)
         try:
             # Escape any dollar signs that aren't part of format specs
             # Then apply the format
@@ -262,8 +353,6 @@ class HtmlRenderer(ComponentRenderer):
 
     def render(self, component: QueryComponentConfig, result: QueryResult) -> str:
         """Render custom HTML content with Jinja2 templating."""
-        from jinja2 import Template, TemplateSyntaxError, UndefinedError
-
         options = component.render.options
         template_str = options.get("template", "")
 
@@ -271,7 +360,7 @@ class HtmlRenderer(ComponentRenderer):
             return self._render_empty_state("No HTML template provided", "component-html")
 
         # Prepare data for template
-        records = self._extractor.ensure_rows(result.data)
+        records = self._extractor.result_rows(result)
 
         # If there's a single row and data is expected to be extracted, provide both
         context = {
@@ -284,7 +373,7 @@ class HtmlRenderer(ComponentRenderer):
             context.update(records[0])
 
         try:
-            template = Template(template_str)
+            template = _compile_html_template(template_str)
             rendered_html = template.render(**context)
             title = self._escape(component.title or component.id)
 
@@ -305,6 +394,8 @@ class RendererRegistry:
         self, renderers: Mapping[ComponentRendererType, ComponentRenderer] | None = None
     ) -> None:
         self._renderers: dict[ComponentRendererType, ComponentRenderer] = dict(renderers or {})
+        # Bound once; register() mutates the same dict so this never goes stale
+        self._lookup = self._renderers.__getitem__
 
     def register(self, renderer_type: ComponentRendererType, renderer: ComponentRenderer) -> None:
         """Register a renderer for a type."""
@@ -312,21 +403,34 @@ class RendererRegistry:
 
     def resolve(self, render_config: ComponentRenderConfig) -> ComponentRenderer:
         """Resolve renderer by configuration."""
-        renderer = self._renderers.get(render_config.type)
-        if renderer is None:
-            raise RenderingError(f"Renderer for type {render_config.type} not registered")
-        return renderer
+        try:
+            return self._lookup(render_config.type)
+        except KeyError:
+            raise RenderingError(
+                f"Renderer for type {render_config.type} not registered"
+            ) from None
+
+
+@functools.lru_cache(maxsize=2)
+def _default_renderers(email_mode: bool) -> Mapping[ComponentRendererType, ComponentRenderer]:
+    """Build the stateless built-in renderers once per email mode."""
+    return MappingProxyType(
+        {
+            ComponentRendererType.TABLE: TableRenderer(),
+            ComponentRendererType.CHART: ChartRenderer(email_mode=email_mode),
+            ComponentRendererType.TEXT: TextRenderer(),
+            ComponentRendererType.HTML: HtmlRenderer(),
+        }
+    )
 
 
 def create_default_renderer_registry(email_mode: bool = False) -> RendererRegistry:
     """Return a renderer registry populated with built-in renderers.
 
+    The built-in renderer instances are shared; each call still returns a new
+    registry, so registering custom renderers does not affect other callers.
+
     Args:
         email_mode: If True, charts will be rendered as static images for email compatibility.
     """
-    registry = RendererRegistry()
-    registry.register(ComponentRendererType.TABLE, TableRenderer())
-    registry.register(ComponentRendererType.CHART, ChartRenderer(email_mode=email_mode))
-    registry.register(ComponentRendererType.TEXT, TextRenderer())
-    registry.register(ComponentRendererType.HTML, HtmlRenderer())
-    return registry
+    return RendererRegistry(_default_renderers(email_mode))
@@ -29,6 +29,7 @@ class QueryHubApplicationBuilder:
         config_dir: Path,
         templates_dir: Path,
         auto_reload_templates: bool = False,
+        template_cache_dir: Path | None = None,
         email_mode: bool = False,
         config_loader: ConfigLoaderProtocol | None = None,
         provider_factory: ProviderFactoryProtocol | None = None,
@@ -38,6 +39,7 @@ class QueryHubApplicationBuilder:
         self._config_dir = Path(config_dir)
         self._templates_dir = Path(templates_dir)
         self._auto_reload_templates = auto_reload_templates
+        self._template_cache_dir = template_cache_dir
         self._email_mode = email_mode
         self._config_loader = config_loader
         self._provider_factory = provider_factory
@@ -73,6 +75,8 @@ class QueryHubApplicationBuilder:
 
     def _build_template_engine(self) -> ReportTemplateEngine:
         environment = build_environment(
-            self._templates_dir, auto_reload=self._auto_reload_templates
+            self._templates_dir,
+            auto_reload=self._auto_reload_templates,
+            cache_dir=self._template_cache_dir,
         )
         return JinjaReportTemplateEngine(environment)
@@ -44,24 +44,32 @@ class ProviderResolver:
     def __init__(self, provider_factory: ProviderFactoryProtocol) -> None:
         self._factory = provider_factory
         self._providers: dict[str, BaseQueryProvider] = {}
-        self._lock = asyncio.Lock()
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
 
     async def get_provider(self, provider_id: str) -> BaseQueryProvider:
-        """Get or create a provider instance (thread-safe lazy loading)."""
-        if provider_id in self._providers:
-            _LOGGER.debug("Using cached provider: %s", provider_id)
-            return self._providers[provider_id]
-
-        async with self._lock:
-            if provider_id in self._providers:
-                return self._providers[provider_id]
-
-            _LOGGER.debug("Initializing new provider: %s", provider_id)
-            provider = self._factory.create(provider_id)
-            self._providers[provider_id] = provider
-            _LOGGER.info("Provider initialized: %s", provider_id)
+        """Get or create a provider instance (lazy, created once per id).
+
+        The factory is synchronous, so the check and the insert run without
+        yielding to the event loop; concurrent callers cannot create the same
+        provider twice and no lock is needed.
+        """
+        provider = self._providers.get(provider_id)
+        if provider is not None:
             return provider
 
+        _LOGGER.debug("Initializing new provider: %s", provider_id)
+        provider = self._factory.create(provider_id)
+        self._semaphores[provider_id] = asyncio.Semaphore(
+            getattr(provider.config, "max_concurrency", 8)
+        )
+        self._providers[provider_id] = provider
+        _LOGGER.info("Provider initialized: %s", provider_id)
+        return provider
+
+    def get_semaphore(self, provider_id: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent queries against a resolved provider."""
+        return self._semaphores[provider_id]
+
     async def close_all(self) -> None:
         """Close all managed providers."""
         _LOGGER.debug("Closing %d provider connection(s)", len(self._providers))
@@ -100,8 +108,11 @@ class ComponentExecutor:
 
         try:
             provider = await self._provider_resolver.get_provider(component.provider_id)
-            _LOGGER.debug("Executing query for component: %s", component.id)
-            result, attempts = await self._execute_query_with_retry(component, provider)
+            # Bound in-flight queries per provider so large reports do not
+            # exhaust its connection pool; other providers run in parallel
+            async with self._provider_resolver.get_semaphore(component.provider_id):
+                _LOGGER.debug("Executing query for component: %s", component.id)
+                result, attempts = await self._execute_query_with_retry(component, provider)
             _LOGGER.info(
                 "Component '%s' query completed successfully (attempts=%d, rows=%s)",
                 component.id,
@@ -161,15 +172,23 @@ class ComponentExecutor:
                 provider.config, "default_timeout_seconds", 30.0
             )
 
+            if timeout:
+                _LOGGER.debug("Executing query with timeout: %.2fs", timeout)
             try:
-                if timeout:
-                    _LOGGER.debug("Executing query with timeout: %.2fs", timeout)
-                    return await asyncio.wait_for(
-                        provider.execute(component.query),
-                        timeout=timeout,
-                    )
-                return await provider.execute(component.query)
-            except asyncio.TimeoutError as exc:
+                # Cancels the query in this task on expiry; unlike wait_for it
+                # does not wrap each attempt in a separate Task
+                async with asyncio.timeout(timeout or None):
+                    if provider.supports_batch:
+                        # Batching providers coalesce components that query
+                        # them together, within this component's time budget
+                        result = await provider.submit(component.query, timeout=timeout)
+                    else:
+                        result = await provider.execute(component.query)
+                    # Renderers work on complete data, so drain streamed rows
+                    # here; fetching them is part of the query's time budget
+                    # and of the attempt that gets retried
+                    return await result.collect()
+            except TimeoutError as exc:
                 _LOGGER.warning(
                     "Component '%s' timed out after %.2fs",
                     component.id,
@@ -68,6 +68,7 @@ class ReportExecutor:
         *,
         templates_dir: Path | str,
         auto_reload_templates: bool = False,
+        template_cache_dir: Path | str | None = None,
         email_mode: bool = False,
     ) -> "ReportExecutor":
         """Factory method for creating executor from config directory.
@@ -76,6 +77,7 @@ class ReportExecutor:
             config_dir: Path to configuration directory
             templates_dir: Path to templates directory
             auto_reload_templates: If True, reload templates on each render
+            template_cache_dir: Optional directory for compiled template bytecode
             email_mode: If True, render charts as static images for email compatibility
         """
         from .application import QueryHubApplicationBuilder
@@ -84,6 +86,7 @@ class ReportExecutor:
             config_dir=Path(config_dir),
             templates_dir=Path(templates_dir),
             auto_reload_templates=auto_reload_templates,
+            template_cache_dir=Path(template_cache_dir) if template_cache_dir else None,
             email_mode=email_mode,
         )
         return await builder.create_executor()
@@ -0,0 +1,469 @@
+"""Tests for the ADX query provider using an in-memory Kusto client."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+import pytest
+
+from queryhub.config.models import CredentialType, DefaultCredentialConfig
+from queryhub.config.provider_models import ProviderConfig
+from queryhub.core.credentials import CredentialRegistry
+from queryhub.core.errors import ProviderExecutionError
+from queryhub.providers.azure.resources import adx as adx_module
+from queryhub.providers.azure.resources.adx import ADXQueryProvider
+
+
+class _Row:
+    """Mimic a Kusto result row: iterates values, indexable by column name."""
+
+    def __init__(self, columns: list[str], values: list[Any]) -> None:
+        self._columns = columns
+        self._values = values
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, int):
+            return self._values[key]
+        return self._values[self._columns.index(key)]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class _Table:
+    def __init__(self, columns: list[str], rows: list[list[Any]]) -> None:
+        self.columns = [SimpleNamespace(column_name=name) for name in columns]
+        self._rows = [_Row(columns, values) for values in rows]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class _FakeClient:
+    def __init__(self, tables: list[_Table]) -> None:
+        self.tables = tables
+        self.calls: list[str] = []
+
+    async def execute(self, database: str, query: str, properties: Any = None) -> Any:
+        self.calls.append(query)
+        return SimpleNamespace(
+            primary_results=self.tables[: query.count(";") + 1],
+            execution_time=0.1,
+            request_id="req-1",
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+def _build_provider(client: _FakeClient, **adx_options: Any) -> ADXQueryProvider:
+    config = ProviderConfig.model_validate(
+        {
+            "id": "adx_test",
+            "resource": {
+                "adx": {
+                    "cluster_uri": "https://test.kusto.windows.net",
+                    "database": "Samples",
+                    **adx_options,
+                }
+            },
+        }
+    )
+    provider = ADXQueryProvider(config)
+    provider._client = client
+    provider._build_client_properties = lambda query: None  # type: ignore[method-assign]
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_rows() -> None:
+    client = _FakeClient([_Table(["name", "total"], [["alpha", 42], ["beta", 7]])])
+    provider = _build_provider(client)
+
+    result = await provider.execute({"text": "Metrics"})
+
+    assert result.data == [{"name": "alpha", "total": 42}, {"name": "beta", "total": 7}]
+    assert result.metadata["request_id"] == "req-1"
+
+
+@pytest.mark.asyncio
+async def test_execute_single_and_empty_results() -> None:
+    single = _build_provider(_FakeClient([_Table(["name"], [["alpha"]])]))
+    empty = _build_provider(_FakeClient([_Table(["name"], [])]))
+
+    assert (await single.execute({"text": "Metrics | take 1"})).data == [{"name": "alpha"}]
+    assert (await empty.execute({"text": "Metrics | take 0"})).data == []
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_yields_rows_lazily() -> None:
+    client = _FakeClient([_Table(["name", "total"], [["alpha", 42], ["beta", 7]])])
+    provider = _build_provider(client)
+
+    result = await provider.execute({"text": "Metrics", "stream": True})
+
+    assert result.is_streaming
+    assert [row async for row in result.data] == [
+        {"name": "alpha", "total": 42},
+        {"name": "beta", "total": 7},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_collect_materializes_streamed_rows() -> None:
+    client = _FakeClient([_Table(["name"], [["alpha"], ["beta"]])])
+    provider = _build_provider(client)
+
+    result = await (await provider.execute({"text": "Metrics", "stream": True})).collect()
+
+    assert not result.is_streaming
+    assert result.data == [{"name": "alpha"}, {"name": "beta"}]
+
+
+@pytest.mark.asyncio
+async def test_execute_columnar() -> None:
+    client = _FakeClient([_Table(["name", "total"], [["alpha", 42], ["beta", 7]])])
+    provider = _build_provider(client)
+
+    result = await provider.execute({"text": "Metrics", "columnar": True})
+
+    assert result.columnar
+    assert result.data == {"name": ["alpha", "beta"], "total": [42, 7]}
+
+
+@pytest.mark.asyncio
+async def test_execute_arrow_format() -> None:
+    pa = pytest.importorskip("pyarrow")
+    client = _FakeClient([_Table(["name", "total"], [["alpha", 42], ["beta", 7]])])
+    provider = _build_provider(client)
+
+    result = await provider.execute({"text": "Metrics", "format": "arrow"})
+
+    assert isinstance(result.data, pa.Table)
+    assert result.columnar is True
+    assert result.data.to_pylist() == [
+        {"name": "alpha", "total": 42},
+        {"name": "beta", "total": 7},
+    ]
+
+
+class _FakeRequestProperties:
+    def __init__(self) -> None:
+        self.client_request_id: str | None = None
+        self.parameters: dict[str, Any] = {}
+        self.options: dict[str, Any] = {}
+
+    def set_parameter(self, name: str, value: Any) -> None:
+        self.parameters[name] = value
+
+    def set_option(self, name: str, value: Any) -> None:
+        self.options[name] = value
+
+
+def test_build_client_properties_from_query(monkeypatch) -> None:
+    monkeypatch.setattr(
+        adx_module, "_client_request_properties_cls", lambda: _FakeRequestProperties
+    )
+    provider = ADXQueryProvider(_build_provider(_FakeClient([])).config)
+    parsed = adx_module._ParsedADXQuery.parse(
+        {
+            "text": "Metrics",
+            "client_request_id": "abc",
+            "parameters": {"region": "eu"},
+            "options": {"truncationmaxrecords": 10},
+            "timeout_seconds": 60,
+        }
+    )
+
+    properties = provider._build_client_properties(parsed)
+
+    assert properties.client_request_id == "queryhub;abc"
+    assert properties.parameters == {"region": "eu"}
+    assert properties.options == {"servertimeout": "60s", "truncationmaxrecords": 10}
+
+
+def test_parse_requires_text() -> None:
+    with pytest.raises(ProviderExecutionError, match="require a 'text'"):
+        adx_module._ParsedADXQuery.parse({"parameters": {"a": 1}})
+
+
+class _HangingClient(_FakeClient):
+    async def execute(self, database: str, query: str, properties: Any = None) -> Any:
+        await asyncio.sleep(10)
+
+
+@pytest.mark.asyncio
+async def test_execute_enforces_client_deadline(monkeypatch) -> None:
+    monkeypatch.setattr(adx_module, "_CLIENT_TIMEOUT_GRACE_SECONDS", 0.0)
+    provider = _build_provider(_HangingClient([]))
+
+    with pytest.raises(ProviderExecutionError, match="exceeded timeout"):
+        await provider.execute({"text": "Metrics", "timeout_seconds": 0.01})
+
+
+@pytest.mark.asyncio
+async def test_execute_many_single_round_trip() -> None:
+    client = _FakeClient(
+        [_Table(["a"], [[1]]), _Table(["b"], [[2], [3]])],
+    )
+    provider = _build_provider(client)
+
+    results = await provider.execute_many([{"text": "A;"}, {"text": "B"}])
+
+    assert client.calls == ["A;\nB"]
+    assert [r.data for r in results] == [[{"a": 1}], [{"b": 2}, {"b": 3}]]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_result_count_mismatch() -> None:
+    client = _FakeClient([_Table(["a"], [[1]])])
+    provider = _build_provider(client)
+
+    with pytest.raises(ProviderExecutionError, match="1 result table"):
+        await provider.execute_many([{"text": "A"}, {"text": "B"}])
+
+
+@pytest.mark.asyncio
+async def test_submit_coalesces_concurrent_queries() -> None:
+    client = _FakeClient([_Table(["a"], [[1]]), _Table(["b"], [[2]])])
+    provider = _build_provider(client, batch_queries=True, batch_window_ms=50)
+
+    first, second = await asyncio.gather(
+        provider.submit({"text": "A"}),
+        provider.submit({"text": "B"}),
+    )
+
+    assert client.calls == ["A;\nB"]
+    assert first.data == [{"a": 1}]
+    assert second.data == [{"b": 2}]
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_queries_alone_unless_batching_enabled() -> None:
+    client = _FakeClient([_Table(["a"], [[1]])])
+    provider = _build_provider(client, batch_window_ms=50)
+
+    await asyncio.gather(provider.submit({"text": "A"}), provider.submit({"text": "B"}))
+
+    assert not provider.supports_batch
+    assert sorted(client.calls) == ["A", "B"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"text": ".show tables"},
+        {"text": "set notruncation;\nT | take 5"},
+        {"text": "declare query_parameters(n:int);\nT | take n"},
+        {"text": "T | take n", "parameters": {"n": 5}},
+        {"text": "T | take 5", "timeout_seconds": 120},
+    ],
+)
+async def test_submit_keeps_request_scoped_queries_out_of_batches(query: dict) -> None:
+    client = _FakeClient([_Table(["a"], [[1]])])
+    provider = _build_provider(client, batch_queries=True, batch_window_ms=50)
+
+    await asyncio.gather(provider.submit(query, timeout=60), provider.submit({"text": "A"}))
+
+    assert sorted(client.calls) == sorted([query["text"], "A"])
+
+
+@pytest.mark.asyncio
+async def test_submit_batches_only_queries_with_the_same_server_timeout() -> None:
+    client = _FakeClient([_Table(["a"], [[1]]), _Table(["b"], [[2]])])
+    provider = _build_provider(client, batch_queries=True, batch_window_ms=50)
+
+    await asyncio.gather(
+        provider.submit({"text": "A"}),
+        provider.submit({"text": "B"}),
+        provider.submit({"text": "C", "timeout_seconds": 10}),
+    )
+
+    assert sorted(client.calls) == ["A;\nB", "C"]
+
+
+class _RejectingClient(_FakeClient):
+    async def execute(self, database: str, query: str, properties: Any = None) -> Any:
+        if "Bad" in query:
+            self.calls.append(query)
+            raise RuntimeError("Semantic error")
+        return await super().execute(database, query, properties)
+
+
+@pytest.mark.asyncio
+async def test_submit_isolates_failing_query() -> None:
+    client = _RejectingClient([_Table(["a"], [[1]])])
+    provider = _build_provider(client, batch_queries=True, batch_window_ms=50)
+
+    good, bad = await asyncio.gather(
+        provider.submit({"text": "A"}),
+        provider.submit({"text": "Bad"}),
+        return_exceptions=True,
+    )
+
+    assert client.calls == ["A;\nBad", "A", "Bad"]
+    assert good.data == [{"a": 1}]
+    assert isinstance(bad, ProviderExecutionError)
+
+
+@pytest.mark.asyncio
+async def test_get_client_created_once_for_concurrent_callers(monkeypatch) -> None:
+    client = _FakeClient([])
+    provider = _build_provider(client)
+    provider._client = None
+    created: list[_FakeClient] = []
+
+    async def fake_create_client() -> _FakeClient:
+        await asyncio.sleep(0)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(provider, "_create_client", fake_create_client)
+
+    clients = await asyncio.gather(*(provider._get_client() for _ in range(5)))
+
+    assert created == [client]
+    assert all(c is client for c in clients)
+
+
+@pytest.mark.asyncio
+async def test_get_client_retries_after_failure(monkeypatch) -> None:
+    client = _FakeClient([])
+    provider = _build_provider(client)
+    provider._client = None
+    attempts = 0
+
+    async def flaky_create_client() -> _FakeClient:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("boom")
+        return client
+
+    monkeypatch.setattr(provider, "_create_client", flaky_create_client)
+
+    with pytest.raises(RuntimeError):
+        await provider._get_client()
+    assert await provider._get_client() is client
+
+
+def _adx_config_with_credentials() -> ProviderConfig:
+    return ProviderConfig.model_validate(
+        {
+            "id": "adx_test",
+            "credentials": "azure_cred",
+            "resource": {
+                "adx": {"cluster_uri": "https://test.kusto.windows.net", "database": "Samples"}
+            },
+        }
+    )
+
+
+def test_credential_resolved_at_construction() -> None:
+    registry = CredentialRegistry()
+    config = DefaultCredentialConfig(type=CredentialType.DEFAULT_CREDENTIALS)
+    registry.register("azure_cred", "azure", "default_credentials", config)
+
+    provider = ADXQueryProvider(_adx_config_with_credentials(), registry)
+
+    assert provider._credential is registry.get_credential("azure_cred")
+
+
+def test_credential_resolution_can_be_deferred() -> None:
+    registry = CredentialRegistry()
+
+    provider = ADXQueryProvider(_adx_config_with_credentials(), registry, eager=False)
+
+    assert provider._credential is None
+
+
+class _PooledKustoClient:
+    def __init__(self, kcsb: Any) -> None:
+        self.kcsb = kcsb
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _StubCredential:
+    def __init__(self) -> None:
+        self.connections = 0
+        self.closed = 0
+
+    async def get_connection(self, **context: Any) -> str:
+        self.connections += 1
+        await asyncio.sleep(0)
+        return context["cluster_uri"]
+
+    async def close(self) -> None:
+        self.closed += 1
+
+
+@pytest.fixture
+def pooled_kusto(monkeypatch) -> None:
+    kusto = ModuleType("azure.kusto")
+    kusto_data = ModuleType("azure.kusto.data")
+    kusto_aio = ModuleType("azure.kusto.data.aio")
+    kusto_aio.KustoClient = _PooledKustoClient  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "azure.kusto", kusto)
+    monkeypatch.setitem(sys.modules, "azure.kusto.data", kusto_data)
+    monkeypatch.setitem(sys.modules, "azure.kusto.data.aio", kusto_aio)
+
+
+def _pooled_provider(credential: _StubCredential) -> ADXQueryProvider:
+    provider = _build_provider(_FakeClient([]))
+    provider._client = None
+    provider._credential = credential  # type: ignore[assignment]
+    return provider
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("pooled_kusto")
+async def test_providers_share_pooled_client_until_last_close() -> None:
+    credential = _StubCredential()
+    first = _pooled_provider(credential)
+    second = _pooled_provider(credential)
+
+    client = await first._get_client()
+    assert await second._get_client() is client
+
+    await first.close()
+    assert not client.closed
+    assert credential.closed == 0
+    await second.close()
+    assert client.closed
+    assert credential.closed == 1
+
+
+@pytest.mark.usefixtures("pooled_kusto")
+def test_pooled_client_created_once_per_key_on_any_event_loop() -> None:
+    async def run() -> None:
+        credential = _StubCredential()
+        providers = [_pooled_provider(credential) for _ in range(3)]
+        # Same type and identity, but a different credential id in the registry
+        other_credential = _pooled_provider(_StubCredential())
+
+        clients = await asyncio.gather(*(p._get_client() for p in (*providers, other_credential)))
+
+        assert credential.connections == 1
+        assert clients[0] is clients[1] is clients[2]
+        assert clients[3] is not clients[0]
+        for provider in (*providers, other_credential):
+            await provider.close()
+        assert clients[0].closed and clients[3].closed
+        assert not adx_module._KUSTO_CLIENT_POOL
+
+    # Each CLI run uses a fresh event loop; nothing in the pool may bind to one
+    asyncio.run(run())
+    asyncio.run(run())
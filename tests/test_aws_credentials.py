@@ -0,0 +1,68 @@
+"""Tests for AWS credential strategies using a stub boto3 module."""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from queryhub.config.credential_models import AWSCredentialConfig
+from queryhub.providers.aws.credentials import AWSIAMRoleCredential
+
+
+class _StubBoto3:
+    """Record STS calls and hand out sessions with fake clients."""
+
+    def __init__(self, lifetime: timedelta) -> None:
+        self.lifetime = lifetime
+        self.assume_role_calls = 0
+
+    def client(self, service_name: str, region_name: str | None = None) -> Any:
+        return SimpleNamespace(assume_role=self._assume_role)
+
+    def _assume_role(self, **kwargs: Any) -> dict[str, Any]:
+        self.assume_role_calls += 1
+        return {
+            "Credentials": {
+                "AccessKeyId": "AKIA",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(tz=timezone.utc) + self.lifetime,
+            }
+        }
+
+    def Session(self, **kwargs: Any) -> Any:  # noqa: N802 - mirrors boto3 API
+        return SimpleNamespace(client=lambda service_name, region_name=None: service_name)
+
+
+def _role_credential() -> AWSIAMRoleCredential:
+    return AWSIAMRoleCredential(
+        AWSCredentialConfig(type="iam_role", role_arn="arn:aws:iam::123456789012:role/test")
+    )
+
+
+@pytest.mark.asyncio
+async def test_iam_role_reuses_credentials_until_expiry(monkeypatch) -> None:
+    stub = _StubBoto3(lifetime=timedelta(hours=1))
+    monkeypatch.setitem(sys.modules, "boto3", stub)
+    credential = _role_credential()
+
+    await credential.get_connection(service_name="s3")
+    await credential.get_connection(service_name="athena")
+
+    assert stub.assume_role_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_iam_role_refreshes_near_expiry(monkeypatch) -> None:
+    stub = _StubBoto3(lifetime=timedelta(seconds=30))
+    monkeypatch.setitem(sys.modules, "boto3", stub)
+    credential = _role_credential()
+
+    await credential.get_connection()
+    await credential.get_connection()
+
+    assert stub.assume_role_calls == 2
@@ -0,0 +1,101 @@
+"""Tests for Azure credential strategies."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from pydantic import SecretStr
+
+from queryhub.config.credential_models import AzureCredentialConfig
+from queryhub.core.errors import ProviderInitializationError
+from queryhub.providers.azure.credentials import AzureDefaultCredential, AzureTokenCredential
+
+
+def _token_credential() -> AzureTokenCredential:
+    return AzureTokenCredential(AzureCredentialConfig(type="token", token=SecretStr("secret")))
+
+
+@pytest.mark.asyncio
+async def test_kusto_connection_cached_per_cluster(monkeypatch) -> None:
+    """Test that the connection builder is created once per cluster."""
+    credential = _token_credential()
+    built: list[str] = []
+
+    def fake_build(cluster_uri: str) -> object:
+        built.append(cluster_uri)
+        return object()
+
+    monkeypatch.setattr(credential, "_build_kusto_connection", fake_build)
+
+    first = await credential.get_connection(cluster_uri="https://a.kusto.windows.net")
+    second = await credential.get_connection(cluster_uri="https://a.kusto.windows.net")
+    other = await credential.get_connection(cluster_uri="https://b.kusto.windows.net")
+
+    assert first is second
+    assert other is not first
+    assert built == ["https://a.kusto.windows.net", "https://b.kusto.windows.net"]
+
+
+@pytest.mark.asyncio
+async def test_kusto_connection_requires_cluster_uri() -> None:
+    """Test that a missing cluster_uri is rejected."""
+    credential = _token_credential()
+
+    with pytest.raises(ProviderInitializationError, match="cluster_uri is required"):
+        await credential.get_connection()
+
+
+class _FakeAzureCredential:
+    def __init__(self, lifetime: float) -> None:
+        self.lifetime = lifetime
+        self.calls = 0
+
+    async def get_token(self, scope: str) -> SimpleNamespace:
+        self.calls += 1
+        return SimpleNamespace(token=f"token-{self.calls}", expires_on=time.time() + self.lifetime)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_default_credential_reuses_fresh_token() -> None:
+    """Test that a token outside the refresh window is served from cache."""
+    credential = AzureDefaultCredential()
+    credential._azure_credential = _FakeAzureCredential(lifetime=3600)
+
+    assert await credential._get_token() == "token-1"
+    assert await credential._get_token() == "token-1"
+    assert credential._azure_credential.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_default_credential_refreshes_in_background() -> None:
+    """Test that a token near expiry is returned while a refresh runs."""
+    credential = AzureDefaultCredential()
+    credential._azure_credential = _FakeAzureCredential(lifetime=60)
+
+    assert await credential._get_token() == "token-1"
+    assert await credential._get_token() == "token-1"
+    refresh = credential._refresh_task
+    assert refresh is not None
+
+    await refresh
+    assert await credential._get_token() == "token-2"
+    await credential.close()
+
+
+@pytest.mark.asyncio
+async def test_default_credential_shares_inline_token_fetch() -> None:
+    """Test that concurrent callers without a valid token await one fetch."""
+    credential = AzureDefaultCredential()
+    credential._azure_credential = _FakeAzureCredential(lifetime=3600)
+
+    tokens = await asyncio.gather(*(credential._get_token() for _ in range(5)))
+
+    assert tokens == ["token-1"] * 5
+    assert credential._azure_credential.calls == 1
+    assert credential._token_fetch is None
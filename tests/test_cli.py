@@ -0,0 +1,52 @@
+"""Tests for CLI helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import ModuleType, SimpleNamespace
+
+from queryhub.cli import run_async
+
+
+async def _loop_type() -> type:
+    return type(asyncio.get_running_loop())
+
+
+def test_run_async_uses_uvloop_when_installed(monkeypatch) -> None:
+    class _UVLoop(asyncio.SelectorEventLoop):
+        pass
+
+    uvloop = ModuleType("uvloop")
+    uvloop.new_event_loop = _UVLoop  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+
+    assert run_async(_loop_type()) is _UVLoop
+
+
+def test_run_async_falls_back_to_asyncio(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert issubclass(run_async(_loop_type()), asyncio.AbstractEventLoop)
+
+
+def test_run_report_passes_template_cache_dir(monkeypatch, tmp_path) -> None:
+    from typer.testing import CliRunner
+
+    from queryhub import cli
+
+    received: list[object] = []
+
+    async def fake_run(report_folder, output_html, email, template_cache_dir=None):
+        received.append(template_cache_dir)
+        return SimpleNamespace(has_failures=False)
+
+    monkeypatch.setattr(cli, "_run_report_folder", fake_run)
+    cache_dir = tmp_path / "cache"
+
+    result = CliRunner().invoke(
+        cli.app, ["run-report", str(tmp_path), "--no-email", "--template-cache-dir", str(cache_dir)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert received == [cache_dir]
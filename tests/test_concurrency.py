@@ -0,0 +1,67 @@
+"""Tests for async concurrency helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from queryhub.core.concurrency import OnceAsync
+
+
+@pytest.mark.asyncio
+async def test_once_async_shares_one_creation() -> None:
+    """Test that concurrent callers share a single factory call."""
+    once: OnceAsync[object] = OnceAsync()
+    calls = 0
+
+    async def factory() -> object:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return object()
+
+    values = await asyncio.gather(*(once.call(factory) for _ in range(5)))
+
+    assert calls == 1
+    assert once.done
+    assert all(value is values[0] for value in values)
+    assert await once.call(factory) is values[0]
+
+
+@pytest.mark.asyncio
+async def test_once_async_retries_after_failure_and_reset() -> None:
+    """Test that failures are not cached and reset forces a new value."""
+    once: OnceAsync[int] = OnceAsync()
+    attempts = 0
+
+    async def factory() -> int:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("boom")
+        return attempts
+
+    with pytest.raises(RuntimeError):
+        await once.call(factory)
+    assert await once.call(factory) == 2
+
+    once.reset()
+    assert await once.call(factory) == 3
+
+
+@pytest.mark.asyncio
+async def test_once_async_survives_caller_cancellation() -> None:
+    """Test that a timed-out caller does not cancel creation for others."""
+    once: OnceAsync[str] = OnceAsync()
+    release = asyncio.Event()
+
+    async def factory() -> str:
+        await release.wait()
+        return "ready"
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(once.call(factory), timeout=0.01)
+    release.set()
+
+    assert await once.call(factory) == "ready"
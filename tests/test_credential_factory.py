@@ -43,6 +43,19 @@ def test_create_credential_generic_token() -> None:
     assert isinstance(credential, GenericTokenCredential)
 
 
+
+@pytest.mark.asyncio
+async def test_generic_token_secret_unwrapped_once() -> None:
+    """Test token credential returns the same unwrapped connection dict."""
+    config = TokenCredential(type=CredentialType.TOKEN, token=SecretStr("test_token"))
+    credential = create_credential(config, "generic", "token")
+
+    first = await credential.get_connection()
+
+    assert first["token"] == "test_token"
+    assert await credential.get_connection() is first
+
+
 def test_create_credential_generic_connection_string() -> None:
     """Test creating generic connection string credential."""
     config = ConnectionStringCredential(
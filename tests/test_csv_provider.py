@@ -0,0 +1,214 @@
+"""Tests for the CSV query provider."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+from queryhub.config.provider_models import ProviderConfig
+from queryhub.core.errors import ProviderExecutionError
+from queryhub.providers.generic.resources import csv as csv_module
+from queryhub.providers.generic.resources.csv import CSVQueryProvider
+
+_CSV = 'name,total,note\nalpha,042,"multi\nline"\nbeta,7,\n'
+_EXPECTED = [
+    {"name": "alpha", "total": "042", "note": "multi\nline"},
+    {"name": "beta", "total": "7", "note": ""},
+]
+
+
+def _build_provider(root: Path) -> CSVQueryProvider:
+    config = ProviderConfig.model_validate(
+        {"id": "csv_test", "resource": {"csv": {"root_path": str(root)}}}
+    )
+    return CSVQueryProvider(config)
+
+
+@pytest.mark.asyncio
+async def test_read_csv_keeps_string_values(tmp_path: Path) -> None:
+    (tmp_path / "data.csv").write_text(_CSV, encoding="utf-8")
+    provider = _build_provider(tmp_path)
+
+    result = await provider.execute({"path": "data.csv"})
+
+    assert result.data == _EXPECTED
+
+
+@pytest.mark.asyncio
+async def test_read_csv_without_pyarrow(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "data.csv").write_text(_CSV, encoding="utf-8")
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    provider = _build_provider(tmp_path)
+
+    result = await provider.execute({"path": "data.csv"})
+
+    assert result.data == _EXPECTED
+
+
+@pytest.mark.asyncio
+async def test_stdlib_reader_matches_dict_reader_on_ragged_rows(
+    tmp_path: Path, monkeypatch
+) -> None:
+    text = "a,b,c\n1,2\n\n3,4,5,6\n7,8,9\n"
+    (tmp_path / "ragged.csv").write_text(text, encoding="utf-8")
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    provider = _build_provider(tmp_path)
+
+    result = await provider.execute({"path": "ragged.csv"})
+    filtered = await provider.execute(
+        {"path": "ragged.csv", "filters": [{"column": "c", "operator": "ne", "value": "9"}]}
+    )
+
+    with (tmp_path / "ragged.csv").open(newline="") as handle:
+        expected = list(csv.DictReader(handle))
+    assert result.data == expected
+    assert filtered.data == expected[:2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_min_bytes", [0, csv_module._STREAM_READ_MIN_BYTES])
+async def test_pyarrow_falls_back_to_stdlib_on_ragged_rows(
+    tmp_path: Path, monkeypatch, stream_min_bytes: int
+) -> None:
+    pytest.importorskip("pyarrow")
+    text = "a,b,c\n1,2\n\n3,4,5,6\n7,8,9\n"
+    (tmp_path / "ragged.csv").write_text(text, encoding="utf-8")
+    monkeypatch.setattr(csv_module, "_STREAM_READ_MIN_BYTES", stream_min_bytes)
+    provider = _build_provider(tmp_path)
+
+    result = await provider.execute({"path": "ragged.csv"})
+
+    with (tmp_path / "ragged.csv").open(newline="") as handle:
+        assert result.data == list(csv.DictReader(handle))
+    with pytest.raises(ProviderExecutionError, match="arrow format"):
+        await provider.execute({"path": "ragged.csv", "format": "arrow"})
+
+
+@pytest.mark.asyncio
+async def test_read_empty_csv(tmp_path: Path) -> None:
+    (tmp_path / "empty.csv").write_text("", encoding="utf-8")
+    provider = _build_provider(tmp_path)
+
+    result = await provider.execute({"path": "empty.csv"})
+
+    assert result.data == []
+
+
+_FILTER_CASES = [
+    ([{"column": "name", "value": "alpha"}], ["alpha"]),
+    ([{"column": "name", "operator": "ne", "value": "alpha"}], ["beta"]),
+    ([{"column": "note", "operator": "contains", "value": "line"}], ["alpha"]),
+    ([{"column": "total", "value": 7}], []),
+    ([{"column": "missing", "value": "x"}], []),
+    (
+        [{"column": "name", "operator": "ne", "value": "x"}, {"column": "total", "value": "7"}],
+        ["beta"],
+    ),
+    ([{"column": "name", "value": "alpha"}, {"column": "total", "value": "042"}], ["alpha"]),
+    ([{"column": "name", "value": "alpha"}, {"column": "total", "value": "7"}], []),
+    (
+        [
+            {"column": "note", "operator": "contains", "value": ""},
+            {"column": "name", "operator": "ne", "value": "beta"},
+        ],
+        ["alpha"],
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_pyarrow", [True, False])
+@pytest.mark.parametrize(("filters", "expected"), _FILTER_CASES)
+async def test_filters_match_across_readers(
+    tmp_path: Path, monkeypatch, with_pyarrow: bool, filters: list, expected: list[str]
+) -> None:
+    (tmp_path / "data.csv").write_text(_CSV, encoding="utf-8")
+    if not with_pyarrow:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+    provider = _build_provider(tmp_path)
+
+    result = await provider.execute({"path": "data.csv", "filters": filters})
+
+    assert [row["name"] for row in result.data] == expected
+
+
+@pytest.mark.asyncio
+async def test_arrow_format_returns_table(tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    (tmp_path / "data.csv").write_text(_CSV, encoding="utf-8")
+    provider = _build_provider(tmp_path)
+
+    result = await provider.execute(
+        {"path": "data.csv", "format": "arrow", "filters": [{"column": "name", "value": "beta"}]}
+    )
+
+    assert isinstance(result.data, pa.Table)
+    assert result.columnar is True
+    assert result.metadata["rowcount"] == 1
+    assert result.data.to_pylist() == _EXPECTED[1:]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("filters", "expected"), _FILTER_CASES)
+async def test_large_file_scan_matches_cached_read(
+    tmp_path: Path, monkeypatch, filters: list, expected: list[str]
+) -> None:
+    pytest.importorskip("pyarrow")
+    (tmp_path / "data.csv").write_text(_CSV, encoding="utf-8")
+    monkeypatch.setattr(csv_module, "_STREAM_READ_MIN_BYTES", 0)
+    monkeypatch.setattr(csv_module, "_read_csv_cached", None)
+    provider = _build_provider(tmp_path)
+
+    result = await provider.execute({"path": "data.csv", "filters": filters})
+
+    assert [row["name"] for row in result.data] == expected
+    assert all(row == _EXPECTED[0] for row in result.data if row["name"] == "alpha")
+
+
+@pytest.mark.asyncio
+async def test_unchanged_file_parsed_once(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "data.csv"
+    path.write_text(_CSV, encoding="utf-8")
+    provider = _build_provider(tmp_path)
+    reads: list[Path] = []
+    read_table = CSVQueryProvider._read_table
+
+    def counting_read_table(path: Path, delimiter: str, encoding: str):
+        reads.append(path)
+        return read_table(path, delimiter, encoding)
+
+    monkeypatch.setattr(CSVQueryProvider, "_read_table", staticmethod(counting_read_table))
+
+    await provider.execute({"path": "data.csv"})
+    await provider.execute({"path": "data.csv"})
+    assert len(reads) == 1
+
+    path.write_text(_CSV + "gamma,1,\n", encoding="utf-8")
+    result = await provider.execute({"path": "data.csv"})
+    assert len(reads) == 2
+    assert result.data[-1]["name"] == "gamma"
+
+
+@pytest.mark.asyncio
+async def test_only_large_files_offloaded_to_thread(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "small.csv").write_text(_CSV, encoding="utf-8")
+    (tmp_path / "large.csv").write_text(_CSV + "gamma,1,\n" * 10_000, encoding="utf-8")
+    offloaded: list[Path] = []
+    to_thread = asyncio.to_thread
+
+    async def recording_to_thread(func, path, *args):
+        offloaded.append(path)
+        return await to_thread(func, path, *args)
+
+    monkeypatch.setattr(csv_module.asyncio, "to_thread", recording_to_thread)
+    provider = _build_provider(tmp_path)
+
+    await provider.execute({"path": "small.csv"})
+    result = await provider.execute({"path": "large.csv"})
+
+    assert offloaded == [tmp_path / "large.csv"]
+    assert len(result.data) == 10_002
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 from datetime import datetime, timezone
 
 import pytest
@@ -409,3 +410,30 @@ def test_message_builder_plain_text_body() -> None:
     plain_content = str(message)
     assert "Report: Test Report" in plain_content
     assert "Generated at: 2024-01-01" in plain_content
+
+
+def test_message_builder_attaches_inline_images() -> None:
+    """Test MessageBuilder turns data-URI images into deduplicated CID parts."""
+    smtp_config = SMTPConfig(
+        host="localhost",
+        port=587,
+        default_from="sender@example.com",
+        default_to=["recipient@example.com"],
+    )
+    builder = MessageBuilder(
+        smtp_config, RecipientResolver(smtp_config), SubjectFormatter(smtp_config)
+    )
+    png = b"\x89PNG\r\n\x1a\nchart"
+    encoded = base64.b64encode(png).decode("ascii")
+    image = f'<img src="data:image/png;base64,{encoded}" alt="Chart" />'
+    result = _create_test_result(_create_test_report(), html=f"<html>{image}{image}</html>")
+
+    message = builder.build(result, None)
+
+    html_part = message.get_body(preferencelist=("html",))
+    html = html_part.get_content()
+    images = [part for part in message.walk() if part.get_content_maintype() == "image"]
+    assert "data:image" not in html
+    assert len(images) == 1
+    assert images[0].get_content() == png
+    assert html.count(f'src="cid:{images[0]["Content-ID"].strip("<>")}"') == 2
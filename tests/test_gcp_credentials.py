@@ -0,0 +1,131 @@
+"""Tests for GCP credential strategies using stub google modules."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+import pytest
+from pydantic import SecretStr
+
+from queryhub.config.credential_models import GCPCredentialConfig
+from queryhub.core.errors import ProviderInitializationError
+from queryhub.providers.gcp import credentials as gcp_credentials
+from queryhub.providers.gcp.credentials import (
+    GCPDefaultCredential,
+    GCPServiceAccountJSONCredential,
+)
+
+
+class _StubClient:
+    def __init__(self, project: str, credentials: Any, location: str) -> None:
+        self.project = project
+        self.credentials = credentials
+        self.location = location
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def google_stub(monkeypatch) -> SimpleNamespace:
+    """Install stub google.auth/google.cloud.bigquery/google.oauth2 modules."""
+    calls = SimpleNamespace(default=0, from_info=0)
+
+    def default() -> tuple[object, str]:
+        calls.default += 1
+        return object(), "adc-project"
+
+    def from_service_account_info(info: dict[str, Any]) -> object:
+        calls.from_info += 1
+        return object()
+
+    names = (
+        "google",
+        "google.auth",
+        "google.cloud",
+        "google.cloud.bigquery",
+        "google.oauth2",
+        "google.oauth2.service_account",
+    )
+    modules = {name: ModuleType(name) for name in names}
+    modules["google.auth"].default = default
+    modules["google.cloud.bigquery"].Client = _StubClient
+    modules["google.cloud"].bigquery = modules["google.cloud.bigquery"]
+    modules["google.oauth2.service_account"].Credentials = SimpleNamespace(
+        from_service_account_info=from_service_account_info
+    )
+    modules["google.oauth2"].service_account = modules["google.oauth2.service_account"]
+    modules["google"].auth = modules["google.auth"]
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.setattr(gcp_credentials, "_bigquery", None)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_default_credential_caches_client_per_project_location(google_stub) -> None:
+    credential = GCPDefaultCredential()
+
+    first = await credential.get_connection()
+    second = await credential.get_connection()
+    other = await credential.get_connection(location="EU")
+
+    assert first is second
+    assert first.project == "adc-project"
+    assert other is not first and other.location == "EU"
+    assert google_stub.default == 1
+
+    await credential.close()
+    assert first.closed and other.closed
+    assert await credential.get_connection() is not first
+
+
+@pytest.mark.asyncio
+async def test_service_account_parses_key_once(google_stub) -> None:
+    info = {"project_id": "sa-project", "private_key": "key"}
+    credential = GCPServiceAccountJSONCredential(
+        GCPCredentialConfig(type="service_account", service_account_json=SecretStr(json.dumps(info)))
+    )
+
+    client = await credential.get_connection()
+    explicit = await credential.get_connection(project_id="explicit")
+
+    assert client.project == "sa-project"
+    assert explicit.project == "explicit"
+    assert await credential.get_connection() is client
+    assert google_stub.from_info == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_bigquery_dependency_raises(monkeypatch) -> None:
+    monkeypatch.setattr(gcp_credentials, "_bigquery", None)
+    monkeypatch.setitem(sys.modules, "google.cloud.bigquery", None)
+
+    with pytest.raises(ProviderInitializationError, match="google-cloud-bigquery"):
+        await GCPDefaultCredential().get_connection()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_orjson", [True, False])
+async def test_service_account_loaded_from_file(
+    google_stub, tmp_path: Path, monkeypatch, with_orjson: bool
+) -> None:
+    if not with_orjson:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    gcp_credentials._json_loads.cache_clear()
+    key_path = tmp_path / "key.json"
+    key_path.write_bytes(json.dumps({"project_id": "file-project"}).encode("utf-8"))
+    credential = GCPServiceAccountJSONCredential(
+        GCPCredentialConfig(type="service_account", service_account_json_path=str(key_path))
+    )
+    try:
+        client = await credential.get_connection()
+    finally:
+        gcp_credentials._json_loads.cache_clear()
+
+    assert client.project == "file-project"
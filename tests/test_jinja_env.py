@@ -0,0 +1,25 @@
+"""Tests for the Jinja environment builder."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from queryhub.rendering.jinja_env import build_environment
+
+
+@pytest.mark.asyncio
+async def test_bytecode_cache_shared_between_environments(tmp_path: Path) -> None:
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    (templates_dir / "report.html").write_text("Hello {{ name }}", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    env = build_environment(templates_dir, cache_dir=cache_dir)
+    env.get_template("report.html")
+
+    assert len(list(cache_dir.glob("__jinja2_*.cache"))) == 1
+    template = build_environment(templates_dir, cache_dir=cache_dir).get_template("report.html")
+    assert await template.render_async(name="<b>") == "Hello &lt;b&gt;"
+    assert len(env.cache) == 1  # type: ignore[arg-type]
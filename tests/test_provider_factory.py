@@ -0,0 +1,55 @@
+"""Tests for provider factory."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from queryhub.config.provider_models import ProviderConfig
+from queryhub.core.credentials import CredentialRegistry
+from queryhub.core.providers import DefaultProviderFactory
+from queryhub.providers.generic.resources.csv import CSVQueryProvider
+from queryhub.providers.provider_factory import create_provider
+
+
+def test_create_provider_resolves_class_by_type(tmp_path) -> None:
+    """Test that providers are created from their resource type."""
+    config = ProviderConfig.model_validate(
+        {"id": "csv", "resource": {"csv": {"root_path": str(tmp_path)}}}
+    )
+
+    first = create_provider(config, CredentialRegistry())
+    second = create_provider(config, CredentialRegistry())
+
+    assert isinstance(first, CSVQueryProvider)
+    assert first is not second
+
+
+def test_default_factory_reuses_bound_constructor(tmp_path) -> None:
+    """Test that the factory resolves each provider id only once."""
+    config = ProviderConfig.model_validate(
+        {"id": "csv", "resource": {"csv": {"root_path": str(tmp_path)}}}
+    )
+    factory = DefaultProviderFactory({"csv": config}, CredentialRegistry())
+
+    first = factory.create("csv")
+    second = factory.create("csv")
+
+    assert isinstance(first, CSVQueryProvider)
+    assert first is not second
+    assert list(factory._constructors) == ["csv"]
+
+
+def test_csv_provider_import_skips_unrelated_modules() -> None:
+    """Test that importing the CSV provider leaves other providers' modules unloaded."""
+    code = (
+        "import sys\n"
+        "from queryhub.providers.generic.resources import CSVQueryProvider\n"
+        "skipped = ('sqlalchemy', 'aiohttp', 'queryhub.providers.generic.credentials')\n"
+        "print(sorted(name for name in skipped if name in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "[]"
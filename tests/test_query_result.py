@@ -0,0 +1,48 @@
+"""Tests for the QueryResult container."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Mapping
+
+import pytest
+
+from queryhub.config.provider_models import ProviderConfig
+from queryhub.providers import BaseQueryProvider, QueryResult
+
+
+def test_default_metadata_is_shared_and_read_only() -> None:
+    """Test that results without metadata share one immutable empty mapping."""
+    first = QueryResult(data=[])
+    second = QueryResult(data=[])
+
+    assert first.metadata == {}
+    assert first.metadata is second.metadata
+    with pytest.raises(TypeError):
+        first.metadata["rowcount"] = 1  # type: ignore[index]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_bounds_concurrency_and_keeps_order() -> None:
+    """Test that the default execute_many caps in-flight queries."""
+
+    class _SlowProvider(BaseQueryProvider):
+        def __init__(self) -> None:
+            config = {"id": "slow", "resource": {"csv": {"root_path": "."}}}
+            super().__init__(ProviderConfig.model_validate(config))
+            self.active = 0
+            self.peak = 0
+
+        async def execute(self, query: Mapping[str, Any]) -> QueryResult:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return QueryResult(data=query["n"])
+
+    provider = _SlowProvider()
+    results = await provider.execute_many([{"n": n} for n in range(7)], max_concurrency=3)
+
+    assert [result.data for result in results] == list(range(7))
+    assert provider.peak == 3
+    assert await provider.execute_many([]) == []
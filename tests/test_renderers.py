@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+import sys
+from types import MappingProxyType
+
+import pytest
+
 from queryhub.config.models import (
     ComponentRenderConfig,
     ComponentRendererType,
     QueryComponentConfig,
 )
+from queryhub.core.errors import RenderingError
 from queryhub.providers.base_query_provider import QueryResult
-from queryhub.rendering.renderers import RendererRegistry, TableRenderer, TextRenderer
+from queryhub.rendering import renderers as renderers_module
+from queryhub.rendering.renderers import (
+    ChartRenderer,
+    DataExtractor,
+    HtmlRenderer,
+    RendererRegistry,
+    TableRenderer,
+    TextRenderer,
+    create_default_renderer_registry,
+)
 
 
 def _build_component(render_config: ComponentRenderConfig) -> QueryComponentConfig:
@@ -39,9 +54,130 @@ def test_text_renderer_value_path() -> None:
     assert "Temp: 23.5°C" in html
 
 
+def test_text_renderer_columnar_result() -> None:
+    render_config = ComponentRenderConfig(
+        type=ComponentRendererType.TEXT, options={"template": "Total: {value}"}
+    )
+    component = _build_component(render_config)
+    result = QueryResult(data={"value": [42, 7], "name": ["a", "b"]}, columnar=True)
+
+    html = TextRenderer().render(component, result)
+
+    assert '<div class="text-body">Total: 42</div>' in html
+
+
 def test_renderer_registry_table() -> None:
     registry = RendererRegistry()
     registry.register(ComponentRendererType.TABLE, TableRenderer())
     render_config = ComponentRenderConfig(type=ComponentRendererType.TABLE, options={})
     renderer = registry.resolve(render_config)
     assert renderer is not None
+
+
+def test_table_renderer_columnar_result() -> None:
+    render_config = ComponentRenderConfig(type=ComponentRendererType.TABLE, options={})
+    component = _build_component(render_config)
+    renderer = TableRenderer()
+    result = QueryResult(data={"name": ["alpha", "beta"], "total": [42, 7]}, columnar=True)
+
+    html = renderer.render(component, result)
+
+    assert "<th>name</th><th>total</th>" in html
+    assert "<tr><td>alpha</td><td>42</td></tr><tr><td>beta</td><td>7</td></tr>" in html
+
+
+def test_table_renderer_escapes_cells() -> None:
+    render_config = ComponentRenderConfig(type=ComponentRendererType.TABLE, options={})
+    component = _build_component(render_config)
+    renderer = TableRenderer()
+    rows = [{"a<b": "x & 'y'", "c": None}, {"a<b": '"\x00"'}]
+
+    html = renderer.render(component, QueryResult(data=rows))
+
+    assert "<th>a&lt;b</th><th>c</th>" in html
+    assert "<tr><td>x &amp; &#x27;y&#x27;</td><td>None</td></tr>" in html
+    # A separator character inside a cell falls back to per-cell escaping
+    assert "<tr><td>&quot;\x00&quot;</td><td></td></tr>" in html
+
+
+def test_html_renderer_compiles_template_once() -> None:
+    renderers_module._compile_html_template.cache_clear()
+    template = "<b>{{ name }}</b> {{ missing }}"
+    render_config = ComponentRenderConfig(
+        type=ComponentRendererType.HTML, options={"template": template}
+    )
+    component = _build_component(render_config)
+    renderer = HtmlRenderer()
+
+    first = renderer.render(component, QueryResult(data=[{"name": "<i>a</i>"}]))
+    second = renderer.render(component, QueryResult(data=[{"name": "b"}]))
+
+    # Same behaviour as jinja2.Template: no autoescape, lenient undefined values
+    assert '<div class="html-body"><b><i>a</i></b> </div>' in first
+    assert "<b>b</b>" in second
+    assert renderers_module._compile_html_template.cache_info().misses == 1
+
+
+def test_ensure_rows_reuses_plain_dict_lists() -> None:
+    rows = [{"a": 1}, {"a": 2}]
+    proxies = [MappingProxyType({"a": 1})]
+
+    assert DataExtractor.ensure_rows(rows) is rows
+    assert DataExtractor.ensure_rows(proxies) == [{"a": 1}]
+    assert type(DataExtractor.ensure_rows(proxies)[0]) is dict
+
+
+def test_chart_renderer_requires_plotly(monkeypatch) -> None:
+    renderers_module._plotly.cache_clear()
+    monkeypatch.setitem(sys.modules, "plotly.express", None)
+    render_config = ComponentRenderConfig(
+        type=ComponentRendererType.CHART, options={"x_field": "x", "y_field": "y"}
+    )
+    component = _build_component(render_config)
+
+    with pytest.raises(RenderingError, match="Plotly dependency missing"):
+        ChartRenderer().render(component, QueryResult(data=[{"x": 1, "y": 2}]))
+    renderers_module._plotly.cache_clear()
+
+
+def test_traverse_path_mappings_and_lists() -> None:
+    data = {"items": [{"name": "a"}, {"name": "b"}], "1": "key"}
+
+    assert DataExtractor.traverse_path(data, "items.1.name") == "b"
+    assert DataExtractor.traverse_path(data, "1") == "key"
+    assert DataExtractor.traverse_path(data, "items.5.name") is None
+    assert DataExtractor.traverse_path(data, "items.-1") is None
+    assert DataExtractor.traverse_path(data, "items.first") is None
+    assert DataExtractor.traverse_path(data, "items.0.name.x") is None
+
+
+def test_text_renderer_default_template_passes_value_through() -> None:
+    render_config = ComponentRenderConfig(type=ComponentRendererType.TEXT, options={})
+    component = _build_component(render_config)
+
+    html = TextRenderer().render(component, QueryResult(data={"value": 42}))
+
+    assert '<div class="text-body">42</div>' in html
+
+
+def test_default_registries_share_renderers_not_registrations() -> None:
+    table = ComponentRenderConfig(type=ComponentRendererType.TABLE, options={})
+    first = create_default_renderer_registry()
+    second = create_default_renderer_registry()
+
+    assert first is not second
+    assert first.resolve(table) is second.resolve(table)
+    first.register(ComponentRendererType.TABLE, TextRenderer())
+    assert isinstance(second.resolve(table), TableRenderer)
+    assert isinstance(create_default_renderer_registry().resolve(table), TableRenderer)
+
+
+def test_renderer_registry_unregistered_type() -> None:
+    registry = RendererRegistry()
+    registry.register(ComponentRendererType.TABLE, TableRenderer())
+    text = ComponentRenderConfig(type=ComponentRendererType.TEXT, options={})
+
+    with pytest.raises(RenderingError, match="not registered"):
+        registry.resolve(text)
+    registry.register(ComponentRendererType.TEXT, TextRenderer())
+    assert isinstance(registry.resolve(text), TextRenderer)
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
 import textwrap
 from pathlib import Path
+from typing import Any, Mapping
 
 import pytest
 from aiohttp import web
 
+from queryhub.config.models import (
+    ComponentRenderConfig,
+    ComponentRendererType,
+    QueryComponentConfig,
+)
+from queryhub.config.provider_models import ProviderConfig
+from queryhub.core.errors import ExecutionTimeoutError
+from queryhub.providers import BaseQueryProvider, QueryResult
+from queryhub.rendering import create_default_renderer_registry
 from queryhub.services import QueryHubApplicationBuilder
+from queryhub.services.component_executor import ComponentExecutor, ProviderResolver
 
 
 @pytest.mark.asyncio
@@ -179,3 +191,200 @@ async def test_execute_sql_and_rest_report(monkeypatch, tmp_path) -> None:
     rest_component = next(item for item in result.components if item.component.id == "api_status")
     assert rest_component.rendered_html is not None
     assert "API status: ok" in rest_component.rendered_html
+
+
+class _SlowProvider(BaseQueryProvider):
+    def __init__(self, config: ProviderConfig) -> None:
+        super().__init__(config)
+        self.active = 0
+        self.peak = 0
+
+    async def execute(self, query: Mapping[str, Any]) -> QueryResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return QueryResult(data=[{"n": query["n"]}])
+
+
+class _SingleProviderFactory:
+    def __init__(self, provider: BaseQueryProvider) -> None:
+        self.provider = provider
+
+    def create(self, provider_id: str) -> BaseQueryProvider:
+        return self.provider
+
+
+@pytest.mark.asyncio
+async def test_component_queries_bounded_per_provider() -> None:
+    config = ProviderConfig.model_validate(
+        {"id": "slow", "max_concurrency": 2, "resource": {"csv": {"root_path": "."}}}
+    )
+    provider = _SlowProvider(config)
+    executor = ComponentExecutor(
+        ProviderResolver(_SingleProviderFactory(provider)), create_default_renderer_registry()
+    )
+    components = [
+        QueryComponentConfig(
+            id=f"c{n}",
+            provider="slow",
+            query={"n": n},
+            render=ComponentRenderConfig(type=ComponentRendererType.TABLE, options={}),
+        )
+        for n in range(6)
+    ]
+
+    results = await asyncio.gather(*(executor.execute(component) for component in components))
+
+    assert all(result.is_success for result in results)
+    assert provider.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_resolver_creates_each_provider_once() -> None:
+    config = ProviderConfig.model_validate({"id": "slow", "resource": {"csv": {"root_path": "."}}})
+
+    class _CountingFactory:
+        calls = 0
+
+        def create(self, provider_id: str) -> BaseQueryProvider:
+            self.calls += 1
+            return _SlowProvider(config)
+
+    factory = _CountingFactory()
+    resolver = ProviderResolver(factory)
+
+    providers = await asyncio.gather(*(resolver.get_provider("slow") for _ in range(5)))
+
+    assert factory.calls == 1
+    assert all(provider is providers[0] for provider in providers)
+
+
+@pytest.mark.asyncio
+async def test_batching_providers_receive_component_queries_via_submit() -> None:
+    config = ProviderConfig.model_validate({"id": "slow", "resource": {"csv": {"root_path": "."}}})
+
+    class _BatchingProvider(_SlowProvider):
+        supports_batch = True
+
+        def __init__(self) -> None:
+            super().__init__(config)
+            self.submitted: list[Any] = []
+
+        async def submit(
+            self, query: Mapping[str, Any], *, timeout: float | None = None
+        ) -> QueryResult:
+            self.submitted.append((query["n"], timeout))
+            return await self.execute(query)
+
+    provider = _BatchingProvider()
+    executor = ComponentExecutor(
+        ProviderResolver(_SingleProviderFactory(provider)), create_default_renderer_registry()
+    )
+    component = QueryComponentConfig(
+        id="batched",
+        provider="slow",
+        query={"n": 1},
+        render=ComponentRenderConfig(type=ComponentRendererType.TABLE, options={}),
+    )
+
+    result = await executor.execute(component)
+
+    assert result.is_success
+    assert provider.submitted == [(1, 30.0)]
+
+
+@pytest.mark.asyncio
+async def test_component_query_timeout_is_not_retried() -> None:
+    config = ProviderConfig.model_validate({"id": "slow", "resource": {"csv": {"root_path": "."}}})
+
+    class _HangingProvider(_SlowProvider):
+        async def execute(self, query: Mapping[str, Any]) -> QueryResult:
+            await asyncio.sleep(10)
+            raise AssertionError("query should have been cancelled")
+
+    executor = ComponentExecutor(
+        ProviderResolver(_SingleProviderFactory(_HangingProvider(config))),
+        create_default_renderer_registry(),
+    )
+    component = QueryComponentConfig(
+        id="hanging",
+        provider="slow",
+        query={},
+        timeout_seconds=0.01,
+        retries=3,
+        render=ComponentRenderConfig(type=ComponentRendererType.TABLE, options={}),
+    )
+
+    result = await executor.execute(component)
+
+    assert isinstance(result.error, ExecutionTimeoutError)
+    assert not asyncio.current_task().cancelling()
+
+
+class _StreamingProvider(_SlowProvider):
+    """Return rows as an async iterator; the first ``failures`` streams break midway."""
+
+    def __init__(self, config: ProviderConfig, *, hang: bool = False, failures: int = 0) -> None:
+        super().__init__(config)
+        self.hang = hang
+        self.failures = failures
+        self.calls = 0
+        self.closed = 0
+
+    async def execute(self, query: Mapping[str, Any]) -> QueryResult:
+        self.calls += 1
+        return QueryResult(data=self._rows(fail=self.calls <= self.failures))
+
+    async def _rows(self, fail: bool):
+        try:
+            yield {"n": 1}
+            if self.hang:
+                await asyncio.sleep(10)
+            if fail:
+                raise ConnectionError("stream interrupted")
+            yield {"n": 2}
+        finally:
+            self.closed += 1
+
+
+def _streaming_component(**options: Any) -> QueryComponentConfig:
+    return QueryComponentConfig(
+        id="streamed",
+        provider="slow",
+        query={},
+        render=ComponentRenderConfig(type=ComponentRendererType.TABLE, options={}),
+        **options,
+    )
+
+
+@pytest.mark.asyncio
+async def test_streamed_rows_collected_within_component_timeout() -> None:
+    config = ProviderConfig.model_validate({"id": "slow", "resource": {"csv": {"root_path": "."}}})
+    provider = _StreamingProvider(config, hang=True)
+    executor = ComponentExecutor(
+        ProviderResolver(_SingleProviderFactory(provider)), create_default_renderer_registry()
+    )
+
+    result = await executor.execute(_streaming_component(timeout_seconds=0.01, retries=2))
+
+    assert isinstance(result.error, ExecutionTimeoutError)
+    assert provider.calls == 1
+    assert provider.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupted_stream_retried() -> None:
+    config = ProviderConfig.model_validate(
+        {"id": "slow", "retry_backoff_seconds": 0, "resource": {"csv": {"root_path": "."}}}
+    )
+    provider = _StreamingProvider(config, failures=1)
+    executor = ComponentExecutor(
+        ProviderResolver(_SingleProviderFactory(provider)), create_default_renderer_registry()
+    )
+
+    result = await executor.execute(_streaming_component(retries=2))
+
+    assert result.is_success
+    assert result.attempts == 2
+    assert result.result.data == [{"n": 1}, {"n": 2}]
@@ -0,0 +1,297 @@
+"""Tests for the REST query provider against a local aiohttp server."""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any, AsyncIterator
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from queryhub.config.credential_models import GenericCredentialConfig
+from queryhub.config.provider_models import ProviderConfig
+from queryhub.core.errors import ProviderExecutionError, ProviderInitializationError
+from queryhub.providers.generic.resources import rest as rest_module
+from queryhub.providers.generic.credentials import UsernamePasswordCredential
+from queryhub.providers.generic.resources.rest import RESTQueryProvider
+
+
+async def _metrics(request: web.Request) -> web.Response:
+    return web.json_response([{"name": "alpha"}], headers={"X-Request-Id": "req-1"})
+
+
+async def _echo_json(request: web.Request) -> web.Response:
+    return web.json_response(await request.json())
+
+
+async def _raw_json(request: web.Request) -> web.Response:
+    return web.Response(body=request.query["body"].encode(), content_type="application/json")
+
+
+async def _echo_headers(request: web.Request) -> web.Response:
+    return web.json_response({name: request.headers.get(name) for name in ("X-App", "X-Env")})
+
+
+@pytest_asyncio.fixture
+async def base_url() -> AsyncIterator[str]:
+    app = web.Application()
+    app.router.add_get("/metrics", _metrics)
+    app.router.add_get("/api/headers", _echo_headers)
+    app.router.add_post("/echo", _echo_json)
+    app.router.add_get("/raw", _raw_json)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def _build_provider(base_url: str, **rest_options: object) -> RESTQueryProvider:
+    config = ProviderConfig.model_validate(
+        {"id": "rest_test", "resource": {"rest": {"base_url": base_url, **rest_options}}}
+    )
+    return RESTQueryProvider(config)
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_json_and_response_metadata(base_url: str) -> None:
+    provider = _build_provider(base_url)
+    try:
+        result = await provider.execute({"endpoint": "/metrics"})
+    finally:
+        await provider.close()
+
+    assert result.data == [{"name": "alpha"}]
+    assert result.mime_type == "application/json"
+    assert result.metadata["status"] == 200
+    assert result.metadata["headers"]["x-request-id"] == "req-1"
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_json_array_items(base_url: str) -> None:
+    pytest.importorskip("ijson")
+    provider = _build_provider(base_url)
+    try:
+        result = await provider.execute({"endpoint": "/metrics", "stream": True})
+        assert result.is_streaming
+        rows = (await result.collect()).data
+    finally:
+        await provider.close()
+
+    assert rows == [{"name": "alpha"}]
+
+
+@pytest.mark.asyncio
+async def test_stream_requires_ijson(base_url: str, monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    provider = _build_provider(base_url)
+    try:
+        with pytest.raises(ProviderInitializationError, match="ijson"):
+            await provider.execute({"endpoint": "/metrics", "stream": True})
+    finally:
+        await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_requires_aiohttp(monkeypatch) -> None:
+    monkeypatch.setattr(rest_module, "_aiohttp", None)
+    monkeypatch.setitem(sys.modules, "aiohttp", None)
+    provider = _build_provider("http://127.0.0.1:1")
+
+    with pytest.raises(ProviderInitializationError, match="aiohttp"):
+        await provider.execute({"endpoint": "/metrics"})
+
+
+def test_client_timeouts_shared_per_duration() -> None:
+    rest_module._client_timeout.cache_clear()
+    _build_provider("http://127.0.0.1:1")._import_aiohttp()
+
+    assert rest_module._client_timeout(5.0) is rest_module._client_timeout(5.0)
+    assert rest_module._client_timeout(5.0).total == 5.0
+
+
+@pytest.mark.asyncio
+async def test_execute_many_returns_results_in_order(base_url: str) -> None:
+    provider = _build_provider(base_url)
+    queries = [{"method": "POST", "endpoint": "echo", "json": {"n": n}} for n in range(5)]
+    try:
+        results = await provider.execute_many(queries)
+    finally:
+        await provider.close()
+
+    assert [result.data for result in results] == [{"n": n} for n in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_metadata_headers_allow_list(base_url: str) -> None:
+    provider = _build_provider(base_url, metadata_headers=["X-Request-Id", "X-Missing"])
+    try:
+        result = await provider.execute({"endpoint": "/metrics"})
+    finally:
+        await provider.close()
+
+    assert result.metadata["headers"] == {"X-Request-Id": "req-1"}
+
+
+@pytest.mark.asyncio
+async def test_request_headers_override_default_headers(base_url: str) -> None:
+    provider = _build_provider(
+        f"{base_url}/api/", default_headers={"X-App": "queryhub", "X-Env": "default"}
+    )
+    try:
+        result = await provider.execute({"endpoint": "/headers", "headers": {"X-Env": "test"}})
+    finally:
+        await provider.close()
+
+    assert result.data == {"X-App": "queryhub", "X-Env": "test"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_orjson", [True, False])
+async def test_json_round_trip(base_url: str, monkeypatch, with_orjson: bool) -> None:
+    if not with_orjson:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    rest_module._json_codec.cache_clear()
+    provider = _build_provider(base_url)
+    payload = {"name": "é", "values": [1, 2.5, None], 1: True}
+    try:
+        result = await provider.execute({"method": "POST", "endpoint": "echo", "json": payload})
+    finally:
+        await provider.close()
+        rest_module._json_codec.cache_clear()
+
+    assert result.data == {"name": "é", "values": [1, 2.5, None], "1": True}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_orjson", [True, False])
+async def test_empty_and_invalid_json_bodies(base_url: str, monkeypatch, with_orjson: bool) -> None:
+    if not with_orjson:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    rest_module._json_codec.cache_clear()
+    provider = _build_provider(base_url)
+    try:
+        empty = await provider.execute({"endpoint": "raw", "params": {"body": ""}})
+        blank = await provider.execute({"endpoint": "raw", "params": {"body": " \n"}})
+        with pytest.raises(ProviderExecutionError, match="not valid JSON"):
+            await provider.execute({"endpoint": "raw", "params": {"body": "{oops"}})
+    finally:
+        await provider.close()
+        rest_module._json_codec.cache_clear()
+
+    assert empty.data is None
+    assert blank.data is None
+
+
+@pytest.mark.asyncio
+async def test_session_connector_uses_pool_limits(base_url: str) -> None:
+    provider = _build_provider(base_url, pool_limit=10, pool_limit_per_host=4)
+    try:
+        await provider.execute({"endpoint": "metrics"})
+        await provider.execute({"endpoint": "metrics"})
+        connector = provider._session.connector
+    finally:
+        await provider.close()
+
+    assert (connector.limit, connector.limit_per_host) == (10, 4)
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "expected"),
+    [
+        ("metrics", "https://api.example.com/v1/metrics"),
+        ("/metrics?top=5", "https://api.example.com/v1/metrics?top=5"),
+        ("../v2/metrics", "https://api.example.com/v2/metrics"),
+        ("https://other.example.com/status", "https://other.example.com/status"),
+    ],
+)
+def test_endpoint_resolved_like_urljoin(endpoint: str, expected: str) -> None:
+    provider = _build_provider("https://api.example.com/v1")
+
+    assert str(rest_module._endpoint_url(provider._base_url, endpoint)) == expected
+
+
+class _CountingTokenCredential:
+    def __init__(self, expires_at: float | None) -> None:
+        self.expires_at = expires_at
+        self.calls = 0
+
+    async def get_connection(self, **context: object) -> dict[str, str]:
+        self.calls += 1
+        return {"token": f"t{self.calls}"}
+
+    async def close(self) -> None:
+        pass
+
+
+class _StubRegistry:
+    def __init__(self, credential: Any) -> None:
+        self.credential = credential
+        self.lookups = 0
+
+    def get_credential(self, credential_id: str, cloud_provider: str) -> Any:
+        self.lookups += 1
+        return self.credential
+
+
+def _build_authenticated_provider(credential: Any) -> RESTQueryProvider:
+    config = ProviderConfig.model_validate(
+        {
+            "id": "rest_auth",
+            "credentials": "api_token",
+            "resource": {"rest": {"base_url": "http://example.invalid"}},
+        }
+    )
+    return RESTQueryProvider(config, _StubRegistry(credential))  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_static_auth_header_built_once() -> None:
+    credential = _CountingTokenCredential(expires_at=None)
+    provider = _build_authenticated_provider(credential)
+
+    first = await provider._build_auth_header()
+    second = await provider._build_auth_header()
+
+    assert first == second == {"Authorization": "Bearer t1"}
+    assert credential.calls == 1
+    assert provider.credential_registry.lookups == 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_expiring_auth_header_rebuilt_near_expiry() -> None:
+    credential = _CountingTokenCredential(expires_at=time.time() + 30)
+    provider = _build_authenticated_provider(credential)
+
+    await provider._build_auth_header()
+    header = await provider._build_auth_header()
+
+    assert header == {"Authorization": "Bearer t2"}
+    assert credential.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_basic_auth_header_encoded_once(monkeypatch) -> None:
+    encodes = 0
+    b64encode = rest_module.base64.b64encode
+
+    def counting_b64encode(value: bytes) -> bytes:
+        nonlocal encodes
+        encodes += 1
+        return b64encode(value)
+
+    monkeypatch.setattr(rest_module.base64, "b64encode", counting_b64encode)
+    credential = UsernamePasswordCredential(
+        GenericCredentialConfig(type="username_password", username="user", password="pass")
+    )
+    provider = _build_authenticated_provider(credential)
+
+    headers = [await provider._build_auth_header() for _ in range(3)]
+
+    assert headers[0] == {"Authorization": "Basic dXNlcjpwYXNz"}
+    assert all(header is headers[0] for header in headers)
+    assert encodes == 1
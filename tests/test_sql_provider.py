@@ -0,0 +1,344 @@
+"""Tests for the SQL query provider against a temporary SQLite database."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from queryhub.config.provider_models import ProviderConfig
+from queryhub.core.errors import ProviderExecutionError, ProviderInitializationError
+from queryhub.providers.generic.resources import sql as sql_module
+from queryhub.providers.generic.resources.sql import SQLQueryProvider
+
+
+def _build_provider(dsn: str, **sql_options: object) -> SQLQueryProvider:
+    config = ProviderConfig.model_validate(
+        {"id": "sql_test", "resource": {"sql": {"dsn": dsn, **sql_options}}}
+    )
+    return SQLQueryProvider(config)
+
+
+@pytest.mark.asyncio
+async def test_providers_share_engine_until_last_close(tmp_path: Path) -> None:
+    dsn = f"sqlite+aiosqlite:///{(tmp_path / 'pool.db').as_posix()}"
+    first = _build_provider(dsn)
+    second = _build_provider(dsn)
+
+    engine = await first._get_engine()
+    assert await second._get_engine() is engine
+
+    await first.close()
+    assert (await second.execute({"text": "SELECT 1 AS one"})).data == [{"one": 1}]
+    await second.close()
+    assert second._engine is None
+
+
+@pytest.mark.asyncio
+async def test_get_engine_created_once_for_concurrent_callers(tmp_path: Path) -> None:
+    provider = _build_provider(f"sqlite+aiosqlite:///{(tmp_path / 'once.db').as_posix()}")
+    calls = 0
+    create_engine = provider._create_engine
+
+    async def counting_create_engine():
+        nonlocal calls
+        calls += 1
+        return await create_engine()
+
+    provider._create_engine = counting_create_engine  # type: ignore[method-assign]
+
+    engines = await asyncio.gather(*(provider._get_engine() for _ in range(5)))
+
+    assert calls == 1
+    assert all(engine is engines[0] for engine in engines)
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_rows_lazily(tmp_path: Path) -> None:
+    provider = _build_provider(f"sqlite+aiosqlite:///{(tmp_path / 'stream.db').as_posix()}")
+    statement = (
+        "WITH RECURSIVE n(value) AS (SELECT 1 UNION ALL SELECT value + 1 FROM n WHERE value < 2500)"
+        " SELECT value FROM n"
+    )
+
+    result = await provider.execute({"text": statement, "stream": True, "chunk_size": 500})
+
+    assert result.is_streaming
+    rows = (await result.collect()).data
+    assert len(rows) == 2500
+    assert rows[0] == {"value": 1} and rows[-1] == {"value": 2500}
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_repeated_statement_compiled_once(tmp_path: Path) -> None:
+    provider = _build_provider(f"sqlite+aiosqlite:///{(tmp_path / 'text.db').as_posix()}")
+    statement = "SELECT :value AS value"
+    sql_module._compile_text_cached.cache_clear()
+
+    first = await provider.execute({"text": statement, "parameters": {"value": 1}})
+    second = await provider.execute({"text": statement, "parameters": {"value": 2}})
+
+    assert (first.data, second.data) == ([{"value": 1}], [{"value": 2}])
+    assert sql_module._compile_text_cached.cache_info().misses == 1
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_connection_reused_and_reset_on_error(tmp_path: Path) -> None:
+    provider = _build_provider(
+        f"sqlite+aiosqlite:///{(tmp_path / 'shared.db').as_posix()}",
+        share_connection=True,
+        options={"pool_pre_ping": False},
+    )
+
+    results = await asyncio.gather(
+        *(provider.execute({"text": "SELECT :n AS n", "parameters": {"n": n}}) for n in range(3))
+    )
+    shared = provider._shared_connection
+
+    assert [result.data for result in results] == [[{"n": 0}], [{"n": 1}], [{"n": 2}]]
+    assert shared is not None and not shared.in_transaction()
+    assert (await provider._get_engine()).pool._pre_ping is False
+
+    with pytest.raises(ProviderExecutionError):
+        await provider.execute({"text": "SELECT * FROM missing_table"})
+    assert provider._shared_connection is None
+
+    assert (await provider.execute({"text": "SELECT 1 AS one"})).data == [{"one": 1}]
+    await provider.close()
+    assert provider._shared_connection is None
+
+
+@pytest.mark.asyncio
+async def test_columnar_and_arrow_results(tmp_path: Path) -> None:
+    provider = _build_provider(f"sqlite+aiosqlite:///{(tmp_path / 'columns.db').as_posix()}")
+    statement = "SELECT 1 AS a, 'x' AS b UNION ALL SELECT 2, 'y'"
+
+    columnar = await provider.execute({"text": statement, "columnar": True})
+    empty = await provider.execute({"text": "SELECT 1 AS a WHERE 0", "columnar": True})
+
+    assert columnar.columnar is True
+    assert columnar.data == {"a": [1, 2], "b": ["x", "y"]}
+    assert empty.data == {"a": []}
+
+    if importlib.util.find_spec("pyarrow") is not None:
+        arrow = await provider.execute({"text": statement, "format": "arrow"})
+        assert arrow.columnar is True
+        assert arrow.data.to_pylist() == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_queue_pool_defaults_and_prefill(tmp_path: Path) -> None:
+    provider = _build_provider(
+        f"sqlite+aiosqlite:///{(tmp_path / 'pool_defaults.db').as_posix()}",
+        options={"min_pool_size": 3, "pool_size": 4},
+    )
+
+    engine = await provider._get_engine()
+
+    assert engine.pool.size() == 4
+    assert engine.pool._max_overflow == 30
+    assert engine.pool.checkedin() == 3
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_static_pool_dialect_skips_queue_pool_defaults() -> None:
+    provider = _build_provider("sqlite+aiosqlite://")
+
+    assert (await provider.execute({"text": "SELECT 1 AS one"})).data == [{"one": 1}]
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_parameter_list_runs_executemany(tmp_path: Path) -> None:
+    provider = _build_provider(f"sqlite+aiosqlite:///{(tmp_path / 'many.db').as_posix()}")
+    await provider.execute({"text": "CREATE TABLE items (x INTEGER)"})
+
+    result = await provider.execute(
+        {"text": "INSERT INTO items VALUES (:x)", "parameters": [{"x": 1}, {"x": 2}, {"x": 3}]}
+    )
+    single = await provider.execute(
+        {"text": "INSERT INTO items VALUES (:x)", "parameters": {"x": 4}}
+    )
+    stored = await provider.execute({"text": "SELECT x FROM items ORDER BY x"})
+
+    assert result.data == []
+    assert result.metadata["rowcount"] == 3
+    assert single.metadata["rowcount"] == 1
+    assert stored.data == [{"x": 1}, {"x": 2}, {"x": 3}, {"x": 4}]
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_commits_and_sums_rowcount(tmp_path: Path) -> None:
+    provider = _build_provider(f"sqlite+aiosqlite:///{(tmp_path / 'batch.db').as_posix()}")
+    await provider.execute({"text": "CREATE TABLE items (x INTEGER)"})
+
+    result = await provider.execute_batch(
+        "INSERT INTO items VALUES (:x)", [{"x": 1}, {"x": 2}, {"x": 3}]
+    )
+    empty = await provider.execute_batch("INSERT INTO items VALUES (:x)", [])
+    count = await provider.execute({"text": "SELECT COUNT(*) AS n FROM items"})
+
+    assert result.metadata["rowcount"] == 3
+    assert empty.metadata["rowcount"] == 0
+    assert count.data == [{"n": 3}]
+    await provider.close()
+
+
+class _FakeRecord(tuple):
+    """Mimics asyncpg.Record: iterates over values and exposes column names."""
+
+    columns: tuple[str, ...] = ()
+
+    def keys(self) -> tuple[str, ...]:
+        return self.columns
+
+
+class _FakeAsyncpgConnection:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+        self.timeouts: list[Any] = []
+        self.columns: tuple[str, ...] = ()
+        self.records: list[tuple[Any, ...]] = []
+
+    async def fetch(self, statement: str, *args: Any, timeout: Any = None) -> list[_FakeRecord]:
+        self.calls.append((statement, args))
+        self.timeouts.append(timeout)
+        record_type = type("Record", (_FakeRecord,), {"columns": self.columns})
+        return [record_type(record) for record in self.records]
+
+    async def executemany(self, statement: str, args: Any, timeout: Any = None) -> None:
+        self.calls.append((statement, args))
+
+
+class _FakeAsyncpgPool:
+    def __init__(self, connection: _FakeAsyncpgConnection) -> None:
+        self.connection = connection
+        self.closed = False
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        yield self.connection
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def asyncpg_stub(monkeypatch) -> SimpleNamespace:
+    connection = _FakeAsyncpgConnection()
+    pool = _FakeAsyncpgPool(connection)
+    created: list[tuple[Any, ...]] = []
+
+    async def create_pool(*args: Any, **kwargs: Any) -> _FakeAsyncpgPool:
+        created.append((args, kwargs))
+        return pool
+
+    module = SimpleNamespace(
+        create_pool=create_pool,
+        PostgresError=type("PostgresError", (Exception,), {}),
+        InterfaceError=type("InterfaceError", (Exception,), {}),
+    )
+    monkeypatch.setitem(sys.modules, "asyncpg", module)
+    return SimpleNamespace(connection=connection, pool=pool, created=created)
+
+
+def test_named_parameters_rewritten_for_asyncpg() -> None:
+    statement, names = sql_module._to_asyncpg(
+        r"SELECT :a\:\:int, '12:30' FROM t WHERE b = :b AND c = :a"
+    )
+
+    assert statement == "SELECT $1::int, '12:30' FROM t WHERE b = $2 AND c = $1"
+    assert names == ("a", "b")
+
+
+@pytest.mark.asyncio
+async def test_raw_asyncpg_select_and_dml(asyncpg_stub: SimpleNamespace) -> None:
+    provider = _build_provider(
+        "postgresql+asyncpg://user@db/reports", raw_driver="asyncpg", options={"pool_size": 8}
+    )
+    connection = asyncpg_stub.connection
+    connection.columns = ("id", "name")
+    connection.records = [(1, "a"), (2, "b")]
+
+    result = await provider.execute(
+        {
+            "text": "SELECT id, name FROM t WHERE id > :low AND id < :high",
+            "parameters": {"high": 9, "low": 0},
+        }
+    )
+    columnar = await provider.execute({"text": "SELECT id, name FROM t", "columnar": True})
+    connection.records = []
+    update = await provider.execute(
+        {"text": "UPDATE t SET name = :name", "parameters": {"name": "c"}, "timeout_seconds": 5}
+    )
+    await provider.close()
+
+    ((args, kwargs),) = asyncpg_stub.created
+    assert args == ("postgresql://user@db/reports",)
+    assert kwargs["max_size"] == 8 and kwargs["min_size"] == 5
+    assert kwargs["statement_cache_size"] == 1024
+    assert connection.calls[0] == ("SELECT id, name FROM t WHERE id > $1 AND id < $2", (0, 9))
+    assert result.data == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    assert columnar.data == {"id": [1, 2], "name": ["a", "b"]}
+    assert update.data == [] and update.metadata["rowcount"] == 0
+    assert connection.calls[-1] == ("UPDATE t SET name = $1", ("c",))
+    assert connection.timeouts[-1] == 5
+    assert asyncpg_stub.pool.closed
+
+
+@pytest.mark.asyncio
+async def test_raw_asyncpg_passes_connect_options_through(asyncpg_stub: SimpleNamespace) -> None:
+    provider = _build_provider(
+        "postgresql://db/reports",
+        raw_driver="asyncpg",
+        options={
+            "sslmode": "verify-full",
+            "command_timeout": 15,
+            "application_name": "queryhub",
+            "server_settings": {"search_path": "reports"},
+            "pool_recycle": 60,
+            "min_pool_size": 2,
+        },
+    )
+
+    await provider.execute({"text": "SELECT 1"})
+    await provider.close()
+
+    ((_, kwargs),) = asyncpg_stub.created
+    assert kwargs["ssl"] == "verify-full"
+    assert kwargs["command_timeout"] == 15
+    assert kwargs["server_settings"] == {"search_path": "reports", "application_name": "queryhub"}
+    assert kwargs["min_size"] == 2
+    assert "pool_recycle" not in kwargs and "sslmode" not in kwargs
+
+
+@pytest.mark.asyncio
+async def test_raw_asyncpg_batch_uses_executemany(asyncpg_stub: SimpleNamespace) -> None:
+    provider = _build_provider("postgresql://db/reports", raw_driver="asyncpg")
+
+    result = await provider.execute_batch("INSERT INTO t VALUES (:x)", [{"x": 1}, {"x": 2}])
+
+    assert asyncpg_stub.connection.calls == [("INSERT INTO t VALUES ($1)", [(1,), (2,)])]
+    assert result.metadata["rowcount"] == -1
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_raw_asyncpg_requires_asyncpg(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "asyncpg", None)
+    provider = _build_provider("postgresql://db/reports", raw_driver="asyncpg")
+
+    with pytest.raises(ProviderInitializationError, match="asyncpg"):
+        await provider.execute({"text": "SELECT 1"})